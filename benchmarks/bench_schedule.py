@@ -0,0 +1,61 @@
+"""Per-tick cost of the schedule check on compiled records.
+
+Usage: python -m benchmarks.bench_schedule [count]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+from benchmarks.synthetic import make_notifications
+from services.scheduler import ScheduleRecord, Scheduler
+
+
+def legacy_is_due(notif, now):
+    """The pre-compiled check: re-parses the raw dict on every tick"""
+    if not notif.get("active", True):
+        return False
+    last_triggered_str = notif.get("last_triggered")
+    last_triggered = datetime.fromisoformat(last_triggered_str) if last_triggered_str else None
+    freq = notif.get("freq")
+    if freq == "once":
+        return now >= datetime.fromisoformat(notif.get("time")) and not last_triggered
+    if freq == "daily":
+        t = notif.get("time")
+        target = now.replace(hour=int(t[:2]), minute=int(t[3:]), second=0, microsecond=0)
+        return now >= target and (not last_triggered or last_triggered.date() < now.date())
+    if freq == "repeat":
+        last_event = last_triggered or datetime.fromisoformat(notif.get("created_at", now.isoformat()))
+        return now >= last_event + timedelta(minutes=int(notif.get("repeat_min", 1)))
+    return False
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count=100_000):
+    now = datetime.now()
+    notifications = make_notifications(count, now)
+
+    compile_s, records = timed(lambda: [ScheduleRecord.compile(n, now) for n in notifications])
+    legacy_s, _ = timed(lambda: [legacy_is_due(n, now) for n in notifications])
+    sweep_s, _ = timed(lambda: [r.is_due(now) for r in records])
+
+    scheduler = Scheduler()
+    rebuild_s, _ = timed(lambda: scheduler.rebuild(notifications, now))
+    # Drain everything already overdue so the measured tick is an idle one
+    scheduler.collect_due(now)
+    tick_s, _ = timed(lambda: scheduler.collect_due(now))
+
+    per_item = lambda seconds: seconds / count * 1e6
+    print(f"notifications:            {count}")
+    print(f"compile records:          {per_item(compile_s):8.3f} us/item")
+    print(f"legacy dict check:        {per_item(legacy_s):8.3f} us/item per tick")
+    print(f"compiled record sweep:    {per_item(sweep_s):8.3f} us/item per tick")
+    print(f"scheduler rebuild:        {per_item(rebuild_s):8.3f} us/item")
+    print(f"idle heap tick:           {tick_s * 1e6:8.3f} us total")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,273 @@
+"""Global hotkey latency and the cost of typing elsewhere.
+
+Registers a shortcut through services/hotkeys.py and drives it with
+synthetic input: XTest on X11, keybd_event on Windows, the keyboard
+library's own injection for the keyboard backend.
+- latency: synthetic press of the shortcut -> `activated` handled on the
+  GUI thread; with --dialog, through MainWindow.add_notification until the
+  dialog's title field has the keyboard focus (the pre-built dialog, or a
+  new one per press with --cold, as before it was reused);
+- typing overhead: CPU time this process spends while --keys right-Shift
+  taps are typed, minus the same run with no hotkey registered, per key.
+  A native backend is not woken up by them at all; its Python callbacks
+  are counted as well.
+
+Usage:
+    python -m benchmarks.hotkey [--backend x11|windows|keyboard] [--shortcut Ctrl+Shift+F12]
+                                [--presses 50] [--keys 2000] [--budget-ms MS] [--dialog [--cold]] [--load N]
+    xvfb-run -a python -m benchmarks.hotkey          (X11 path on a headless machine; needs libXtst)
+
+--load N keeps N busy processes spinning while the presses are timed, for
+a workstation under load. The budget defaults to DEFAULT_BUDGET_MS for the
+handler and DIALOG_BUDGET_MS for the focused dialog.
+
+The shortcut and the Shift taps go to whatever has the keyboard focus, so
+run it headless or with focus on a scratch window. Exits with status 1
+when the median latency is over the budget, or when a native backend ran
+Python for keys that were not its shortcut.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+from services.hotkeys import BACKENDS, default_backends, load_xlib, parse_shortcut
+
+DEFAULT_BUDGET_MS = 50
+# Press to a focused title field; about where a response stops feeling instant
+DIALOG_BUDGET_MS = 100
+DEFAULT_SHORTCUT = "Ctrl+Shift+F12"
+# Typed while measuring the overhead: harmless in whatever has the focus
+FILLER = {"x11": "Shift_R", "windows": 0xA1, "keyboard": "right shift"}
+
+
+class X11Typist:
+    """Synthetic keys through XTest, on a display connection of its own"""
+    MODIFIERS = {"ctrl": "Control_L", "shift": "Shift_L", "alt": "Alt_L", "meta": "Super_L"}
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        from services.hotkeys import X11Hotkey
+        path = ctypes.util.find_library("Xtst")
+        if not path or load_xlib() is None:
+            raise RuntimeError("XTest (libXtst) and libX11 are needed for the X11 measurement")
+        self.xlib = load_xlib()
+        self.xtst = ctypes.CDLL(path)
+        self.xtst.XTestFakeKeyEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+        self.display = self.xlib.XOpenDisplay(None)
+        if not self.display:
+            raise RuntimeError("Cannot open the X display")
+        self._keysym = lambda key: X11Hotkey.keysym(self.xlib, key)
+
+    def _code(self, name):
+        keysym = self.xlib.XStringToKeysym(name.encode("ascii")) if len(name) > 1 else 0
+        return self.xlib.XKeysymToKeycode(self.display, keysym or self._keysym(name))
+
+    def _keys(self, codes, press):
+        for code in codes:
+            self.xtst.XTestFakeKeyEvent(self.display, code, press, 0)
+
+    def chord(self, mods, key):
+        codes = [self._code(self.MODIFIERS[mod]) for mod in sorted(mods)] + [self._code(key)]
+        self._keys(codes, True)
+        self._keys(reversed(codes), False)
+        self.xlib.XFlush(self.display)
+
+    def tap(self, name):
+        self._keys([self._code(name)], True)
+        self._keys([self._code(name)], False)
+        self.xlib.XFlush(self.display)
+
+
+class WindowsTypist:
+    MODIFIERS = {"ctrl": 0x11, "shift": 0x10, "alt": 0x12, "meta": 0x5B}
+    KEYEVENTF_KEYUP = 0x2
+
+    def __init__(self):
+        import ctypes
+        self.user32 = ctypes.windll.user32
+
+    def _keys(self, codes, press):
+        for code in codes:
+            self.user32.keybd_event(code, 0, 0 if press else self.KEYEVENTF_KEYUP, 0)
+
+    def chord(self, mods, key):
+        from services.hotkeys import WindowsHotkey
+        codes = [self.MODIFIERS[mod] for mod in sorted(mods)] + [WindowsHotkey.virtual_key(key)]
+        self._keys(codes, True)
+        self._keys(reversed(codes), False)
+
+    def tap(self, code):
+        self._keys([code], True)
+        self._keys([code], False)
+
+
+class KeyboardTypist:
+    def __init__(self):
+        import keyboard
+        self.keyboard = keyboard
+
+    def chord(self, mods, key):
+        names = [{"meta": "windows"}.get(mod, mod) for mod in sorted(mods)] + [key.lower()]
+        self.keyboard.send("+".join(names))
+
+    def tap(self, name):
+        self.keyboard.send(name)
+
+
+TYPISTS = {"x11": X11Typist, "windows": WindowsTypist, "keyboard": KeyboardTypist}
+
+
+def run_events(ms):
+    """Let queued events (and any hotkey callbacks) run for `ms`"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def measure_latency(hotkey, typist, shortcut, presses, on_activated=None):
+    """Milliseconds from each synthetic press to the handler on the GUI thread (misses are left out)"""
+    mods, key = parse_shortcut(shortcut)
+    samples = []
+    for _ in range(presses):
+        loop = QEventLoop()
+        handled = []
+
+        def done():
+            # on_activated returns when it was done, or None when it did not get there
+            stamp = on_activated() if on_activated is not None else time.perf_counter()
+            if stamp is not None:
+                handled.append(stamp)
+            loop.quit()
+
+        hotkey.activated.connect(done)
+        QTimer.singleShot(1000, loop.quit)
+        start = time.perf_counter()
+        typist.chord(mods, key)
+        loop.exec()
+        hotkey.activated.disconnect(done)
+        if handled:
+            samples.append((handled[0] - start) * 1000)
+        run_events(20)
+    return samples
+
+
+def typing_cpu(typist, filler, keys):
+    """CPU seconds used by this process while `keys` filler keys are typed and handled"""
+    cpu = time.process_time()
+    for _ in range(keys):
+        typist.tap(filler)
+    run_events(300)
+    return time.process_time() - cpu
+
+
+def open_dialog_timer(app, window, cold):
+    """on_activated for --dialog: the app's own path, until the title field has the focus"""
+    def open_dialog():
+        if cold:
+            window.discard_add_dialog()
+        focused = []
+
+        def on_focus(_old, new):
+            if not focused and window.add_dialog is not None and new is window.add_dialog.title_input:
+                focused.append(time.perf_counter())
+                QTimer.singleShot(0, window.add_dialog.reject)
+
+        app.focusChanged.connect(on_focus)
+        # Never got the focus: give up on this press
+        timeout = QTimer()
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(lambda: window.add_dialog.reject())
+        timeout.start(2000)
+        window.add_notification() # returns once the dialog is closed
+        timeout.stop()
+        app.focusChanged.disconnect(on_focus)
+        return focused[0] if focused else None
+    return open_dialog
+
+
+def start_load(processes):
+    return [subprocess.Popen([sys.executable, "-c", "while True: pass"]) for _ in range(processes)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure global hotkey latency and typing overhead")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), help="default: the first one for this system")
+    parser.add_argument("--shortcut", default=DEFAULT_SHORTCUT)
+    parser.add_argument("--presses", type=int, default=50, help="Timed shortcut presses")
+    parser.add_argument("--keys", type=int, default=2000, help="Other keys typed for the overhead")
+    parser.add_argument("--budget-ms", type=float, help="Allowed median latency")
+    parser.add_argument("--dialog", action="store_true", help="Open the add dialog on each press")
+    parser.add_argument("--cold", action="store_true", help="With --dialog: build a new dialog for each press")
+    parser.add_argument("--load", type=int, default=0, help="Busy processes running while presses are timed")
+    args = parser.parse_args(argv)
+    budget_ms = args.budget_ms or (DIALOG_BUDGET_MS if args.dialog else DEFAULT_BUDGET_MS)
+
+    backend_class = BACKENDS[args.backend] if args.backend else default_backends()[0]
+    if args.dialog:
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication(sys.argv[:1])
+    else:
+        app = QCoreApplication(sys.argv[:1])
+    typist = TYPISTS[backend_class.name]()
+    filler = FILLER[backend_class.name]
+
+    typing_cpu(typist, filler, min(args.keys, 200)) # warm-up
+    baseline = typing_cpu(typist, filler, args.keys)
+
+    hotkey = backend_class()
+    if not hotkey.register(args.shortcut):
+        print(f"Could not register {args.shortcut} through {hotkey.name}")
+        return 1
+    try:
+        callbacks = hotkey.callbacks
+        loaded = typing_cpu(typist, filler, args.keys)
+        stray = hotkey.callbacks - callbacks
+
+        on_activated = None
+        if args.dialog:
+            from storage.settings_manager import SettingsManager
+            from ui.main_window import MainWindow
+            data_dir = tempfile.TemporaryDirectory(prefix="assistant-hotkey-")
+            window = MainWindow(SettingsManager(data_file=os.path.join(data_dir.name, "__user_data.txt")), tray=False)
+            if not args.cold:
+                window.prewarm_add_dialog()
+            on_activated = open_dialog_timer(app, window, args.cold)
+        load = start_load(args.load)
+        try:
+            samples = measure_latency(hotkey, typist, args.shortcut, args.presses, on_activated)
+        finally:
+            for process in load:
+                process.kill()
+    finally:
+        hotkey.unregister()
+
+    target = "focused title field" if args.dialog else "handler"
+    print(f"Backend {hotkey.name}, shortcut {args.shortcut}"
+          + (f", {'new' if args.cold else 'pre-built'} dialog" if args.dialog else "")
+          + (f", {args.load} busy processes" if args.load else ""))
+    if samples:
+        samples.sort()
+        median = statistics.median(samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"Press to {target}: median {median:.2f} ms, p95 {p95:.2f} ms, max {samples[-1]:.2f} ms "
+              f"({len(samples)}/{args.presses} presses seen, budget {budget_ms:.0f} ms)")
+    else:
+        median = float("inf")
+        print(f"Press to {target}: no activation in {args.presses} presses")
+    print(f"Typing elsewhere: {max(0.0, loaded - baseline) / args.keys * 1e6:.1f} µs CPU per key "
+          f"over the {baseline / args.keys * 1e6:.1f} µs it costs to inject one here")
+    if hotkey.name != "keyboard": # the library's hook runs outside our counter
+        print(f"Python callbacks for {args.keys} other keys: {stray}")
+    failed = median > budget_ms or (hotkey.name != "keyboard" and stray > 0)
+    if median > budget_ms:
+        print(f"OVER BUDGET by {median - budget_ms:.2f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""Benchmark suite for storage, scheduling, list rendering and popups.
+
+Generates synthetic __user_data.txt files of growing size in a temporary
+directory, times the core operations and writes the results as JSON. Qt
+benchmarks run under the offscreen platform and are reported as skipped
+when PyQt6 is not installed.
+
+Usage:
+    python -m benchmarks.run [--sizes 10,1000,100000] [--output results.json]
+                             [--baseline benchmarks/baseline.json] [--save-baseline | --no-baseline]
+                             [--tolerance 0.25] [--min-delta-ms 1]
+
+Exits with status 1 when a result is slower than the baseline by more
+than the tolerance. Timings only compare on the same machine, so no
+baseline is shipped: create one with --save-baseline before a change. A
+missing baseline is an error (status 2), since nothing would be checked;
+--no-baseline only measures.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.synthetic import make_notifications, write_user_data
+from services.replay import replay
+from services.scheduler import Scheduler
+from storage.settings_manager import SettingsManager
+
+DEFAULT_SIZES = [10, 1000, 100000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def measure(fn, repeat, setup=None):
+    """Run `fn` `repeat` times and return the median wall time in seconds"""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+class Suite:
+    def __init__(self, sizes, repeat, ui_limit, workdir):
+        self.sizes = sizes
+        self.repeat = repeat
+        self.ui_limit = ui_limit
+        self.workdir = workdir
+        self.results = {}
+        self.skipped = {}
+        self._app = None
+
+    def record(self, name, size, seconds):
+        self.results.setdefault(name, {})[str(size)] = seconds
+
+    def skip(self, name, reason):
+        self.skipped[name] = reason
+
+    def data_file(self, size):
+        path = os.path.join(self.workdir, f"__user_data_{size}.txt")
+        if not os.path.exists(path):
+            write_user_data(path, size)
+        return path
+
+    def new_notification(self):
+        now = datetime.now().isoformat()
+        return {
+            "title": "Benchmark", "content": "Benchmark", "type": "info", "icon": "DEFAULT",
+            "freq": "repeat", "time": "", "repeat_min": 30, "active": True,
+            "created_at": now, "updated_at": now, "last_triggered": None
+        }
+
+    # Storage
+    def bench_storage(self, size):
+        manager = SettingsManager(self.data_file(size))
+        repeat = self.repeat
+
+        self.record("settings.load_data", size, measure(manager._load_data, repeat))
+        self.record("settings.save_data", size, measure(manager.save_data, repeat))
+        self.record("settings.add_notification", size,
+                    measure(lambda: manager.add_notification(self.new_notification()), repeat))
+        notif_id = manager.get_notifications()[0]["id"]
+        self.record("settings.update_notification", size,
+                    measure(lambda: manager.update_notification(notif_id, self.new_notification()), repeat))
+        self.record("settings.remove_notification", size,
+                    measure(lambda: manager.remove_notification(manager.add_notification(self.new_notification())), repeat))
+
+        notif = manager.get_notifications()[0]
+        notif["last_triggered"] = datetime.now().isoformat()
+        self.record("settings.record_trigger", size,
+                    measure(lambda: manager.record_trigger(notif), repeat))
+
+    # Scheduling (Qt-free)
+    def bench_scheduler(self, size):
+        now = datetime.now()
+        notifications = make_notifications(size, now)
+        scheduler = Scheduler()
+        self.record("scheduler.rebuild", size,
+                    measure(lambda: scheduler.rebuild(notifications, now), self.repeat))
+        scheduler.collect_due(now)
+        self.record("scheduler.idle_tick", size,
+                    measure(lambda: scheduler.collect_due(now), self.repeat))
+        self.record("replay.7_days", size,
+                    measure(lambda: replay(notifications, now, timedelta(days=7)), 1))
+
+    # Qt
+    def qt_app(self):
+        if self._app is None:
+            from PyQt6.QtWidgets import QApplication
+            self._app = QApplication.instance() or QApplication(sys.argv[:1])
+        return self._app
+
+    def bench_service(self, size):
+        from services.notification_service import NotificationService
+        self.qt_app()
+        manager = SettingsManager(self.data_file(size))
+        # Nothing overdue, so the check measures the scheduling overhead, not popups
+        for notif in manager.get_notifications():
+            notif["active"] = False
+        service = NotificationService(manager)
+        self.record("service.check_notifications", size,
+                    measure(service.check_notifications, self.repeat))
+        service.timer.stop()
+
+    def bench_main_window(self, size):
+        if size > self.ui_limit:
+            self.skip(f"main_window.load_notification_list@{size}", f"above --ui-limit {self.ui_limit}")
+            return
+        from ui.main_window import MainWindow
+        self.qt_app()
+        manager = SettingsManager(self.data_file(size))
+        window = MainWindow(manager)
+        window.ensure_ui()
+        self.record("main_window.load_notification_list", size,
+                    measure(window.load_notification_list, self.repeat))
+        window.tray_icon.hide()
+        window.deleteLater()
+
+    def bench_popups(self):
+        from PyQt6.QtCore import QEventLoop, QTimer
+        from ui.popup_pool import PopupPool
+        from ui.popup_render import MODE_NONE, MODES, render_policy
+        app = self.qt_app()
+        frames = []
+        hook = lambda mode, frame_ms: frames.extend(frame_ms)
+        render_policy.add_frame_hook(hook)
+        try:
+            for mode in MODES:
+                render_policy.configure(mode)
+                pool = PopupPool()
+                pool._fill()
+
+                def show():
+                    popup = pool.acquire("Benchmark", "Reminder content " * 20, "info")
+                    popup.show_animated()
+                    app.processEvents()
+                    popup.close()
+                self.record(f"popup.show.{mode}", 1, measure(show, self.repeat))
+
+                if mode != MODE_NONE:
+                    # Frame intervals of one full show animation, through the frame hook
+                    frames.clear()
+                    popup = pool.acquire("Benchmark", "Reminder content " * 20, "info")
+                    loop = QEventLoop()
+                    popup.animation.finished.connect(loop.quit)
+                    QTimer.singleShot(5000, loop.quit)
+                    popup.show_animated()
+                    loop.exec()
+                    popup.close()
+                    if frames:
+                        p90 = sorted(frames)[int(len(frames) * 0.9)]
+                        self.record(f"popup.animation_frame_p90.{mode}", 1, p90 / 1000)
+                pool.clear()
+        finally:
+            render_policy.remove_frame_hook(hook)
+            render_policy.configure("auto")
+
+    def run(self):
+        try:
+            importlib.import_module("PyQt6.QtWidgets")
+            has_qt = True
+        except ImportError as e:
+            has_qt = False
+            self.skip("qt", f"PyQt6 not available: {e}")
+
+        for size in self.sizes:
+            print(f"size {size}...")
+            self.bench_storage(size)
+            self.bench_scheduler(size)
+            if has_qt:
+                self.bench_service(size)
+                self.bench_main_window(size)
+        if has_qt:
+            self.bench_popups()
+
+        return {
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sizes": self.sizes,
+                "repeat": self.repeat,
+            },
+            "results": self.results,
+            "skipped": self.skipped,
+        }
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """Return a list of (name, size, baseline_s, current_s) slower than the tolerance allows.
+
+    Differences below `min_delta` seconds are treated as timer noise.
+    """
+    regressions = []
+    for name, by_size in results.get("results", {}).items():
+        for size, current in by_size.items():
+            previous = baseline.get("results", {}).get(name, {}).get(size)
+            if previous and current > previous * (1 + tolerance) and current - previous > min_delta:
+                regressions.append((name, size, previous, current))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Assistant benchmark suite")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated notification counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median is kept)")
+    parser.add_argument("--ui-limit", type=int, default=10000,
+                        help="Skip list rendering above this many notifications")
+    parser.add_argument("--output", default="bench_output.json", help="Where to write the results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--no-baseline", action="store_true", help="Only measure, don't compare")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown relative to the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    with tempfile.TemporaryDirectory(prefix="assistant-bench-") as workdir:
+        results = Suite(sizes, args.repeat, args.ui_limit, workdir).run()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results written to {args.output}")
+
+    for name, by_size in sorted(results["results"].items()):
+        cells = ", ".join(f"{size}: {seconds * 1000:.3f} ms" for size, seconds in by_size.items())
+        print(f"  {name:<36} {cells}")
+    for name, reason in results["skipped"].items():
+        print(f"  skipped {name}: {reason}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if args.no_baseline:
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"NO BASELINE at {args.baseline}: nothing was checked for regressions. Run with --save-baseline "
+              f"on the code before your change, or pass --no-baseline to only measure.", file=sys.stderr)
+        return 2
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    unchecked = [f"{name}@{size}" for name, by_size in results["results"].items() for size in by_size
+                 if baseline.get("results", {}).get(name, {}).get(size) is None]
+    if unchecked:
+        print(f"WARNING: {len(unchecked)} results have no baseline value and were not checked: "
+              + ", ".join(unchecked[:10]) + (" ..." if len(unchecked) > 10 else ""))
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+    for name, size, previous, current in regressions:
+        print(f"REGRESSION {name}@{size}: {previous * 1000:.3f} ms -> {current * 1000:.3f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Start-up report and budget check for main.py.
+
+Launches main.py with ASSISTANT_STARTUP_PROBE set, so it prints "tray-ready"
+and its peak RSS, then quits, as soon as the event loop runs with the tray
+icon up. Each run uses a fresh temporary data directory, the offscreen
+platform and its own single-instance name. It also runs from a scratch
+working directory, so the repository's sample __user_data.txt is not
+migrated into it (its overdue reminders would fire during start-up); only
+ui/ is linked there, for the icons. One extra run under
+`python -X importtime` lists the slowest imports on the way to the tray.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--budget-ms 1500] [--top 20] [--tray]
+
+--tray measures the tray-only start used at login (main.py --tray).
+
+Exits with status 1 when the median launch-to-tray time is over the budget,
+or when a module meant to load on first use (DEFERRED) was imported before
+the tray was ready.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = 1500
+# Must not be imported before tray-ready
+DEFERRED = [
+    "keyboard",
+    "services.hotkeys",
+    "ui.add_notif_dialog",
+    "ui.notification_view",
+    "services.autostart_service",
+    "services.delivery",
+    "services.ingest_server",
+    "PyQt6.QtDBus",
+    "http.server",
+]
+# Also deferred when no window is shown
+DEFERRED_TRAY = ["ui.notification_list", "ui.styles"]
+
+
+def probe_env(data_dir):
+    env = dict(os.environ)
+    env.update({
+        "ASSISTANT_STARTUP_PROBE": "1",
+        "QT_QPA_PLATFORM": "offscreen",
+        "XDG_DATA_HOME": data_dir,
+        "APPDATA": data_dir,
+        "HOME": data_dir,
+        # Own single-instance name, so a running Assistant isn't asked to show itself
+        "USER": f"startup-probe-{os.getpid()}",
+        "USERNAME": f"startup-probe-{os.getpid()}",
+    })
+    return env
+
+
+def scratch_cwd(data_dir):
+    """Working directory with the app's icons (resolved against it) and no old data file"""
+    cwd = os.path.join(data_dir, "cwd")
+    os.mkdir(cwd)
+    try:
+        os.symlink(os.path.join(ROOT, "ui"), os.path.join(cwd, "ui"), target_is_directory=True)
+    except OSError: # e.g. Windows without the symlink privilege: start without icons
+        pass
+    return cwd
+
+
+def launch(python_args=(), app_args=()):
+    """Start main.py once; returns (ms until "tray-ready", peak RSS in KB or 0, stderr text)"""
+    with tempfile.TemporaryDirectory(prefix="assistant-startup-") as data_dir:
+        cwd = scratch_cwd(data_dir)
+        start = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, *python_args, os.path.join(ROOT, "main.py"), *app_args],
+                                cwd=cwd, env=probe_env(data_dir),
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        ready_ms = None
+        peak_kb = 0
+        for line in proc.stdout:
+            if line.startswith("tray-ready"):
+                ready_ms = (time.perf_counter() - start) * 1000
+                peak_kb = int(line.split()[1])
+                break
+        _, stderr = proc.communicate(timeout=60)
+    if ready_ms is None:
+        raise RuntimeError(f"main.py exited with {proc.returncode} before the tray was ready:\n{stderr}")
+    return ready_ms, peak_kb, stderr
+
+
+def parse_importtime(stderr):
+    """{module: (self µs, cumulative µs, depth)} from `-X importtime` output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Assistant start-up to tray-ready")
+    parser.add_argument("--runs", type=int, default=5, help="Timed launches (median is checked)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Allowed median launch-to-tray time")
+    parser.add_argument("--top", type=int, default=20, help="Slowest imports to list")
+    parser.add_argument("--tray", action="store_true", help="Tray-only start (no window)")
+    args = parser.parse_args(argv)
+    app_args = ["--tray"] if args.tray else []
+
+    _, _, stderr = launch(["-X", "importtime"], app_args)
+    modules = parse_importtime(stderr)
+    total_us = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+    print(f"Imported before tray-ready: {len(modules)} modules, {total_us / 1000:.1f} ms")
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us, depth) in slowest:
+        print(f"  {cumulative_us / 1000:8.1f} ms  (self {self_us / 1000:6.1f} ms)  {'  ' * depth}{name}")
+
+    eager = [name for name in DEFERRED + (DEFERRED_TRAY if args.tray else []) if name in modules]
+    for name in eager:
+        print(f"LOADED EAGERLY {name}")
+
+    runs = [launch(app_args=app_args) for _ in range(args.runs)]
+    samples = [ready_ms for ready_ms, _, _ in runs]
+    median = statistics.median(samples)
+    print(f"Launch to tray-ready: first {samples[0]:.0f} ms, median {median:.0f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+    peak_kb = max(peak for _, peak, _ in runs)
+    if peak_kb:
+        print(f"Peak RSS at tray-ready: {peak_kb / 1024:.1f} MB")
+    if median > args.budget_ms:
+        print(f"OVER BUDGET by {median - args.budget_ms:.0f} ms")
+    return 1 if eager or median > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+import json
+import random
+from datetime import datetime, timedelta
+
+TYPES = ["info", "warning", "important", "danger"]
+ICONS = ["DEFAULT", "📌", "⏰", "📅", "🔥", "💊"]
+
+
+def make_notifications(count, now=None, seed=2197):
+    """Generate `count` notification dicts in the __user_data.txt schema"""
+    rng = random.Random(seed)
+    now = now or datetime.now()
+    notifications = []
+    for i in range(count):
+        # Roughly the mix seen in real data files: mostly one-off and daily reminders
+        freq = rng.choices(["once", "daily", "repeat"], weights=[4, 4, 2])[0]
+        created_at = now - timedelta(minutes=rng.randint(1, 60 * 24 * 30))
+        if freq == "once":
+            time_val = (now + timedelta(minutes=rng.randint(-60 * 24, 60 * 24 * 7))).isoformat()
+        elif freq == "daily":
+            time_val = f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}"
+        else:
+            time_val = ""
+        last_triggered = None
+        if freq != "once" and rng.random() < 0.7:
+            last_triggered = (now - timedelta(minutes=rng.randint(0, 60 * 24))).isoformat()
+        notifications.append({
+            "title": f"Reminder #{i}",
+            "content": f"Synthetic reminder {i} for benchmarking",
+            "type": rng.choice(TYPES),
+            "icon": rng.choice(ICONS),
+            "freq": freq,
+            "time": time_val,
+            "repeat_min": rng.choice([20, 30, 45, 60, 90, 120, 240]),
+            "active": rng.random() < 0.9,
+            "created_at": created_at.isoformat(),
+            "updated_at": created_at.isoformat(),
+            "last_triggered": last_triggered,
+        })
+    return notifications
+
+
+def make_user_data(count, now=None, seed=2197):
+    return {
+        "notifications": make_notifications(count, now, seed),
+        "settings": {
+            "theme": "default",
+            "language": "en_US",
+            "autostart": False
+        }
+    }
+
+
+def write_user_data(path, count, now=None, seed=2197):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(make_user_data(count, now, seed), f, indent=4, ensure_ascii=False)
+    return path
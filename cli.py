@@ -0,0 +1,191 @@
+"""Command-line management of reminders, without Qt.
+
+    python -m cli list [--active] [--json]
+    python -m cli add "Title" [--content TEXT] [--type info] [--freq once] [--time ISO|HH:mm] [--repeat-min 30]
+    python -m cli add - < reminders.ndjson     (one JSON object per line, __user_data.txt fields)
+    python -m cli remove ID [ID ...]
+    python -m cli next [-n 10] [--json]
+    python -m cli export [FILE]
+
+Works on the same data as the app (or --data FILE). While the app (or the
+daemon) is running it holds the data in memory, so commands go to its store
+over the local socket instead of the file, and it saves and reschedules as
+usual; if it runs but its store can't be reached, the command is refused
+rather than edit a file the app would overwrite. Only storage/, the
+scheduler and services/store_client.py are imported, no Qt, so a command
+runs in tens of milliseconds.
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from storage.schema import FREQS, TYPES, normalize
+from storage.settings_manager import SettingsManager
+
+
+class LiveStore:
+    """The running app's store, with the part of the SettingsManager API the commands use"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get_notifications(self):
+        return self.client.call("snapshot")["notifications"]
+
+    def add_notifications(self, notifications):
+        return self.client.call("add_notifications", notifications)
+
+    def remove_notifications(self, notif_ids):
+        return [{"id": notif_id} for notif_id in self.client.call("remove_notifications", list(notif_ids))]
+
+    def next_due(self, limit=10):
+        return [(datetime.fromisoformat(due), notif) for due, notif in self.client.call("next_due", limit)]
+
+    def backup_data(self, file_path):
+        # Written by the app, which may run in another directory
+        self.client.call("backup_data", os.path.abspath(file_path))
+
+    def to_json(self):
+        return json.dumps(self.client.call("snapshot"), indent=4, ensure_ascii=False)
+
+    def close(self):
+        self.client.close()
+
+
+def open_store(data_file=None):
+    """The running app's store if it is up, else the data file; None if it runs but can't be reached"""
+    if data_file:
+        return SettingsManager(data_file=data_file)
+    from services.store_client import StoreClient, is_listening, server_name
+    if not is_listening(server_name()):
+        return SettingsManager()
+    try:
+        return LiveStore(StoreClient())
+    except OSError:
+        return None
+
+
+def _line(notif, due=None):
+    state = "on " if notif.get("active", True) else "off"
+    when = due.strftime("%Y-%m-%d %H:%M") if due else notif.get("time") or f"every {notif.get('repeat_min')} min"
+    return f"{notif['id']}  {state}  {notif.get('type', 'info'):<9}  {notif.get('freq', 'once'):<6}  {when:<16}  {notif['title']}"
+
+
+def cmd_list(store, args):
+    notifications = store.get_notifications()
+    if args.active:
+        notifications = [n for n in notifications if n.get("active", True)]
+    for notif in notifications:
+        print(json.dumps(notif, ensure_ascii=False) if args.json else _line(notif))
+    return 0
+
+
+def _read_ndjson(stream):
+    items, errors = [], 0
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            items.append(normalize(json.loads(line), "cli"))
+        except (ValueError, TypeError) as e:
+            print(f"line {number}: {e}", file=sys.stderr)
+            errors += 1
+    return items, errors
+
+
+def cmd_add(store, args):
+    if args.title == "-":
+        items, errors = _read_ndjson(sys.stdin)
+    else:
+        item = {"title": args.title, "content": args.content, "type": args.type, "freq": args.freq,
+                "time": args.time, "repeat_min": args.repeat_min}
+        try:
+            items, errors = [normalize(item, "cli")], 0
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+    for notif_id in store.add_notifications(items):
+        print(notif_id)
+    return 1 if errors else 0
+
+
+def cmd_remove(store, args):
+    removed = {n["id"] for n in store.remove_notifications(args.ids)}
+    for notif_id in args.ids:
+        if notif_id not in removed:
+            print(f"No reminder with id {notif_id}", file=sys.stderr)
+    return 0 if len(removed) == len(set(args.ids)) else 1
+
+
+def cmd_next(store, args):
+    for due, notif in store.next_due(limit=args.n):
+        if args.json:
+            print(json.dumps({"due": due.isoformat(), **notif}, ensure_ascii=False))
+        else:
+            print(_line(notif, due))
+    return 0
+
+
+def cmd_export(store, args):
+    if args.file:
+        store.backup_data(args.file)
+    else:
+        sys.stdout.write(store.to_json() + "\n")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Manage reminders without the GUI")
+    parser.add_argument("--data", help="data file (default: the running app's store, else its __user_data.txt)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="print all reminders")
+    list_parser.add_argument("--active", action="store_true", help="only active reminders")
+    list_parser.add_argument("--json", action="store_true", help="one JSON object per line")
+    list_parser.set_defaults(run=cmd_list)
+
+    add_parser = commands.add_parser("add", help="add a reminder, or NDJSON from stdin with '-'")
+    add_parser.add_argument("title")
+    add_parser.add_argument("--content", default="")
+    add_parser.add_argument("--type", choices=TYPES, default="info")
+    add_parser.add_argument("--freq", choices=FREQS, default="once")
+    add_parser.add_argument("--time", default="", help="ISO date-time (once, default now) or HH:mm (daily, required)")
+    add_parser.add_argument("--repeat-min", type=int, default=30)
+    add_parser.set_defaults(run=cmd_add)
+
+    remove_parser = commands.add_parser("remove", help="remove reminders by id")
+    remove_parser.add_argument("ids", nargs="+")
+    remove_parser.set_defaults(run=cmd_remove)
+
+    next_parser = commands.add_parser("next", help="print the next due reminders")
+    next_parser.add_argument("-n", type=int, default=10)
+    next_parser.add_argument("--json", action="store_true", help="one JSON object per line")
+    next_parser.set_defaults(run=cmd_next)
+
+    export_parser = commands.add_parser("export", help="write all data in the __user_data.txt format")
+    export_parser.add_argument("file", nargs="?", help="default: stdout")
+    export_parser.set_defaults(run=cmd_export)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    store = open_store(args.data)
+    if store is None:
+        print("Assistant is running but its store can't be reached; quit it (python main.py --quit) and retry",
+              file=sys.stderr)
+        return 1
+    try:
+        return args.run(store, args)
+    except BrokenPipeError: # e.g. piped into head
+        return 0
+    except (ConnectionError, RuntimeError) as e: # from the running app
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,98 @@
 import os
 import sys
 import ctypes
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from storage.settings_manager import SettingsManager
-from i18n.translator import translator
-from ui.main_window import MainWindow
-from services.notification_service import NotificationService
+from services.single_instance import InstanceServer, parse_intent, send_command
+
+# Work not needed for the tray icon (popup pre-build, global hotkey, add
+# dialog pre-build, ingest server) starts this long after the event loop is running
+STARTUP_DEFER_MS = 1000
+# At login, leave the disk and CPU to the rest of the session for longer
+AUTOSTART_DEFER_MS = 30000
+
+def set_background_mode(enabled):
+    """Windows: run with background CPU, disk and memory priority (only the current process may do this)"""
+    if os.name != 'nt':
+        return
+    PROCESS_MODE_BACKGROUND_BEGIN = 0x00100000
+    PROCESS_MODE_BACKGROUND_END = 0x00200000
+    try:
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetPriorityClass(kernel32.GetCurrentProcess(),
+                                  PROCESS_MODE_BACKGROUND_BEGIN if enabled else PROCESS_MODE_BACKGROUND_END)
+    except (AttributeError, OSError) as e:
+        print(f"Error changing process priority: {e}")
+
+def run_gui_client(add=False):
+    """Window process of the daemon mode: the list and settings over the daemon's store"""
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from i18n.translator import translator
+    from services.remote_store import RemoteStore
+    from ui.main_window import MainWindow
+
+    app = QApplication(sys.argv)
+    app.setApplicationName("Assistant")
+    store = RemoteStore()
+    if not store.connect_to_daemon():
+        print("No reminder daemon is running (start it with: python main.py --daemon)")
+        return 1
+    store.disconnected.connect(app.quit)
+    translator.set_language(store.get_setting("language", "vi_VN"))
+
+    # No tray or hotkey here: closing the window ends this process, the daemon keeps running and owns the hotkey
+    window = MainWindow(store, tray=False, hotkey=False)
+    def add_only():
+        window.add_notification()
+        if not window.isVisible():
+            app.quit()
+    def on_command(command):
+        if command == "show":
+            window.show_normal()
+        elif command == "add":
+            window.add_notification()
+    store.command_received.connect(on_command)
+    if add:
+        app.setQuitOnLastWindowClosed(False)
+        QTimer.singleShot(0, add_only)
+    else:
+        window.show_normal()
+        QTimer.singleShot(STARTUP_DEFER_MS, window.prewarm_add_dialog)
+    return app.exec()
 
 def main():
+    # Processes of the daemon mode (services/daemon.py)
+    if "--daemon" in sys.argv:
+        from services.daemon import main as daemon_main
+        sys.exit(daemon_main())
+    if "--gui" in sys.argv:
+        sys.exit(run_gui_client("--add" in sys.argv))
+    if "--popup-helper" in sys.argv:
+        from ui.popup_helper import main as popup_helper_main
+        sys.exit(popup_helper_main(sys.argv[sys.argv.index("--popup-helper") + 1:]))
+
+    # Another instance running: hand it our intent and exit before loading any widgets
+    intent = parse_intent(sys.argv[1:])
+    if send_command(intent):
+        return
+    # Nothing to quit; a "ping" (--tray, --autostart) that found no instance starts one
+    if intent == "quit":
+        return
+    autostart = "--autostart" in sys.argv
+    # Only the tray icon and the scheduler; the window is built when first opened
+    tray_only = autostart or "--tray" in sys.argv
+    defer_ms = AUTOSTART_DEFER_MS if autostart else STARTUP_DEFER_MS
+    if autostart:
+        set_background_mode(True)
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtGui import QIcon
+    from storage.settings_manager import SettingsManager
+    from i18n.translator import translator
+    from ui.main_window import MainWindow
+    from ui.popup_render import render_policy
+    from services.notification_service import NotificationService
+
     # Fix Taskbar Icon on Windows
     myappid = 'einvoice.warning.assistant.1.0'
     try:
@@ -19,6 +103,14 @@ def main():
 
     app = QApplication(sys.argv)
     app.setApplicationName("Assistant")
+    # Lives in the tray: closing a dialog or popup with the window hidden must not quit
+    app.setQuitOnLastWindowClosed(False)
+    
+    # Claim the single-instance name; lost a race with another launch: forward to it
+    instance_server = InstanceServer()
+    if not instance_server.listen():
+        send_command(intent)
+        return
     
     def resource_path(relative_path):
         if hasattr(sys, '_MEIPASS'):
@@ -29,23 +121,73 @@ def main():
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
-    # Initialize Storage
-    settings_manager = SettingsManager()
+    # Initialize Storage (saves are written by a background thread)
+    settings_manager = SettingsManager(write_behind=True)
+    app.aboutToQuit.connect(settings_manager.close)
+    
+    # The CLI changes reminders through this while the app holds them in memory
+    from services.remote_store import StoreServer
+    store_server = StoreServer(settings_manager, parent=app)
+    if store_server.listen():
+        app.aboutToQuit.connect(store_server.close)
+    else:
+        print(f"Could not listen on {store_server.name}: {store_server.server.errorString()}")
     
     # Initialize i18n
     lang = settings_manager.get_setting("language", "vi_VN")
     translator.set_language(lang)
     
+    # Popup rendering: "auto" drops the shadow effect when animations are too slow
+    render_policy.configure(settings_manager.get_setting("popup_render_mode", "auto"))
+    
     # Initialize Services
-    notif_service = NotificationService(settings_manager)
+    notif_service = NotificationService(settings_manager, prewarm_ms=defer_ms)
+    
+    # Optional local endpoint for warnings pushed by scripts
+    def start_ingest_server():
+        from services.ingest_server import start_configured
+        ingest_server = start_configured(settings_manager, notif_service, parent=app)
+        if ingest_server is not None:
+            app.aboutToQuit.connect(ingest_server.stop)
+    if settings_manager.get_setting("ingest", {}).get("enabled"):
+        QTimer.singleShot(defer_ms, start_ingest_server)
     
-    # Initialize UI
+    # Initialize UI (the list follows store changes itself, including triggers)
     window = MainWindow(settings_manager)
+    QTimer.singleShot(defer_ms, window.setup_global_shortcuts)
+    # Built together with the hotkey, so the first press only has to show it
+    QTimer.singleShot(defer_ms, window.prewarm_add_dialog)
     
-    # Connect service to UI if needed (e.g. to refresh list status)
-    notif_service.notification_triggered.connect(lambda _: window.load_notification_list())
+    # Commands forwarded by later launches
+    def on_command(command):
+        if command == "show":
+            window.show_normal()
+        elif command == "add":
+            window.add_notification()
+        elif command == "quit":
+            window.exit_app()
+    instance_server.command_received.connect(on_command)
+    app.aboutToQuit.connect(instance_server.close)
     
-    window.show()
+    if not tray_only:
+        window.show_normal()
+    if intent == "add":
+        window.add_notification()
+    if autostart:
+        QTimer.singleShot(defer_ms, lambda: set_background_mode(False))
+    if os.environ.get("ASSISTANT_STARTUP_PROBE"):
+        # benchmarks/startup.py: report once the event loop runs with the tray up, then quit
+        def report_ready():
+            try:
+                import resource
+                peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                if sys.platform == "darwin":
+                    peak_kb //= 1024 # bytes there
+            except ImportError: # Windows
+                peak_kb = 0
+            print(f"tray-ready {peak_kb}", flush=True)
+            app.quit()
+        QTimer.singleShot(0, report_ready)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -32,7 +32,7 @@ class AutostartService:
                 else:
                     script_path = os.path.abspath(sys.argv[0])
                 
-                winreg.SetValueEx(key, AutostartService.APP_NAME, 0, winreg.REG_SZ, f'"{script_path}"')
+                winreg.SetValueEx(key, AutostartService.APP_NAME, 0, winreg.REG_SZ, f'"{script_path}" --autostart')
             else:
                 try:
                     winreg.DeleteValue(key, AutostartService.APP_NAME)
@@ -77,6 +77,7 @@ class AutostartService:
     <key>ProgramArguments</key>
     <array>
         <string>{script_path}</string>
+        <string>--autostart</string>
     </array>
     <key>RunAtLoad</key>
     <true/>
@@ -96,6 +97,7 @@ class AutostartService:
     <array>
         <string>{python_path}</string>
         <string>{script_path}</string>
+        <string>--autostart</string>
     </array>
     <key>RunAtLoad</key>
     <true/>
@@ -0,0 +1,47 @@
+import time
+from datetime import datetime, timedelta
+
+
+class SystemClock:
+    """Real wall and monotonic time"""
+
+    def now(self):
+        return datetime.now()
+
+    def monotonic(self):
+        return time.monotonic()
+
+
+class VirtualClock:
+    """Manually advanced clock for simulations and headless replays.
+
+    Wall and monotonic time move together, so advancing it is never mistaken
+    for a sleep/resume; use `jump` to simulate one.
+    """
+
+    def __init__(self, start=None):
+        self._now = start or datetime.now()
+        self._monotonic = 0.0
+
+    def now(self):
+        return self._now
+
+    def monotonic(self):
+        return self._monotonic
+
+    def advance(self, delta):
+        if isinstance(delta, (int, float)):
+            delta = timedelta(seconds=delta)
+        self._now += delta
+        self._monotonic += delta.total_seconds()
+
+    def set(self, when):
+        """Move forward to `when`; moving backwards is ignored"""
+        if when > self._now:
+            self.advance(when - self._now)
+
+    def jump(self, delta):
+        """Move the wall clock only, as after a sleep or a manual clock change"""
+        if isinstance(delta, (int, float)):
+            delta = timedelta(seconds=delta)
+        self._now += delta
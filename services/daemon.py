@@ -0,0 +1,220 @@
+"""Headless reminder daemon: the store and the scheduler without any widget.
+
+    python main.py --daemon          (or python -m services.daemon)
+
+The daemon owns the SettingsManager and the NotificationService timer and
+imports only QtCore and QtNetwork (QtDBus too once a type is delivered over
+D-Bus). Everything with widgets runs in child processes that exist only
+while they are needed:
+- popups: a popup helper (ui/popup_helper.py), fed reminders on stdin and
+  closed LINGER_MS after its last popup is gone;
+- the window: a GUI client (main.py --gui) attached to the store over a
+  local socket (services/remote_store.py), started when the user opens it
+  and gone when the window is closed.
+The daemon claims the app's single-instance name, so `main.py` opens the
+window, `main.py --add` the add dialog and `main.py --quit` stops the
+daemon. A crash of a child leaves the reminders running. The global hotkey
+(services/hotkeys.py, QtCore only) is registered here, since the window
+process comes and goes: a press opens the add dialog in the attached GUI
+client, or starts one with --add.
+"""
+import json
+import os
+import signal
+import sys
+from PyQt6.QtCore import QCoreApplication, QObject, QProcess, QTimer
+from services.single_instance import InstanceServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child_command(*args):
+    """Program and arguments to start this app again with `args`"""
+    if getattr(sys, "frozen", False):
+        return sys.executable, list(args)
+    return sys.executable, [os.path.join(ROOT, "main.py"), *args]
+
+
+class PopupHelperProcess(QObject):
+    """Hands reminders to a popup helper process, started on demand; used as NotificationService popups"""
+    # Helper kept this long after its last popup, so bursts reuse one process
+    LINGER_MS = 30 * 1000
+    # On close, how long a helper gets to exit by itself before it is killed
+    CLOSE_TIMEOUT_MS = 2000
+
+    def __init__(self, settings_manager, parent=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self._process = None # the helper new reminders go to
+        self._running = [] # it and released helpers still showing popups
+        self._linger = QTimer(self)
+        self._linger.setSingleShot(True)
+        self._linger.timeout.connect(self._release)
+
+    def show(self, notif, missed=1, due=None):
+        if self._process is None:
+            self._start()
+        self._linger.stop()
+        message = {"notif": notif, "missed": missed, "due": due.isoformat() if due else None}
+        self._process.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        return True
+
+    def _start(self):
+        program, args = child_command("--popup-helper", "--language",
+                                      self.settings_manager.get_setting("language", "vi_VN"))
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
+        process.readyReadStandardOutput.connect(lambda: self._read(process))
+        process.finished.connect(lambda *_: self._finished(process))
+        process.start(program, args) # writes before it is up are buffered
+        self._process = process
+        self._running.append(process)
+
+    def _read(self, process):
+        while process.canReadLine():
+            line = bytes(process.readLine()).decode("utf-8", "replace").strip()
+            if line == "idle" and process is self._process:
+                self._linger.start(self.LINGER_MS)
+
+    def _release(self):
+        """Close the helper's stdin; it exits as soon as nothing is on screen"""
+        if self._process is not None:
+            self._process.closeWriteChannel()
+            self._process = None
+
+    def _finished(self, process):
+        if process is self._process:
+            print(f"Popup helper exited with {process.exitCode()}")
+            self._process = None
+        if process in self._running:
+            self._running.remove(process)
+        process.deleteLater()
+
+    def close(self):
+        """Stop every helper before quitting; a QProcess must not be destroyed while it runs"""
+        self._linger.stop()
+        self._release()
+        for process in self._running:
+            process.finished.disconnect()
+            if not process.waitForFinished(self.CLOSE_TIMEOUT_MS): # still showing popups
+                process.kill()
+                process.waitForFinished(self.CLOSE_TIMEOUT_MS)
+            process.deleteLater()
+        self._running = []
+
+
+class GuiLauncher(QObject):
+    """Starts the GUI client, or forwards the command to the one already attached"""
+
+    def __init__(self, store_server, parent=None):
+        super().__init__(parent)
+        self.store_server = store_server
+        self._process = None
+
+    def open(self, command="show"):
+        if self.store_server.send_command(command):
+            return
+        if self._process is not None:
+            return # Still starting; it opens the window itself
+        program, args = child_command("--gui", *(["--add"] if command == "add" else []))
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+        process.finished.connect(lambda *_: self._finished(process))
+        process.start(program, args)
+        self._process = process
+
+    def _finished(self, process):
+        if process.exitStatus() == QProcess.ExitStatus.CrashExit:
+            print("The window process crashed; reminders keep running")
+        if process is self._process:
+            self._process = None
+        process.deleteLater()
+
+
+class DaemonHotkey(QObject):
+    """The "shortcut" setting as a global hotkey that opens the add dialog through `gui`"""
+
+    def __init__(self, settings_manager, gui, parent=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self.gui = gui
+        self.hotkey = None
+
+    def register(self):
+        from services.hotkeys import create_hotkey
+        self.unregister()
+        shortcut_str = self.settings_manager.get_setting("shortcut", "Ctrl+Shift+A")
+        if not shortcut_str or shortcut_str.strip() == "":
+            return
+        self.hotkey = create_hotkey(shortcut_str, parent=self)
+        if self.hotkey is not None:
+            self.hotkey.activated.connect(lambda: self.gui.open("add"))
+
+    def unregister(self):
+        if self.hotkey is not None:
+            self.hotkey.unregister()
+            self.hotkey.deleteLater()
+            self.hotkey = None
+
+
+def main(argv=None):
+    from storage.settings_manager import SettingsManager
+    from i18n.translator import translator
+    from services.notification_service import NotificationService
+    from services.remote_store import StoreServer
+
+    app = QCoreApplication(sys.argv[:1] if argv is None else argv[:1])
+    app.setApplicationName("Assistant")
+
+    instance_server = InstanceServer()
+    if not instance_server.listen():
+        print("Assistant is already running")
+        return 1
+    app.aboutToQuit.connect(instance_server.close)
+
+    settings_manager = SettingsManager(write_behind=True)
+    app.aboutToQuit.connect(settings_manager.close)
+    translator.set_language(settings_manager.get_setting("language", "vi_VN"))
+
+    store_server = StoreServer(settings_manager, parent=app)
+    if not store_server.listen():
+        print(f"Could not listen on {store_server.name}: {store_server.server.errorString()}")
+        return 1
+    app.aboutToQuit.connect(store_server.close)
+
+    popups = PopupHelperProcess(settings_manager, parent=app)
+    app.aboutToQuit.connect(popups.close)
+    notif_service = NotificationService(settings_manager, popups=popups)
+
+    from services.ingest_server import start_configured
+    ingest_server = start_configured(settings_manager, notif_service, parent=app)
+    if ingest_server is not None:
+        app.aboutToQuit.connect(ingest_server.stop)
+
+    gui = GuiLauncher(store_server, parent=app)
+    def on_command(command):
+        if command in ("show", "add"):
+            gui.open(command)
+        elif command == "quit":
+            app.quit()
+    instance_server.command_received.connect(on_command)
+
+    # The GUI client only stores a new shortcut; registering it is done here
+    hotkey = DaemonHotkey(settings_manager, gui, parent=app)
+    store_server.setting_changed.connect(lambda key: hotkey.register() if key == "shortcut" else None)
+    app.aboutToQuit.connect(hotkey.unregister)
+    QTimer.singleShot(0, hotkey.register)
+
+    # Quit cleanly (flushing the store) on SIGTERM/SIGINT; the timer lets Python run the handler
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal_timer = QTimer(app)
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(500)
+
+    print(f"Reminder daemon running: {len(settings_manager.get_notifications())} reminders", flush=True)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
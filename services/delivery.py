@@ -0,0 +1,174 @@
+"""Reminder delivery through the desktop's notification server.
+
+DBusDelivery posts reminders to org.freedesktop.Notifications, so no Qt
+window is built, styled or animated in this process. NotificationService
+uses it for the types configured in the "delivery" setting, e.g.
+    "delivery": {"info": "dbus", "warning": "dbus"}
+and falls back to its own popup when the bus or the server is unavailable.
+
+Manual check against a private session bus with a stub server:
+    dbus-run-session -- sh -c 'python -m services.delivery stub-server & sleep 1; python -m services.delivery send "Title" "Body"'
+"""
+import sys
+from PyQt6.QtCore import QCoreApplication, QMetaType, QObject, QTimer, pyqtClassInfo, pyqtSignal, pyqtSlot
+
+try:
+    from PyQt6.QtDBus import QDBusArgument, QDBusConnection, QDBusMessage, QDBusPendingCallWatcher, QDBusPendingReply
+except ImportError: # QtDBus is only built on platforms with D-Bus
+    QDBusConnection = None
+
+SERVICE = "org.freedesktop.Notifications"
+PATH = "/org/freedesktop/Notifications"
+INTERFACE = "org.freedesktop.Notifications"
+
+BACKEND_POPUP = "popup"
+BACKEND_DBUS = "dbus"
+
+# Reminder type -> freedesktop urgency (0 low, 1 normal, 2 critical)
+URGENCY = {"danger": 2, "important": 1, "warning": 1, "info": 0}
+
+
+class DBusDelivery(QObject):
+    def __init__(self, app_name="Assistant", timeout_ms=10000, bus=None, parent=None):
+        """`bus` defaults to the session bus"""
+        super().__init__(parent)
+        self.app_name = app_name
+        self.timeout_ms = timeout_ms
+        if bus is None and QDBusConnection is not None:
+            bus = QDBusConnection.sessionBus()
+        self._bus = bus
+        self._server_ids = {} # notif id -> server notification id, so a re-trigger replaces it
+        self._notif_ids = {} # the reverse, for NotificationClosed
+        self._pending = {} # QDBusPendingCallWatcher -> (notif id, fallback)
+        if self._bus is not None and self._bus.isConnected():
+            self._bus.connect(SERVICE, PATH, INTERFACE, "NotificationClosed", self._on_closed)
+
+    def is_available(self):
+        # No isServiceRegistered() round trip per reminder: a missing (or not yet
+        # activated) server shows up as the call's error, which runs the fallback
+        return self._bus is not None and self._bus.isConnected()
+
+    def deliver(self, notif, missed=1, fallback=None):
+        """Post `notif` asynchronously; `fallback()` runs if the server can't be reached.
+
+        Returns False (without calling `fallback`) when there is no session bus.
+        """
+        if not self.is_available():
+            return False
+
+        body = notif.get("content", "")
+        if missed > 1:
+            from i18n.translator import translator
+            body = f"{translator.t('popup_missed_count').format(count=missed)}\n\n{body}"
+        icon = notif.get("icon")
+        summary = f"{icon} {notif['title']}" if icon and icon != "DEFAULT" else notif["title"]
+        urgency = URGENCY.get(notif.get("type"), 1)
+
+        message = QDBusMessage.createMethodCall(SERVICE, PATH, INTERFACE, "Notify")
+        message.setArguments([
+            self.app_name,
+            QDBusArgument(self._server_ids.get(notif.get("id"), 0), QMetaType.Type.UInt.value),
+            "",
+            summary,
+            body,
+            QDBusArgument([], QMetaType.Type.QStringList.value),
+            {"urgency": QDBusArgument(urgency, QMetaType.Type.UChar.value)},
+            0 if urgency == 2 else self.timeout_ms, # critical ones stay until dismissed
+        ])
+
+        # callWithCallback only takes pyqtSlot methods, not per-call closures; a watcher per call does
+        watcher = QDBusPendingCallWatcher(self._bus.asyncCall(message, 5000), self)
+        self._pending[watcher] = (notif.get("id"), fallback)
+        watcher.finished.connect(self._on_finished)
+        return True
+
+    def _on_finished(self, watcher):
+        notif_id, fallback = self._pending.pop(watcher, (None, None))
+        reply = QDBusPendingReply(watcher)
+        watcher.deleteLater()
+        if reply.isError():
+            print(f"D-Bus notification failed: {reply.error().message()}")
+            if fallback is not None:
+                fallback()
+            return
+        server_id = reply.argumentAt(0)
+        if notif_id is not None and server_id:
+            self._server_ids[notif_id] = server_id
+            self._notif_ids[server_id] = notif_id
+
+    @pyqtSlot("uint", "uint")
+    def _on_closed(self, server_id, reason):
+        """Dismissed or expired: the next trigger posts a new notification instead of replacing it"""
+        notif_id = self._notif_ids.pop(server_id, None)
+        if notif_id is not None and self._server_ids.get(notif_id) == server_id:
+            del self._server_ids[notif_id]
+
+
+@pyqtClassInfo("D-Bus Interface", INTERFACE)
+class StubNotificationServer(QObject):
+    """Minimal org.freedesktop.Notifications server that prints what it receives"""
+    NotificationClosed = pyqtSignal("uint", "uint")
+
+    def __init__(self):
+        super().__init__()
+        self._next_id = 0
+        self.received = [] # (replaces_id, summary, body, hints, expire_timeout) per Notify
+
+    @pyqtSlot(result="QStringList")
+    def GetCapabilities(self):
+        return ["body"]
+
+    @pyqtSlot(str, "uint", str, str, str, "QStringList", "QVariantMap", int, result="uint")
+    def Notify(self, app_name, replaces_id, app_icon, summary, body, actions, hints, expire_timeout):
+        if replaces_id:
+            notification_id = replaces_id
+        else:
+            self._next_id += 1
+            notification_id = self._next_id
+        self.received.append((replaces_id, summary, body, dict(hints), expire_timeout))
+        print(f"[{notification_id}] {app_name}: {summary} | {body} | hints={dict(hints)} timeout={expire_timeout}", flush=True)
+        return notification_id
+
+    @pyqtSlot("uint")
+    def CloseNotification(self, notification_id):
+        self.NotificationClosed.emit(notification_id, 3) # 3: closed by a CloseNotification call
+
+
+def register_stub(bus, server):
+    options = QDBusConnection.RegisterOption.ExportAllSlots | QDBusConnection.RegisterOption.ExportAllSignals
+    return bus.registerService(SERVICE) and bus.registerObject(PATH, server, options)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if QDBusConnection is None:
+        print("PyQt6.QtDBus is not available")
+        return 1
+    app = QCoreApplication(sys.argv[:1])
+
+    if argv and argv[0] == "stub-server":
+        bus = QDBusConnection.sessionBus()
+        server = StubNotificationServer()
+        if not register_stub(bus, server):
+            print(f"Could not register {SERVICE}: {bus.lastError().message()}")
+            return 1
+        print(f"Stub {SERVICE} listening", flush=True)
+        return app.exec()
+
+    if argv and argv[0] == "send" and len(argv) >= 2:
+        delivery = DBusDelivery()
+        notif = {"id": "cli", "title": argv[1], "content": argv[2] if len(argv) > 2 else "", "type": "info"}
+        failed = []
+        if not delivery.deliver(notif, fallback=lambda: failed.append(True)):
+            print("No D-Bus session bus")
+            return 1
+        QTimer.singleShot(1000, app.quit)
+        app.exec()
+        return 1 if failed else 0
+
+    print(__doc__)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""System-wide hotkey backends.
+
+A backend registers one shortcut (QKeySequence text such as "Ctrl+Shift+A")
+and emits `activated` on the GUI thread when it is pressed:
+- WindowsHotkey: RegisterHotKey; Windows posts WM_HOTKEY to our thread,
+  picked up by a Qt native event filter.
+- X11Hotkey: XGrabKey on the root window through libX11, on a display
+  connection of our own watched by a QSocketNotifier.
+- KeyboardHotkey: the `keyboard` library, kept as the fallback (macOS,
+  Wayland, or when the native registration fails). It hooks every key
+  system-wide and runs Python for each one; the native backends are only
+  woken up by the registered shortcut itself.
+
+    hotkey = create_hotkey("Ctrl+Shift+A", parent=window)
+    hotkey.activated.connect(window.add_notification)
+
+Only QtCore is imported here. benchmarks/hotkey.py measures the press to
+dialog latency and what typing elsewhere costs with each backend.
+"""
+import os
+import re
+import sys
+import time
+from PyQt6.QtCore import QAbstractNativeEventFilter, QCoreApplication, QObject, QSocketNotifier, pyqtSignal
+
+MODIFIERS = {"ctrl": "ctrl", "control": "ctrl", "shift": "shift", "alt": "alt",
+             "meta": "meta", "win": "meta", "windows": "meta", "super": "meta"}
+# QKeySequence key name -> (Windows virtual-key code, X11 keysym name)
+NAMED_KEYS = {
+    "space": (0x20, "space"), "tab": (0x09, "Tab"), "return": (0x0D, "Return"), "enter": (0x0D, "Return"),
+    "esc": (0x1B, "Escape"), "escape": (0x1B, "Escape"), "backspace": (0x08, "BackSpace"),
+    "ins": (0x2D, "Insert"), "insert": (0x2D, "Insert"), "del": (0x2E, "Delete"), "delete": (0x2E, "Delete"),
+    "home": (0x24, "Home"), "end": (0x23, "End"), "pgup": (0x21, "Prior"), "pgdown": (0x22, "Next"),
+    "left": (0x25, "Left"), "up": (0x26, "Up"), "right": (0x27, "Right"), "down": (0x28, "Down"),
+    "print": (0x2C, "Print"), "pause": (0x13, "Pause"),
+}
+
+
+def parse_shortcut(shortcut):
+    """("Ctrl+Shift+A") -> (frozenset({"ctrl", "shift"}), "A"); only the first chord of a sequence is used"""
+    text = (shortcut or "").split(", ")[0].strip()
+    parts = text.split("+")
+    if text == "+" or text.endswith("++"): # the "+" key itself, e.g. "Ctrl++"
+        parts = parts[:-2] + ["+"]
+    *names, key = parts
+    mods = set()
+    for name in names:
+        if name.strip().lower() not in MODIFIERS:
+            raise ValueError(f"unknown modifier {name!r} in {shortcut!r}")
+        mods.add(MODIFIERS[name.strip().lower()])
+    if key.strip():
+        key = key.strip()
+    if not key:
+        raise ValueError(f"no key in {shortcut!r}")
+    if len(key) > 1 and key.lower() not in NAMED_KEYS and not re.fullmatch(r"[Ff]([1-9]|1[0-9]|2[0-4])", key):
+        raise ValueError(f"unsupported key {key!r} in {shortcut!r}")
+    return frozenset(mods), key.upper() if len(key) == 1 else key
+
+
+class HotkeyBackend(QObject):
+    """One registered global shortcut"""
+    activated = pyqtSignal()
+    name = ""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.shortcut = None
+        # perf_counter() of the last activation, for latency measurements
+        self.activated_at = 0.0
+        # Times Python ran for a key event; stays at the number of activations for the native backends
+        self.callbacks = 0
+
+    def register(self, shortcut):
+        """Grab `shortcut`; False if the system refused it (e.g. taken by another app)"""
+        raise NotImplementedError
+
+    def unregister(self):
+        raise NotImplementedError
+
+    def _fire(self):
+        self.activated_at = time.perf_counter()
+        self.activated.emit()
+
+
+class _WindowsMessageFilter(QAbstractNativeEventFilter):
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+
+    def nativeEventFilter(self, event_type, message):
+        if bytes(event_type) == b"windows_generic_MSG":
+            from ctypes import wintypes
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WindowsHotkey.WM_HOTKEY and msg.wParam == self.backend.HOTKEY_ID:
+                self.backend.callbacks += 1
+                self.backend._fire()
+                return True, 0
+        return False, 0
+
+
+class WindowsHotkey(HotkeyBackend):
+    name = "windows"
+    WM_HOTKEY = 0x0312
+    HOTKEY_ID = 0xA551
+    MOD_FLAGS = {"alt": 0x1, "ctrl": 0x2, "shift": 0x4, "meta": 0x8}
+    MOD_NOREPEAT = 0x4000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter = None
+
+    @staticmethod
+    def virtual_key(key):
+        import ctypes
+        if len(key) == 1:
+            if key.isalnum() and key.isascii():
+                return ord(key)
+            scan = ctypes.windll.user32.VkKeyScanW(ord(key))
+            return None if scan == -1 else scan & 0xFF
+        if key.lower() in NAMED_KEYS:
+            return NAMED_KEYS[key.lower()][0]
+        return 0x70 + int(key[1:]) - 1 # F1..F24
+
+    def register(self, shortcut):
+        import ctypes
+        mods, key = parse_shortcut(shortcut)
+        vk = self.virtual_key(key)
+        if vk is None:
+            return False
+        flags = self.MOD_NOREPEAT
+        for mod in mods:
+            flags |= self.MOD_FLAGS[mod]
+        # No window: WM_HOTKEY goes to this thread's queue, which Qt's dispatcher shows to native filters
+        if not ctypes.windll.user32.RegisterHotKey(None, self.HOTKEY_ID, flags, vk):
+            return False
+        self._filter = _WindowsMessageFilter(self)
+        QCoreApplication.instance().installNativeEventFilter(self._filter)
+        self.shortcut = shortcut
+        return True
+
+    def unregister(self):
+        if self._filter is None:
+            return
+        import ctypes
+        ctypes.windll.user32.UnregisterHotKey(None, self.HOTKEY_ID)
+        QCoreApplication.instance().removeNativeEventFilter(self._filter)
+        self._filter = None
+        self.shortcut = None
+
+
+_xlib = None
+
+
+def load_xlib():
+    """libX11 through ctypes with the prototypes used here; None if it is not installed"""
+    global _xlib
+    if _xlib is None:
+        import ctypes
+        import ctypes.util
+        path = ctypes.util.find_library("X11")
+        if not path:
+            return None
+        lib = ctypes.CDLL(path)
+        c_display = ctypes.c_void_p
+        prototypes = {
+            "XOpenDisplay": (c_display, [ctypes.c_char_p]),
+            "XCloseDisplay": (ctypes.c_int, [c_display]),
+            "XDefaultRootWindow": (ctypes.c_ulong, [c_display]),
+            "XConnectionNumber": (ctypes.c_int, [c_display]),
+            "XStringToKeysym": (ctypes.c_ulong, [ctypes.c_char_p]),
+            "XKeysymToKeycode": (ctypes.c_ubyte, [c_display, ctypes.c_ulong]),
+            "XGrabKey": (ctypes.c_int, [c_display, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong,
+                                        ctypes.c_int, ctypes.c_int, ctypes.c_int]),
+            "XUngrabKey": (ctypes.c_int, [c_display, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong]),
+            "XSync": (ctypes.c_int, [c_display, ctypes.c_int]),
+            "XFlush": (ctypes.c_int, [c_display]),
+            "XPending": (ctypes.c_int, [c_display]),
+            "XNextEvent": (ctypes.c_int, [c_display, ctypes.c_void_p]),
+            "XSetErrorHandler": (ctypes.c_void_p, [ctypes.c_void_p]),
+            "XkbSetDetectableAutoRepeat": (ctypes.c_int, [c_display, ctypes.c_int, ctypes.c_void_p]),
+        }
+        for function, (restype, argtypes) in prototypes.items():
+            getattr(lib, function).restype = restype
+            getattr(lib, function).argtypes = argtypes
+        _xlib = lib
+    return _xlib
+
+
+def _x_structures():
+    import ctypes
+
+    class XKeyEvent(ctypes.Structure):
+        _fields_ = [("type", ctypes.c_int), ("serial", ctypes.c_ulong), ("send_event", ctypes.c_int),
+                    ("display", ctypes.c_void_p), ("window", ctypes.c_ulong), ("root", ctypes.c_ulong),
+                    ("subwindow", ctypes.c_ulong), ("time", ctypes.c_ulong),
+                    ("x", ctypes.c_int), ("y", ctypes.c_int), ("x_root", ctypes.c_int), ("y_root", ctypes.c_int),
+                    ("state", ctypes.c_uint), ("keycode", ctypes.c_uint), ("same_screen", ctypes.c_int)]
+
+    class XEvent(ctypes.Union):
+        _fields_ = [("type", ctypes.c_int), ("xkey", XKeyEvent), ("pad", ctypes.c_long * 24)]
+
+    error_handler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+    return XEvent, error_handler
+
+
+class X11Hotkey(HotkeyBackend):
+    name = "x11"
+    KEY_PRESS, KEY_RELEASE = 2, 3
+    MOD_MASKS = {"shift": 1 << 0, "ctrl": 1 << 2, "alt": 1 << 3, "meta": 1 << 6}
+    # Caps Lock and Num Lock must not stop the shortcut, so it is grabbed with each combination of them
+    LOCK_MASKS = (0, 1 << 1, 1 << 4, (1 << 1) | (1 << 4))
+    GRAB_MODE_ASYNC = 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._display = None
+        self._notifier = None
+        self._keycode = 0
+        self._mask = 0
+        self._down = False
+
+    @staticmethod
+    def keysym(xlib, key):
+        if len(key) == 1:
+            code = ord(key.lower())
+            return code if code < 0x100 else 0x01000000 | code # Latin-1 keysyms are the code points
+        name = NAMED_KEYS[key.lower()][1] if key.lower() in NAMED_KEYS else key.upper()
+        return xlib.XStringToKeysym(name.encode("ascii"))
+
+    def register(self, shortcut):
+        mods, key = parse_shortcut(shortcut)
+        xlib = load_xlib()
+        if xlib is None:
+            return False
+        display = xlib.XOpenDisplay(None)
+        if not display:
+            return False
+        keycode = xlib.XKeysymToKeycode(display, self.keysym(xlib, key))
+        if not keycode:
+            xlib.XCloseDisplay(display)
+            return False
+        mask = 0
+        for mod in mods:
+            mask |= self.MOD_MASKS[mod]
+
+        # A grab held by another client fails with BadAccess, reported asynchronously to the error handler
+        XEvent, error_handler = _x_structures()
+        errors = []
+        handler = error_handler(lambda _display, _event: errors.append(1) or 0)
+        previous = xlib.XSetErrorHandler(handler)
+        root = xlib.XDefaultRootWindow(display)
+        for lock in self.LOCK_MASKS:
+            xlib.XGrabKey(display, keycode, mask | lock, root, False, self.GRAB_MODE_ASYNC, self.GRAB_MODE_ASYNC)
+        xlib.XSync(display, False)
+        xlib.XSetErrorHandler(previous)
+        if errors:
+            xlib.XCloseDisplay(display)
+            return False
+
+        # Held keys repeat as presses only, so one long press is one activation
+        xlib.XkbSetDetectableAutoRepeat(display, True, None)
+        self._event = XEvent()
+        self._display, self._keycode, self._mask = display, keycode, mask
+        self._notifier = QSocketNotifier(xlib.XConnectionNumber(display), QSocketNotifier.Type.Read, self)
+        self._notifier.activated.connect(self._read_events)
+        self.shortcut = shortcut
+        return True
+
+    def _read_events(self):
+        import ctypes
+        xlib = load_xlib()
+        while xlib.XPending(self._display):
+            xlib.XNextEvent(self._display, ctypes.byref(self._event))
+            self.callbacks += 1
+            event = self._event.xkey
+            if event.keycode != self._keycode:
+                continue
+            if self._event.type == self.KEY_RELEASE:
+                self._down = False
+            elif self._event.type == self.KEY_PRESS and not self._down:
+                self._down = True
+                self._fire()
+
+    def unregister(self):
+        if self._display is None:
+            return
+        xlib = load_xlib()
+        self._notifier.setEnabled(False)
+        self._notifier.deleteLater()
+        root = xlib.XDefaultRootWindow(self._display)
+        for lock in self.LOCK_MASKS:
+            xlib.XUngrabKey(self._display, self._keycode, self._mask | lock, root)
+        xlib.XCloseDisplay(self._display)
+        self._display = self._notifier = None
+        self.shortcut = None
+
+
+class KeyboardHotkey(HotkeyBackend):
+    name = "keyboard"
+    KEY_NAMES = {"meta": "windows", "pgup": "page up", "pgdown": "page down", "del": "delete",
+                 "ins": "insert", "esc": "esc", "print": "print screen"}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._handle = None
+
+    def register(self, shortcut):
+        import keyboard
+        mods, key = parse_shortcut(shortcut)
+        names = [self.KEY_NAMES.get(mod, mod) for mod in ("ctrl", "shift", "alt", "meta") if mod in mods]
+        names.append(self.KEY_NAMES.get(key.lower(), key.lower()) if key != "+" else "plus")
+        # Called on the hook thread; the signal is queued to the GUI thread
+        self._handle = keyboard.add_hotkey("+".join(names), self._fire)
+        self.shortcut = shortcut
+        return True
+
+    def _fire(self):
+        self.callbacks += 1
+        super()._fire()
+
+    def unregister(self):
+        if self._handle is None:
+            return
+        import keyboard
+        try:
+            keyboard.remove_hotkey(self._handle)
+        except (KeyError, ValueError):
+            pass
+        self._handle = None
+        self.shortcut = None
+
+
+BACKENDS = {"windows": WindowsHotkey, "x11": X11Hotkey, "keyboard": KeyboardHotkey}
+
+
+def default_backends():
+    """Backends to try on this system, native first; ASSISTANT_HOTKEY_BACKEND picks one by name"""
+    forced = os.environ.get("ASSISTANT_HOTKEY_BACKEND")
+    if forced in BACKENDS:
+        return [BACKENDS[forced]]
+    if sys.platform == "win32":
+        return [WindowsHotkey, KeyboardHotkey]
+    # X11 grabs only see X clients under Wayland, so Wayland sessions keep the hook
+    if sys.platform.startswith("linux") and os.environ.get("DISPLAY") \
+            and os.environ.get("XDG_SESSION_TYPE") != "wayland":
+        return [X11Hotkey, KeyboardHotkey]
+    return [KeyboardHotkey]
+
+
+def create_hotkey(shortcut, parent=None, backends=None):
+    """Register `shortcut` with the first backend that accepts it; None if none did"""
+    try:
+        parse_shortcut(shortcut)
+    except ValueError as e:
+        print(f"Failed to set global hotkey '{shortcut}': {e}")
+        return None
+    for backend_class in backends or default_backends():
+        backend = backend_class(parent)
+        try:
+            if backend.register(shortcut):
+                return backend
+            print(f"Global hotkey '{shortcut}' not available through {backend.name}")
+        except Exception as e:
+            print(f"Failed to set global hotkey '{shortcut}' through {backend.name}: {e}")
+        backend.setParent(None)
+    return None
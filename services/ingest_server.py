@@ -0,0 +1,189 @@
+"""Local HTTP endpoint for raising warnings from scripts.
+
+POST http://127.0.0.1:<port>/notifications with one notification object or
+a list of them, in the __user_data.txt schema (only "title" is required):
+    curl -X POST -H "Content-Type: application/json" -H "X-Source: backup-job" \\
+         -d '{"title": "Backup failed", "type": "danger"}' http://127.0.0.1:47831/notifications
+
+Only application/json bodies are accepted and requests carrying an Origin
+header are refused, so a web page in the user's browser cannot post here
+(a cross-origin JSON POST needs a CORS preflight, which is never granted).
+
+Requests are handled on worker threads; each source (X-Source header, else
+the client address) has its own token bucket. Accepted items are queued and
+handed to the GUI thread in batches, one batch per event-loop turn.
+Answers 202 with {"accepted": n, "rejected": m, "errors": [...]}, or 429
+when the source is over its rate.
+"""
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PyQt6.QtCore import QObject, pyqtSignal
+from storage.schema import normalize
+
+DEFAULT_PORT = 47831
+MAX_BODY = 4 * 1024 * 1024
+# Rate-limit buckets kept at most; idle ones (already refilled) are dropped first
+MAX_SOURCES = 256
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def is_full(self, now):
+        """Refilled since last use, i.e. no different from a new bucket"""
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+    def take(self, count):
+        """Take up to `count` tokens; returns how many were granted"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        granted = min(count, int(self.tokens))
+        self.tokens -= granted
+        return granted
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive, so senders can reuse one connection
+
+    def do_POST(self):
+        ingest = self.server.ingest
+        self._body_read = False
+        if self.path.split("?", 1)[0].rstrip("/") != "/notifications":
+            return self._reply(404, {"error": "not found"})
+        if self.headers.get("Origin") is not None:
+            return self._reply(403, {"error": "browser requests are not accepted"})
+        if ingest.token and self.headers.get("Authorization") != f"Bearer {ingest.token}":
+            return self._reply(401, {"error": "bad token"})
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower()
+        if content_type != "application/json":
+            return self._reply(415, {"error": "Content-Type must be application/json"})
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self._reply(400, {"error": "bad Content-Length"})
+        if length > MAX_BODY:
+            return self._reply(413, {"error": "body too large"})
+        try:
+            body = self.rfile.read(length)
+            self._body_read = True
+            payload = json.loads(body or b"null")
+        except ValueError as e:
+            return self._reply(400, {"error": f"invalid JSON: {e}"})
+
+        items = payload if isinstance(payload, list) else [payload]
+        source = self.headers.get("X-Source") or self.client_address[0]
+        result = ingest.submit(source, items)
+        self._reply(429 if result["rejected"] and not result["accepted"] else 202, result)
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if not self._body_read:
+            # Turned away before its body was read: the connection can't carry another request
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass # One line per request would swamp the console at high rates
+
+
+class IngestServer(QObject):
+    """Localhost HTTP server on worker threads feeding `batch_ready` on the GUI thread"""
+    # Emitted (queued, on the receiver's thread) when the first item of a new batch arrives
+    batch_ready = pyqtSignal()
+
+    def __init__(self, port=DEFAULT_PORT, token="", rate=1000, burst=5000, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.token = token
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.ingest = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="IngestServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    # Worker threads
+    def submit(self, source, items):
+        errors = []
+        notifications = []
+        for position, item in enumerate(items):
+            try:
+                notifications.append(normalize(item, source))
+            except (ValueError, TypeError) as e:
+                errors.append({"index": position, "error": str(e)})
+
+        with self._lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                if len(self._buckets) >= MAX_SOURCES:
+                    self._prune_buckets()
+                bucket = self._buckets[source] = TokenBucket(self.rate, self.burst)
+            granted = bucket.take(len(notifications))
+            was_empty = not self._items
+            self._items.extend(notifications[:granted])
+        if granted and was_empty:
+            self.batch_ready.emit()
+        return {"accepted": granted, "rejected": len(notifications) - granted + len(errors), "errors": errors[:20]}
+
+    def _prune_buckets(self):
+        """Make room for a new source (called with the lock held)"""
+        now = time.monotonic()
+        for source in [s for s, bucket in self._buckets.items() if bucket.is_full(now)]:
+            del self._buckets[source]
+        if len(self._buckets) >= MAX_SOURCES:
+            del self._buckets[min(self._buckets, key=lambda s: self._buckets[s].updated)]
+
+    # GUI thread
+    def take_batch(self):
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+        return items
+
+
+def start_configured(settings_manager, notification_service, parent=None):
+    """Start the server if the "ingest" setting enables it; returns it, or None"""
+    ingest_settings = settings_manager.get_setting("ingest", {})
+    if not ingest_settings.get("enabled"):
+        return None
+    ingest_server = IngestServer(port=ingest_settings.get("port", DEFAULT_PORT),
+                                 token=ingest_settings.get("token", ""),
+                                 rate=ingest_settings.get("rate", 1000),
+                                 parent=parent)
+    ingest_server.batch_ready.connect(lambda: notification_service.ingest(ingest_server.take_batch()))
+    try:
+        ingest_server.start()
+    except OSError as e:
+        print(f"Error starting ingestion server: {e}")
+        return None
+    return ingest_server
@@ -1,78 +1,146 @@
-from datetime import datetime, timedelta
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from ui.notification_view import NotificationPopup
+import math
+from datetime import timedelta
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from services.clock import SystemClock
+from services.scheduler import Scheduler, ScheduleRecord
+from storage.backends import new_notification_id
 
 class NotificationService(QObject):
     notification_triggered = pyqtSignal(dict)
 
-    def __init__(self, settings_manager):
+    # Upper bound for a single sleep. The timer runs on a monotonic clock that
+    # stops during suspend (Linux, macOS), so this also bounds how late a
+    # reminder that fell due while the machine slept is caught up after resume
+    MAX_SLEEP_MS = 30 * 1000
+    # Timer lateness or wall/monotonic drift beyond this is treated as a sleep/resume
+    JUMP_THRESHOLD = timedelta(minutes=1)
+
+    def __init__(self, settings_manager, clock=None, prewarm_ms=0, popups=None):
         super().__init__()
         self.settings_manager = settings_manager
-        self.timer = QTimer()
+        # Injectable so schedules can be simulated on a VirtualClock
+        self.clock = clock or SystemClock()
+        # Native notifications for the types configured in the "delivery" setting
+        self._dbus = None
+        # Popups in this process, or whatever else `popups` delivers to (the
+        # daemon hands them to a helper process); see PopupQueue.show
+        if popups is None:
+            from ui.popup_queue import PopupQueue # widgets only load where popups are shown
+            popups = PopupQueue(self.clock, prewarm_ms)
+        self.popups = popups
+
+        # Wall-clock jump detection; the first check after startup always catches up
+        self._expected_wake = None
+        self._armed_wall = None
+        self._armed_mono = None
+        self._catch_up_pending = True
+        # Set while a batch is added: the listener schedules each item, ingest re-arms once
+        self._batching = False
+
+        self.scheduler = Scheduler()
+        self.scheduler.rebuild(self.settings_manager.get_notifications(), self.clock.now())
+        self.settings_manager.add_listener(self.on_notifications_changed)
+
+        # One single-shot timer armed for the earliest due notification
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.check_notifications)
-        self.timer.start(10000) # Check every 10 seconds
-        self.active_popups = []
+        self._rearm()
+
+    def on_notifications_changed(self, event, old, new):
+        if event == "triggered":
+            return # Fired by our own scheduler, already rescheduled
+        now = self.clock.now()
+        if event == "reset":
+            self.scheduler.rebuild(self.settings_manager.get_notifications(), now)
+        else:
+            if old is not None:
+                self.scheduler.unschedule(old)
+            if new is not None:
+                self.scheduler.schedule(new, now)
+        if not self._batching:
+            self._rearm()
+
+    def _rearm(self):
+        due = self.scheduler.next_due()
+        if due is None:
+            self.timer.stop()
+            self._expected_wake = None
+            return
+        now = self.clock.now()
+        delay_ms = min(max(math.ceil((due - now).total_seconds() * 1000), 0), self.MAX_SLEEP_MS)
+        self._expected_wake = now + timedelta(milliseconds=delay_ms)
+        self._armed_wall = now
+        self._armed_mono = self.clock.monotonic()
+        self.timer.start(delay_ms)
+
+    def _detect_clock_jump(self, now):
+        """True if the process slept or the wall clock moved since the timer was armed"""
+        if self._expected_wake is None:
+            return False
+        if now - self._expected_wake > self.JUMP_THRESHOLD:
+            return True
+        wall_elapsed = (now - self._armed_wall).total_seconds()
+        mono_elapsed = self.clock.monotonic() - self._armed_mono
+        return abs(wall_elapsed - mono_elapsed) > self.JUMP_THRESHOLD.total_seconds()
 
     def check_notifications(self):
-        now = datetime.now()
-        notifications = self.settings_manager.get_notifications()
-        modified = False
-
-        for i, notif in enumerate(notifications):
-            if not notif.get("active", True):
-                continue
-            
-            should_trigger = False
-            last_triggered_str = notif.get("last_triggered")
-            last_triggered = datetime.fromisoformat(last_triggered_str) if last_triggered_str else None
-            
-            freq = notif.get("freq")
-            
-            if freq == "once":
-                notif_time = datetime.fromisoformat(notif.get("time"))
-                if now >= notif_time and not last_triggered:
-                    should_trigger = True
-                    notif["active"] = False # Done
-            
-            elif freq == "daily":
-                notif_time_str = notif.get("time") # HH:mm
-                target_time = now.replace(hour=int(notif_time_str[:2]), minute=int(notif_time_str[3:]), second=0, microsecond=0)
-                
-                if now >= target_time:
-                    if not last_triggered or last_triggered.date() < now.date():
-                        should_trigger = True
-            
-            elif freq == "repeat":
-                repeat_min = int(notif.get("repeat_min", 1))
-                if not last_triggered:
-                    # First time: trigger if enough time passed since creation or logic below
-                    # Let's say we trigger after repeat_min from creation or start
-                    # To keep it simple: if not triggered yet, use creation_time
-                    last_event = datetime.fromisoformat(notif.get("created_at", now.isoformat()))
-                else:
-                    last_event = last_triggered
-                
-                if now >= last_event + timedelta(minutes=repeat_min):
-                    should_trigger = True
-
-            if should_trigger:
+        now = self.clock.now()
+        catch_up = self._catch_up_pending or self._detect_clock_jump(now)
+        self._catch_up_pending = False
+        # Firing writes last_triggered/active into the stored dicts, which the
+        # write-behind thread serialises under the store lock
+        with self.settings_manager.lock:
+            fired = self.scheduler.collect_due(now, catch_up=catch_up)
+
+        for event in fired:
+            if event.missed:
+                self.trigger(event.notif, event.missed, event.due)
+            # Appended to the trigger journal rather than rewriting the data file
+            self.settings_manager.record_trigger(event.notif)
+        self._rearm()
+
+    def delivery_backend(self, notif_type):
+        """"popup" or "dbus", from the per-type "delivery" setting"""
+        return self.settings_manager.get_setting("delivery", {}).get(notif_type, "popup")
+
+    def trigger(self, notif, missed=1, due=None):
+        """Deliver `notif` natively if configured, else through the popup queue"""
+        if self.delivery_backend(notif.get("type")) == "dbus":
+            if self._dbus is None:
+                from services.delivery import DBusDelivery # QtDBus only loads once configured
+                self._dbus = DBusDelivery(parent=self)
+            if self._dbus.deliver(notif, missed, fallback=lambda: self.show_popup(notif, missed, due)):
+                self.notification_triggered.emit(notif)
+                return
+        if self.show_popup(notif, missed, due):
+            self.notification_triggered.emit(notif)
+
+    def show_popup(self, notif, missed=1, due=None):
+        """Queue a popup for `notif`; False if it is already showing or waiting"""
+        return self.popups.show(notif, missed, due)
+
+    def ingest(self, notifications):
+        """A batch of notifications from the ingestion server.
+
+        Ones already due are shown right away without being stored; later or
+        recurring ones are added to the store and scheduled.
+        """
+        now = self.clock.now()
+        batch = []
+        for notif in notifications:
+            if notif["freq"] == "once" and ScheduleRecord.compile(notif, now).is_due(now):
+                notif["id"] = "ingest-" + new_notification_id()
                 self.trigger(notif)
-                notif["last_triggered"] = now.isoformat()
-                modified = True
-        
-        if modified:
-            self.settings_manager.save_data()
-
-    def trigger(self, notif):
-        # Clean up closed popups first
-        self.active_popups = [p for p in self.active_popups if p.isVisible()]
-        
-        # Check if a notification with the same title is already showing
-        for p in self.active_popups:
-            if p.windowTitle() == notif["title"]:
-                return # Don't trigger if already showing
-        
-        popup = NotificationPopup(notif["title"], notif["content"], notif["type"], notif.get("icon"), notif.get("color"))
-        popup.show_animated()
-        self.active_popups.append(popup)
-        self.notification_triggered.emit(notif)
+            else:
+                batch.append(notif)
+        if not batch:
+            return
+        # One backend write, and the timer re-armed once rather than per item
+        self._batching = True
+        try:
+            self.settings_manager.add_notifications(batch)
+        finally:
+            self._batching = False
+        self._rearm()
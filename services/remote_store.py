@@ -0,0 +1,264 @@
+"""A SettingsManager served over a local socket, for the daemon and its GUI client.
+
+The daemon (services/daemon.py) owns the store and runs a StoreServer; the
+GUI process uses a RemoteStore, which keeps a mirror of the data and offers
+the part of the SettingsManager API the window, the list model and
+StoreEvents use. Messages are JSON lines:
+    client -> server  {"call": n, "op": "add_notification", "args": [...]}
+    server -> client  {"reply": n, "result": ...} or {"reply": n, "error": "..."}
+    server -> client  {"event": "added", "old": ..., "new": ...}
+    server -> client  {"command": "show"}     (forwarded launches, see send_command)
+A store change is broadcast before the reply to the call that made it, so
+when a call returns the mirror already reflects it.
+
+Only QtCore and QtNetwork are imported here; services/store_client.py is
+a Qt-free client for the same protocol (used by the CLI).
+"""
+import json
+from datetime import datetime
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from services.store_client import store_server_name
+
+CALL_TIMEOUT_MS = 5000
+# SettingsManager methods a client may call
+OPS = ("snapshot", "add_notification", "add_notifications", "update_notification", "patch_notification",
+       "remove_notification", "remove_notifications", "set_setting", "import_data", "backup_data", "next_due")
+
+
+def _encode(message):
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class StoreServer(QObject):
+    """Serves `settings_manager` to RemoteStore clients and pushes its changes to them"""
+    # A client changed this setting (e.g. "shortcut" from the GUI client's settings page)
+    setting_changed = pyqtSignal(str)
+
+    def __init__(self, settings_manager, name=None, parent=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self.name = name or store_server_name()
+        self._clients = []
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+        settings_manager.add_listener(self._on_store_changed)
+
+    def listen(self):
+        # The daemon holds the single-instance name, so a leftover socket is stale
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.settings_manager.remove_listener(self._on_store_changed)
+        self.server.close()
+
+    def client_count(self):
+        return len(self._clients)
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self._clients.append(socket)
+            socket.readyRead.connect(lambda socket=socket: self._read(socket))
+            socket.disconnected.connect(lambda socket=socket: self._drop(socket))
+
+    def _drop(self, socket):
+        if socket in self._clients:
+            self._clients.remove(socket)
+        socket.deleteLater()
+
+    def _read(self, socket):
+        while socket.canReadLine():
+            try:
+                message = json.loads(bytes(socket.readLine()).decode("utf-8"))
+                call_id = message["call"]
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Bad store request: {e}")
+                continue
+            try:
+                reply = {"reply": call_id, "result": self._dispatch(message.get("op"), message.get("args", []))}
+            except Exception as e:
+                reply = {"reply": call_id, "error": f"{type(e).__name__}: {e}"}
+            socket.write(_encode(reply))
+
+    def _dispatch(self, op, args):
+        if op not in OPS:
+            raise ValueError(f"unknown op {op!r}")
+        store = self.settings_manager
+        if op == "snapshot":
+            return store.data
+        if op == "next_due":
+            limit = args[0] if args else 10
+            now = datetime.fromisoformat(args[1]) if len(args) > 1 and args[1] else None
+            return [[due.isoformat(), notif] for due, notif in store.next_due(limit, now)]
+        result = getattr(store, op)(*args)
+        if op == "set_setting":
+            self.setting_changed.emit(args[0])
+        if op == "remove_notifications":
+            return [n["id"] for n in result]
+        return result
+
+    def send_command(self, command):
+        """Pass "show" or "add" to the connected GUI clients; False if there are none"""
+        for socket in self._clients:
+            socket.write(_encode({"command": command}))
+        return bool(self._clients)
+
+    def _on_store_changed(self, event, old, new):
+        if not self._clients:
+            return
+        if event == "reset":
+            message = _encode({"event": "reset", "data": self.settings_manager.data})
+        else:
+            message = _encode({"event": event, "old": old, "new": new})
+        for socket in self._clients:
+            socket.write(message)
+
+
+class RemoteStore(QObject):
+    """Client-side stand-in for SettingsManager, mirroring the daemon's store"""
+    # The daemon went away
+    disconnected = pyqtSignal()
+    # "show" or "add", from a later launch forwarded by the daemon
+    command_received = pyqtSignal(str)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or store_server_name()
+        self.data = {"notifications": [], "settings": {}}
+        self._by_id = {}
+        self._listeners = []
+        self._replies = {}
+        self._next_call = 0
+        self.socket = QLocalSocket(self)
+        self.socket.readyRead.connect(self._read)
+        self.socket.disconnected.connect(self.disconnected)
+
+    def connect_to_daemon(self, timeout_ms=CALL_TIMEOUT_MS):
+        """Connect and fetch the data; False if no daemon is listening"""
+        self.socket.connectToServer(self.name)
+        if not self.socket.waitForConnected(timeout_ms):
+            return False
+        self._load(self._call("snapshot"))
+        return True
+
+    def close(self):
+        self.socket.disconnectFromServer()
+
+    def flush(self):
+        pass # The daemon persists
+
+    def _load(self, data):
+        self.data = data
+        self.data.setdefault("notifications", [])
+        self._by_id = {n["id"]: n for n in self.data["notifications"]}
+
+    def _call(self, op, *args):
+        self._next_call += 1
+        call_id = self._next_call
+        self.socket.write(_encode({"call": call_id, "op": op, "args": list(args)}))
+        # Events that arrive first are applied on the way (waitForReadyRead emits readyRead)
+        while call_id not in self._replies:
+            if self.socket.state() != QLocalSocket.LocalSocketState.ConnectedState:
+                raise ConnectionError("Lost the connection to the reminder daemon")
+            if not self.socket.waitForReadyRead(CALL_TIMEOUT_MS) and call_id not in self._replies:
+                raise TimeoutError(f"Reminder daemon did not answer {op}")
+        reply = self._replies.pop(call_id)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply.get("result")
+
+    def _read(self):
+        while self.socket.canReadLine():
+            message = json.loads(bytes(self.socket.readLine()).decode("utf-8"))
+            if "reply" in message:
+                self._replies[message["reply"]] = message
+            elif "command" in message:
+                # Not from inside a blocking _call: the handler may open a dialog
+                QTimer.singleShot(0, lambda command=message["command"]: self.command_received.emit(command))
+            else:
+                self._apply(message)
+
+    def _apply(self, message):
+        event, new = message["event"], message.get("new")
+        if event == "reset":
+            self._load(message["data"])
+            self._notify("reset", None, None)
+        elif event == "added":
+            self.data["notifications"].append(new)
+            self._by_id[new["id"]] = new
+            self._notify("added", None, new)
+        elif event == "removed":
+            old = self._by_id.pop(message["old"]["id"], None)
+            if old is not None:
+                self.data["notifications"].remove(old)
+                self._notify("removed", old, None)
+        else: # updated, triggered: keep the mirrored dict, and its list position, in place
+            notif = self._by_id.get(new["id"])
+            if notif is not None:
+                old = dict(notif)
+                notif.clear()
+                notif.update(new)
+                self._notify(event, old, notif)
+
+    # SettingsManager API
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, old, new):
+        for callback in list(self._listeners):
+            try:
+                callback(event, old, new)
+            except Exception as e:
+                print(f"Error in store listener: {e}")
+
+    def get_notifications(self):
+        return self.data.get("notifications", [])
+
+    def get_notification(self, notif_id):
+        return self._by_id.get(notif_id)
+
+    def next_due(self, limit=10, now=None):
+        pairs = self._call("next_due", limit, now.isoformat() if now else None)
+        return [(datetime.fromisoformat(due), notif) for due, notif in pairs]
+
+    def add_notification(self, notification):
+        return self._call("add_notification", notification)
+
+    def add_notifications(self, notifications):
+        return self._call("add_notifications", notifications)
+
+    def update_notification(self, notif_id, updated_notif):
+        self._call("update_notification", notif_id, updated_notif)
+
+    def patch_notification(self, notif_id, fields, op="patch"):
+        self._call("patch_notification", notif_id, fields, op)
+
+    def remove_notification(self, notif_id):
+        self._call("remove_notification", notif_id)
+
+    def remove_notifications(self, notif_ids):
+        # The removal events drop them from the mirror before the call returns
+        current = {i: self._by_id[i] for i in notif_ids if i in self._by_id}
+        removed = self._call("remove_notifications", list(notif_ids))
+        return [current[i] for i in removed if i in current]
+
+    def import_data(self, file_path):
+        self._call("import_data", file_path)
+
+    def backup_data(self, file_path):
+        self._call("backup_data", file_path)
+
+    def get_setting(self, key, default=None):
+        return self.data.get("settings", {}).get(key, default)
+
+    def set_setting(self, key, value):
+        self.data.setdefault("settings", {})[key] = value
+        self._call("set_setting", key, value)
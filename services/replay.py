@@ -0,0 +1,215 @@
+"""Headless schedule replay on a virtual clock.
+
+Fast-forwards the scheduling engine over a data file and records every
+trigger, without Qt, popups or writes to the file. `legacy_replay`
+runs the old 10-second polling check for comparison on small files.
+
+Usage:
+    python -m services.replay __user_data.txt --days 7 [--start ISO] [--compare] [--output triggers.json]
+"""
+import argparse
+import copy
+import gc
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from services.clock import VirtualClock
+from services.scheduler import Scheduler
+
+
+class Trigger:
+    __slots__ = ("time", "index", "missed")
+
+    def __init__(self, time, index, missed=1):
+        self.time = time
+        self.index = index
+        self.missed = missed
+
+    def to_dict(self, notifications):
+        return {
+            "time": self.time.isoformat(),
+            "index": self.index,
+            "title": notifications[self.index].get("title"),
+            "missed": self.missed,
+        }
+
+
+def load_notifications(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("notifications", [])
+
+
+def replay(notifications, start, duration, catch_up=True, use_heap=False):
+    """Simulate the scheduler from `start` for `duration` and return the list of Trigger.
+
+    The scheduler runs without write-back, so `notifications` is never
+    modified. The first check catches up on overdue items, as the service
+    does at startup.
+
+    With `use_heap` every occurrence goes through `Scheduler.collect_due` on a
+    VirtualClock, which is what the service does and what to benchmark. By
+    default, after the startup check each record is fast-forwarded on its own:
+    nothing changes a notification during a replay, so its occurrences don't
+    depend on the others and the global ordering only costs heap operations.
+    Triggers are then grouped per notification rather than sorted by time.
+    """
+    # Millions of small, acyclic Trigger objects: cyclic GC passes only cost time
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _replay(notifications, start, duration, catch_up, use_heap)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _replay(notifications, start, duration, catch_up, use_heap):
+    index_of = {id(n): i for i, n in enumerate(notifications)}
+    clock = VirtualClock(start)
+    end = start + duration
+
+    scheduler = Scheduler(write_back=False)
+    scheduler.rebuild(notifications, clock.now())
+
+    triggers = []
+    first = True
+    while True:
+        due = scheduler.next_due()
+        if due is None or due > end:
+            break
+        clock.set(due)
+        now = clock.now()
+        for event in scheduler.collect_due(now, catch_up=catch_up and first):
+            if event.missed:
+                triggers.append(Trigger(now, index_of[id(event.notif)], event.missed))
+        first = False
+        if not use_heap:
+            break
+
+    if not use_heap:
+        for record in scheduler.records():
+            index = index_of[id(record.notif)]
+            triggers.extend(Trigger(when, index) for when in record.occurrences(end))
+    return triggers
+
+
+def legacy_check(notifications, now):
+    """The original check_notifications logic; returns indexes of the notifications fired"""
+    fired = []
+    for i, notif in enumerate(notifications):
+        if not notif.get("active", True):
+            continue
+
+        should_trigger = False
+        last_triggered_str = notif.get("last_triggered")
+        last_triggered = datetime.fromisoformat(last_triggered_str) if last_triggered_str else None
+
+        freq = notif.get("freq")
+
+        if freq == "once":
+            notif_time = datetime.fromisoformat(notif.get("time"))
+            if now >= notif_time and not last_triggered:
+                should_trigger = True
+                notif["active"] = False # Done
+
+        elif freq == "daily":
+            notif_time_str = notif.get("time") # HH:mm
+            target_time = now.replace(hour=int(notif_time_str[:2]), minute=int(notif_time_str[3:]), second=0, microsecond=0)
+
+            if now >= target_time:
+                if not last_triggered or last_triggered.date() < now.date():
+                    should_trigger = True
+
+        elif freq == "repeat":
+            repeat_min = int(notif.get("repeat_min", 1))
+            if not last_triggered:
+                last_event = datetime.fromisoformat(notif.get("created_at", now.isoformat()))
+            else:
+                last_event = last_triggered
+
+            if now >= last_event + timedelta(minutes=repeat_min):
+                should_trigger = True
+
+        if should_trigger:
+            notif["last_triggered"] = now.isoformat()
+            fired.append(i)
+    return fired
+
+
+def legacy_replay(notifications, start, duration, tick=timedelta(seconds=10)):
+    """Replay the old polling loop; cost is O(ticks x notifications), keep inputs small"""
+    notifications = copy.deepcopy(notifications)
+    triggers = []
+    now = start
+    end = start + duration
+    while now <= end:
+        for index in legacy_check(notifications, now):
+            triggers.append(Trigger(now, index))
+        now += tick
+    return triggers
+
+
+def compare(new_triggers, legacy_triggers):
+    """Pair up fire times per notification and summarise how they differ"""
+    by_index = {}
+    for t in legacy_triggers:
+        by_index.setdefault(t.index, []).append(t.time)
+    new_by_index = {}
+    for t in new_triggers:
+        new_by_index.setdefault(t.index, []).append(t.time)
+
+    deltas = []
+    count_mismatch = []
+    for index in set(by_index) | set(new_by_index):
+        old_times = by_index.get(index, [])
+        new_times = new_by_index.get(index, [])
+        if len(old_times) != len(new_times):
+            count_mismatch.append(index)
+        deltas.extend((o - n).total_seconds() for o, n in zip(old_times, new_times))
+
+    return {
+        "legacy_triggers": len(legacy_triggers),
+        "triggers": len(new_triggers),
+        "count_mismatch": sorted(count_mismatch),
+        "max_legacy_lag_s": max(deltas) if deltas else 0.0,
+        "mean_legacy_lag_s": sum(deltas) / len(deltas) if deltas else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay notification schedules on a virtual clock")
+    parser.add_argument("data_file", help="Path to a __user_data.txt file (never modified)")
+    parser.add_argument("--days", type=float, default=1, help="Simulated duration in days")
+    parser.add_argument("--start", help="ISO start time, defaults to now")
+    parser.add_argument("--heap", action="store_true", help="Drive every occurrence through the scheduler heap")
+    parser.add_argument("--compare", action="store_true", help="Also run the legacy 10s polling check")
+    parser.add_argument("--output", help="Write every trigger to this JSON file")
+    args = parser.parse_args(argv)
+
+    notifications = load_notifications(args.data_file)
+    start = datetime.fromisoformat(args.start) if args.start else datetime.now()
+    duration = timedelta(days=args.days)
+
+    began = time.perf_counter()
+    triggers = replay(notifications, start, duration, use_heap=args.heap)
+    elapsed = time.perf_counter() - began
+    print(f"{len(notifications)} notifications, {args.days:g} simulated days: "
+          f"{len(triggers)} triggers in {elapsed:.2f}s")
+
+    if args.compare:
+        began = time.perf_counter()
+        legacy_triggers = legacy_replay(notifications, start, duration)
+        elapsed = time.perf_counter() - began
+        print(f"legacy polling replay: {len(legacy_triggers)} triggers in {elapsed:.2f}s")
+        print(json.dumps(compare(triggers, legacy_triggers), indent=4))
+
+    if args.output:
+        triggers.sort(key=lambda t: (t.time, t.index))
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([t.to_dict(notifications) for t in triggers], f, indent=4, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
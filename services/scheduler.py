@@ -0,0 +1,280 @@
+import heapq
+import itertools
+from datetime import datetime, timedelta, time
+from enum import Enum
+
+
+class Frequency(Enum):
+    ONCE = "once"
+    DAILY = "daily"
+    REPEAT = "repeat"
+
+
+class CatchUp(Enum):
+    """What to do with occurrences missed while the machine slept or the process was blocked"""
+    ONCE = "once"   # deliver a single occurrence
+    ALL = "all"     # deliver one event carrying the number of missed occurrences
+    SKIP = "skip"   # drop missed occurrences and wait for the next one
+
+
+class FireEvent:
+    """One delivery of a notification, possibly standing for several missed occurrences.
+
+    `missed` is 0 when the catch-up policy skipped the occurrences entirely.
+    """
+
+    __slots__ = ("notif", "due", "missed")
+
+    def __init__(self, notif, due, missed=1):
+        self.notif = notif
+        self.due = due
+        self.missed = missed
+
+
+class ScheduleRecord:
+    """Compiled, typed view of one stored notification dict.
+
+    All ISO timestamps and "HH:mm" strings are parsed once in `compile`; the
+    schedule check only reads these fields. A record is rebuilt whenever its
+    notification changes and kept in sync by `mark_triggered` when it fires.
+    """
+
+    __slots__ = ("notif", "freq", "active", "at", "daily_time", "interval",
+                 "created_at", "last_triggered", "next_fire", "catch_up")
+
+    def __init__(self, notif):
+        self.notif = notif
+        self.freq = None
+        self.active = False
+        self.at = None             # once: absolute fire time
+        self.daily_time = None     # daily: time of day
+        self.interval = None       # repeat: timedelta
+        self.created_at = None
+        self.last_triggered = None
+        self.next_fire = None
+        self.catch_up = CatchUp.ONCE
+
+    @classmethod
+    def compile(cls, notif, now):
+        record = cls(notif)
+        try:
+            record.freq = Frequency(notif.get("freq"))
+            record.catch_up = CatchUp(notif.get("catch_up") or "once")
+            record.active = notif.get("active", True)
+
+            last_triggered_str = notif.get("last_triggered")
+            record.last_triggered = datetime.fromisoformat(last_triggered_str) if last_triggered_str else None
+            created_at_str = notif.get("created_at")
+            record.created_at = datetime.fromisoformat(created_at_str) if created_at_str else now
+
+            if record.freq is Frequency.ONCE:
+                record.at = datetime.fromisoformat(notif.get("time"))
+            elif record.freq is Frequency.DAILY:
+                notif_time_str = notif.get("time") # HH:mm
+                record.daily_time = time(hour=int(notif_time_str[:2]), minute=int(notif_time_str[3:]))
+            else:
+                record.interval = timedelta(minutes=int(notif.get("repeat_min", 1)))
+                # A zero or negative interval would fire again at once and spin the heap forever
+                if record.interval <= timedelta(0):
+                    raise ValueError(f"repeat interval must be positive, got {notif.get('repeat_min')!r}")
+        except (TypeError, ValueError) as e:
+            print(f"Invalid schedule for notification '{notif.get('title')}': {e}")
+            record.freq = None
+            record.active = False
+
+        record.next_fire = record.compute_next_fire(now)
+        return record
+
+    def compute_next_fire(self, now):
+        """Return the next datetime this record is due, or None if it won't fire again"""
+        if not self.active:
+            return None
+
+        freq = self.freq
+        if freq is Frequency.ONCE:
+            return None if self.last_triggered else self.at
+
+        if freq is Frequency.DAILY:
+            # Fires once per calendar day, on the first check at or after the target time
+            day = now.date()
+            if self.last_triggered and self.last_triggered.date() >= day:
+                day = self.last_triggered.date() + timedelta(days=1)
+            return datetime.combine(day, self.daily_time)
+
+        if freq is Frequency.REPEAT:
+            # Not triggered yet: count from creation time
+            return (self.last_triggered or self.created_at) + self.interval
+
+        return None
+
+    def count_occurrences(self, due, now):
+        """Number of occurrences between the scheduled `due` time and `now`, inclusive"""
+        if due > now:
+            return 0
+        if self.freq is Frequency.REPEAT:
+            return (now - due) // self.interval + 1
+        if self.freq is Frequency.DAILY:
+            days = (now.date() - due.date()).days
+            return days + (1 if now.time() >= self.daily_time else 0)
+        return 1
+
+    def occurrences(self, until, write_back=False):
+        """Fire this record at each of its due times up to `until`, yielding them.
+
+        Equivalent to repeatedly letting the scheduler fire it, as long as
+        nothing else changes the notification in between.
+        """
+        if self.freq is Frequency.REPEAT and not write_back:
+            # Fixed interval: step the cached next-fire directly
+            interval = self.interval
+            when = self.next_fire
+            while when is not None and when <= until:
+                self.last_triggered = when
+                yield when
+                when += interval
+            self.next_fire = when
+            return
+
+        while self.next_fire is not None and self.next_fire <= until:
+            now = self.next_fire
+            self.mark_triggered(now, write_back)
+            yield now
+
+    def is_due(self, now):
+        return self.next_fire is not None and self.next_fire <= now
+
+    def mark_triggered(self, now, write_back=True):
+        """Record a fire at `now` on the record and, with `write_back`, on the stored dict"""
+        if self.freq is Frequency.ONCE:
+            self.active = False
+            if write_back:
+                self.notif["active"] = False # Done
+        self.last_triggered = now
+        if write_back:
+            self.notif["last_triggered"] = now.isoformat()
+        self.next_fire = self.compute_next_fire(now)
+
+
+def compute_next_fire(notif, now):
+    """Return the next datetime at which `notif` is due, or None if it won't fire again"""
+    return ScheduleRecord.compile(notif, now).next_fire
+
+
+class Scheduler:
+    """Min-heap of next-fire times over compiled schedule records.
+
+    Entries are invalidated lazily: unscheduling only marks the entry as removed
+    and it is discarded once it reaches the top of the heap.
+    """
+
+    def __init__(self, write_back=True):
+        self._heap = []
+        self._entries = {} # key -> [due, seq, record]
+        self._counter = itertools.count()
+        # Simulations leave the notification dicts untouched
+        self.write_back = write_back
+
+    @staticmethod
+    def _key(notif):
+        # Stored notifications have a stable id; simulations may use bare dicts
+        return notif.get("id") or id(notif)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def records(self):
+        return [entry[-1] for entry in self._entries.values()]
+
+    def _push(self, record):
+        entry = [record.next_fire, next(self._counter), record]
+        self._entries[self._key(record.notif)] = entry
+        heapq.heappush(self._heap, entry)
+
+    def rebuild(self, notifications, now):
+        self._entries = {}
+        self._heap = []
+        for notif in notifications:
+            record = ScheduleRecord.compile(notif, now)
+            if record.next_fire is not None:
+                entry = [record.next_fire, next(self._counter), record]
+                self._entries[self._key(notif)] = entry
+                self._heap.append(entry)
+        heapq.heapify(self._heap)
+
+    def schedule(self, notif, now):
+        """Recompile and reschedule a notification after it was added or changed"""
+        self.unschedule(notif)
+        record = ScheduleRecord.compile(notif, now)
+        if record.next_fire is not None:
+            self._push(record)
+
+    def unschedule(self, notif):
+        entry = self._entries.pop(self._key(notif), None)
+        if entry is not None:
+            entry[-1] = None # Mark as removed
+
+    def next_due(self):
+        """Earliest pending fire time, or None if nothing is scheduled"""
+        heap = self._heap
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    @staticmethod
+    def _apply_policy(record, missed):
+        """Number of occurrences to report for `missed` overdue ones, 0 to skip"""
+        # One-off reminders are never dropped, whatever the policy
+        if missed <= 1 or record.freq is Frequency.ONCE:
+            return missed
+        if record.catch_up is CatchUp.SKIP:
+            return 0
+        if record.catch_up is CatchUp.ONCE:
+            return 1
+        return missed
+
+    def collect_due(self, now, catch_up=False):
+        """Pop every notification due at `now`, mark it triggered and reschedule it.
+
+        With `catch_up` set (after a wall-clock jump such as a resume from sleep)
+        each recurring notification applies its catch-up policy, and all of its
+        missed occurrences are coalesced into a single event.
+
+        Returns a FireEvent for every notification that fired; skipped
+        occurrences yield an event with `missed` == 0 since the stored
+        notification was still updated.
+        """
+        fired = []
+        heap = self._heap
+        entries = self._entries
+        key = self._key
+        while heap and heap[0][0] <= now:
+            scheduled, _, record = heap[0]
+            if record is None:
+                heapq.heappop(heap)
+                continue
+
+            # Re-evaluate against the current time: a daily entry computed on an
+            # earlier day only fires once today's target time has been reached.
+            if record.freq is Frequency.DAILY:
+                record.next_fire = record.compute_next_fire(now)
+
+            if record.next_fire <= now:
+                missed = self._apply_policy(record, record.count_occurrences(scheduled, now) if catch_up else 1)
+                record.mark_triggered(now, self.write_back)
+                fired.append(FireEvent(record.notif, scheduled, missed))
+            elif catch_up:
+                # Occurrences of earlier days were slept through; report them
+                # without consuming today's upcoming one.
+                missed = self._apply_policy(record, record.count_occurrences(scheduled, now))
+                if missed:
+                    fired.append(FireEvent(record.notif, scheduled, missed))
+
+            # Replace the top entry in place rather than pop + push
+            if record.next_fire is None:
+                heapq.heappop(heap)
+                del entries[key(record.notif)]
+            else:
+                entry = [record.next_fire, next(self._counter), record]
+                entries[key(record.notif)] = entry
+                heapq.heapreplace(heap, entry)
+        return fired
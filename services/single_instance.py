@@ -0,0 +1,77 @@
+"""One running instance per user; later launches forward their intent to it.
+
+Only QtCore and QtNetwork are imported here, so a second launch can hand
+over its command and exit before any widget module is loaded.
+"""
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+from services.store_client import server_name
+
+COMMANDS = ("show", "add", "quit")
+TIMEOUT_MS = 300
+
+
+def parse_intent(argv):
+    """Command for the running instance from the command line: show (default), add or quit.
+
+    A tray-only launch (--tray, or --autostart at login) only sends "ping", so it
+    never pops up a running instance; when none is running, main.py starts one
+    tray-only.
+    """
+    if "--autostart" in argv or "--tray" in argv:
+        return "ping"
+    for arg in argv:
+        if arg in ("--add", "--quit", "--show"):
+            return arg[2:]
+    return "show"
+
+
+def send_command(command, name=None, timeout_ms=TIMEOUT_MS):
+    """Send `command` to the running instance; False if none is listening"""
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((command + "\n").encode("utf-8"))
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return True
+
+
+class InstanceServer(QObject):
+    """Owns the instance name and emits `command_received` for forwarded launches"""
+    command_received = pyqtSignal(str)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def listen(self):
+        """Claim the name; False if another instance already owns it"""
+        if self.server.listen(self.name):
+            return True
+        if send_command("ping", self.name):
+            return False
+        # Left behind by a crashed instance
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self._read(socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _read(self, socket):
+        while socket.canReadLine():
+            command = bytes(socket.readLine()).decode("utf-8", "replace").strip()
+            if command in COMMANDS:
+                self.command_received.emit(command)
+
+    def close(self):
+        self.server.close()
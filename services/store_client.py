@@ -0,0 +1,100 @@
+"""Qt-free client for the running app's store, for tools such as the CLI.
+
+The app (and the daemon) serve their SettingsManager with a StoreServer
+(services/remote_store.py) on a QLocalServer. That is a Unix domain socket
+in Qt's temp directory, or a named pipe on Windows, so plain Python can
+speak the same JSON-lines protocol without loading Qt. While the app runs,
+the data file is only a copy of its memory: changes must go through here,
+or the app's next save drops them.
+"""
+import getpass
+import json
+import os
+import re
+import socket
+import sys
+
+TIMEOUT_S = 5
+
+
+def server_name():
+    """Single-instance name of this user's Assistant"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return "Assistant-" + re.sub(r"[^A-Za-z0-9_.-]", "_", user)
+
+
+def store_server_name():
+    return server_name() + "-store"
+
+
+def socket_path(name):
+    """Where QLocalServer listens for `name`"""
+    if sys.platform == "win32":
+        return r"\\.\pipe" + "\\" + name
+    # QDir::tempPath(): $TMPDIR, else /tmp
+    return os.path.join((os.environ.get("TMPDIR") or "/tmp").rstrip("/") or "/", name)
+
+
+def is_listening(name):
+    """True if a QLocalServer is accepting connections on `name`"""
+    try:
+        _open(name).close()
+        return True
+    except OSError:
+        return False
+
+
+def _open(name):
+    if sys.platform == "win32":
+        return open(socket_path(name), "r+b", buffering=0)
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(TIMEOUT_S)
+    try:
+        connection.connect(socket_path(name))
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+class StoreClient:
+    """Calls SettingsManager methods of the running app (see remote_store.OPS)"""
+
+    def __init__(self, name=None):
+        self.name = name or store_server_name()
+        self._connection = _open(self.name)
+        self._buffer = b""
+        self._next_call = 0
+
+    def close(self):
+        self._connection.close()
+
+    def _send(self, data):
+        if sys.platform == "win32":
+            self._connection.write(data)
+        else:
+            self._connection.sendall(data)
+
+    def _receive(self):
+        data = self._connection.read(65536) if sys.platform == "win32" else self._connection.recv(65536)
+        if not data:
+            raise ConnectionError("The running Assistant closed the connection")
+        self._buffer += data
+
+    def call(self, op, *args):
+        self._next_call += 1
+        call_id = self._next_call
+        self._send((json.dumps({"call": call_id, "op": op, "args": list(args)}, ensure_ascii=False) + "\n").encode("utf-8"))
+        while True:
+            while b"\n" not in self._buffer:
+                self._receive()
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            message = json.loads(line.decode("utf-8"))
+            if message.get("reply") != call_id:
+                continue # store events and window commands are for GUI clients
+            if "error" in message:
+                raise RuntimeError(message["error"])
+            return message.get("result")
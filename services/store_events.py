@@ -0,0 +1,52 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+
+class StoreEvents(QObject):
+    """Qt-side change feed of a SettingsManager, batched per event-loop turn.
+
+    Store listener calls are collected and coalesced per notification id, then
+    `changed` is emitted once with a list of (event, notif_id) pairs, where
+    event is "added", "updated" or "removed". A reload or import is reported
+    as the single pair ("reset", None).
+    """
+    changed = pyqtSignal(list)
+
+    def __init__(self, settings_manager, parent=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self._pending = {} # notif_id -> event, in arrival order
+        self._reset = False
+        self._scheduled = False
+        settings_manager.add_listener(self._on_store_changed)
+
+    def _on_store_changed(self, event, old, new):
+        if event == "reset":
+            self._reset = True
+            self._pending.clear()
+        elif not self._reset:
+            notif_id = (new or old).get("id")
+            previous = self._pending.get(notif_id)
+            if event == "triggered":
+                event = "updated"
+            if previous == "added" and event == "removed":
+                # Never seen by the listeners: drop it altogether
+                del self._pending[notif_id]
+            elif previous != "added":
+                self._pending[notif_id] = event
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        self._scheduled = False
+        if self._reset:
+            changes = [("reset", None)]
+        else:
+            changes = [(event, notif_id) for notif_id, event in self._pending.items()]
+        self._reset = False
+        self._pending = {}
+        if changes:
+            self.changed.emit(changes)
+
+    def close(self):
+        self.settings_manager.remove_listener(self._on_store_changed)
@@ -0,0 +1,161 @@
+import json
+import os
+import uuid
+from services.scheduler import ScheduleRecord
+from storage.journal import TriggerJournal
+from storage.write_behind import WriteBehindWriter, atomic_write
+
+
+def new_notification_id():
+    return uuid.uuid4().hex
+
+
+def assign_ids(notifications):
+    """Give notifications saved before ids existed one; returns how many were assigned"""
+    assigned = 0
+    for notif in notifications:
+        if not notif.get("id"):
+            notif["id"] = new_notification_id()
+            assigned += 1
+    return assigned
+
+
+class StorageBackend:
+    """Persistence behind SettingsManager.
+
+    SettingsManager keeps the data in memory and tells the backend about each
+    change, so a backend can persist it incrementally or rewrite everything.
+    Notifications are identified by their "id" field.
+    """
+
+    def bind(self, store):
+        self.store = store
+
+    def load(self):
+        """Return the stored data dict, or None if there is nothing stored yet"""
+        raise NotImplementedError
+
+    def save_all(self):
+        """Persist the whole store"""
+        raise NotImplementedError
+
+    def replace_all(self):
+        """The store was replaced wholesale (import); persist it from scratch"""
+        self.save_all()
+
+    def notification_added(self, notif):
+        self.save_all()
+
+    def notifications_added(self, notifs):
+        """Several notifications appended at once"""
+        self.save_all()
+
+    def notification_updated(self, notif):
+        self.save_all()
+
+    def notification_removed(self, notif_id):
+        self.save_all()
+
+    def notifications_removed(self, notif_ids):
+        """Several notifications removed at once"""
+        self.save_all()
+
+    def notification_patched(self, op, notif, fields):
+        self.save_all()
+
+    def setting_changed(self, key, value):
+        self.save_all()
+
+    def next_due(self, now, limit):
+        """Up to `limit` (due, notif) pairs ordered by next fire time"""
+        records = (ScheduleRecord.compile(n, now) for n in self.store.get_notifications())
+        due = sorted(((r.next_fire, r.notif) for r in records if r.next_fire is not None),
+                     key=lambda pair: pair[0])
+        return due[:limit]
+
+    def flush(self):
+        pass
+
+    def compact(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+
+class JsonBackend(StorageBackend):
+    """The __user_data.txt file, with an optional write-behind worker and a trigger journal"""
+
+    def __init__(self, path, write_behind=False):
+        self.path = path
+        self.store = None
+        # Triggers and toggles are appended here instead of rewriting the data file
+        self.journal = TriggerJournal(path + ".journal")
+        # Write-behind: saves only mark the store dirty, a worker thread writes
+        self._writer = WriteBehindWriter(self._write_file) if write_behind else None
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Changes recorded since the snapshot was written
+        self.journal.replay(data.get("notifications", []))
+        return data
+
+    def _write_file(self):
+        with self.store.lock:
+            text = self.store.to_json()
+            journal_offset = self.journal.size()
+        atomic_write(self.path, text)
+        # Entries appended while writing are not in the snapshot and are kept
+        with self.store.lock:
+            self.journal.drop_prefix(journal_offset)
+
+    def save_all(self):
+        if self._writer:
+            self._writer.mark_dirty()
+            return
+        try:
+            self._write_file()
+        except Exception as e:
+            print(f"Error saving data: {e}")
+
+    def replace_all(self):
+        with self.store.lock:
+            if self._writer:
+                self._writer.discard()
+            # The journal patches the old snapshot, not the new one
+            self.journal.clear()
+        self.compact()
+
+    def notification_patched(self, op, notif, fields):
+        with self.store.lock:
+            if self._writer and self._writer.is_dirty():
+                # A full snapshot is pending anyway and will contain this change
+                self._writer.mark_dirty()
+                return
+            try:
+                self.journal.append(op, notif["id"], fields)
+            except Exception as e:
+                print(f"Error writing journal: {e}")
+                self.save_all()
+                return
+        if self.journal.needs_compaction():
+            self.save_all()
+
+    def flush(self):
+        if self._writer:
+            self._writer.flush()
+
+    def compact(self):
+        """Rewrite the data file now, folding the journal into it"""
+        if self._writer:
+            self._writer.mark_dirty()
+            self._writer.flush()
+        else:
+            self.save_all()
+
+    def close(self):
+        if self._writer:
+            self._writer.close()
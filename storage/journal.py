@@ -0,0 +1,95 @@
+import json
+import os
+from storage.write_behind import atomic_write
+
+
+class TriggerJournal:
+    """Append-only NDJSON log of small notification changes (triggers, toggles).
+
+    Each line patches one notification of the last written snapshot:
+        {"op": "trigger", "id": "3f2a...", "set": {"last_triggered": "...", "active": true}}
+    Appending costs O(1) I/O instead of rewriting the whole data file. On load
+    the entries are replayed over the snapshot; a torn last line from a crash
+    is cut off. Once the snapshot has been rewritten the entries it already
+    contains are dropped with `drop_prefix`.
+    """
+
+    def __init__(self, path, compact_threshold=64 * 1024):
+        self.path = path
+        self.compact_threshold = compact_threshold
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        return self.size() > self.compact_threshold
+
+    def append(self, op, notif_id, fields):
+        line = json.dumps({"op": op, "id": notif_id, "set": fields}, ensure_ascii=False)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+
+    def read(self):
+        """Return (entries, valid_size): the parsed entries and the bytes they span"""
+        if not os.path.exists(self.path):
+            return [], 0
+        entries = []
+        valid_size = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_size += len(line)
+        return entries, valid_size
+
+    def replay(self, notifications):
+        """Apply the journal on top of `notifications`; returns the number of entries applied"""
+        entries, valid_size = self.read()
+        if valid_size < self.size():
+            # Partially written tail from a crash: cut it so new entries start on a clean line
+            try:
+                os.truncate(self.path, valid_size)
+            except OSError as e:
+                print(f"Error repairing journal: {e}")
+
+        applied = 0
+        by_id = {n["id"]: n for n in notifications if n.get("id")} if entries else {}
+        for entry in entries:
+            notif = by_id.get(entry["id"]) if entry.get("id") else None
+            index = entry.get("i")
+            if notif is None and isinstance(index, int) and 0 <= index < len(notifications):
+                # Written before notifications had ids
+                notif = notifications[index]
+            if notif is not None:
+                notif.update(entry.get("set", {}))
+                applied += 1
+        return applied
+
+    def drop_prefix(self, offset):
+        """Remove the first `offset` bytes, i.e. the entries already in the snapshot"""
+        if offset <= 0:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                remainder = f.read()
+        except OSError:
+            return
+        if remainder:
+            atomic_write(self.path, remainder.decode("utf-8"))
+        else:
+            self.clear()
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,69 @@
+"""Shape of a stored notification, shared by the ingest server and the CLI"""
+from datetime import datetime
+
+TYPES = ("danger", "important", "warning", "info")
+FREQS = ("once", "daily", "repeat")
+CATCH_UPS = ("once", "all", "skip")
+
+
+def _schedule_time(freq, value, now):
+    """The "time" field for `freq`: an ISO local date-time (once), "HH:mm" (daily), "" (repeat)"""
+    if freq == "repeat":
+        return ""
+    if freq == "once":
+        if not value:
+            return now.isoformat()
+        try:
+            when = datetime.fromisoformat(str(value))
+        except ValueError:
+            raise ValueError(f"time {value!r} is not an ISO date-time") from None
+        if when.tzinfo is not None: # the scheduler works in naive local time
+            when = when.astimezone().replace(tzinfo=None)
+        return when.isoformat()
+    try:
+        return datetime.strptime(str(value), "%H:%M").strftime("%H:%M")
+    except ValueError:
+        raise ValueError(f"daily reminders need a time as HH:mm, got {value!r}") from None
+
+
+def normalize(item, source):
+    """Fill in an incoming item as a notification dict; raises ValueError if unusable"""
+    if not isinstance(item, dict):
+        raise ValueError("expected a JSON object")
+    title = str(item.get("title", "")).strip()
+    if not title:
+        raise ValueError("missing title")
+    now = datetime.now()
+    now_iso = now.isoformat()
+    freq = item.get("freq", "once")
+    if freq not in FREQS:
+        raise ValueError(f"unknown freq {freq!r}")
+    notif_type = item.get("type", "info")
+    if notif_type not in TYPES:
+        raise ValueError(f"unknown type {notif_type!r}")
+    catch_up = item.get("catch_up", "once")
+    if catch_up not in CATCH_UPS:
+        raise ValueError(f"unknown catch_up {catch_up!r}")
+    try:
+        repeat_min = int(item.get("repeat_min", 30))
+    except (TypeError, ValueError):
+        raise ValueError(f"repeat_min {item.get('repeat_min')!r} is not a number") from None
+    if repeat_min < 1:
+        raise ValueError(f"repeat_min must be at least 1, got {repeat_min}")
+    schedule_time = _schedule_time(freq, item.get("time"), now)
+    return {
+        "title": title,
+        "content": str(item.get("content", "")),
+        "type": notif_type,
+        "icon": item.get("icon", "DEFAULT"),
+        "color": item.get("color"),
+        "freq": freq,
+        "time": schedule_time,
+        "repeat_min": repeat_min,
+        "catch_up": catch_up,
+        "active": bool(item.get("active", True)),
+        "created_at": now_iso,
+        "updated_at": now_iso,
+        "last_triggered": None,
+        "source": source,
+    }
@@ -1,7 +1,11 @@
 import json
 import os
 import sys
+import threading
+from datetime import datetime
 from pathlib import Path
+from storage.backends import JsonBackend, assign_ids, new_notification_id
+from storage.write_behind import atomic_write
 
 class SettingsManager:
     @staticmethod
@@ -26,14 +30,42 @@ class SettingsManager:
         
         return app_dir
     
-    def __init__(self):
-        # Set DATA_FILE to the full path in app data directory
-        self.DATA_FILE = os.path.join(self._get_app_data_dir(), "__user_data.txt")
+    def __init__(self, data_file=None, write_behind=False, backend=None):
+        if data_file:
+            # Explicit file (benchmarks, tools): no migration from the project directory
+            self.DATA_FILE = data_file
+        else:
+            # Set DATA_FILE to the full path in app data directory
+            self.DATA_FILE = os.path.join(self._get_app_data_dir(), "__user_data.txt")
+            
+            # Migration: Move old data file to new location if exists
+            self._migrate_old_data_file()
+        
+        # Guards self.data against backends persisting it from another thread
+        self.lock = threading.RLock()
         
-        # Migration: Move old data file to new location if exists
-        self._migrate_old_data_file()
+        # Persistence: the SQLite database once it has been migrated to, else the JSON file
+        if backend is None:
+            from storage.sqlite_backend import SqliteBackend, db_path_for
+            db_path = db_path_for(self.DATA_FILE)
+            if os.path.exists(db_path):
+                backend = SqliteBackend(db_path)
+            else:
+                backend = JsonBackend(self.DATA_FILE, write_behind=write_behind)
+        self.backend = backend
+        self.backend.bind(self)
         
         self.data = self._load_data()
+        self._by_id = {} # notification id -> notification dict
+        # notification id -> list index, built lazily; removals only shift entries left, so an
+        # index may be too high and is corrected by _position
+        self._positions = None
+        if self._index_notifications():
+            # Older files have no ids yet; persist the ones just assigned
+            self.save_data()
+        
+        # Callbacks notified as callback(event, old, new) on notification changes
+        self._listeners = []
     
     def _migrate_old_data_file(self):
         """Migrate old data file from project directory to app data directory"""
@@ -51,12 +83,12 @@ class SettingsManager:
                 print(f"Error migrating data file: {e}")
 
     def _load_data(self):
-        if os.path.exists(self.DATA_FILE):
-            try:
-                with open(self.DATA_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading data: {e}")
+        try:
+            data = self.backend.load()
+            if data is not None:
+                return data
+        except Exception as e:
+            print(f"Error loading data: {e}")
         
         # Default data
         return {
@@ -68,35 +100,192 @@ class SettingsManager:
             }
         }
 
+    def _index_notifications(self):
+        """Give every notification an id and rebuild the id index; returns the number of ids assigned"""
+        notifications = self.get_notifications()
+        assigned = assign_ids(notifications)
+        self._by_id = {n["id"]: n for n in notifications}
+        self._positions = None
+        return assigned
+
+    def reload_data(self):
+        """Re-read the stored data"""
+        with self.lock:
+            self.data = self._load_data()
+            assigned = self._index_notifications()
+        if assigned:
+            self.save_data()
+        self._notify("reset", None, None)
+
+    def import_data(self, file_path):
+        """Replace all data with the JSON data file at `file_path`"""
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        with self.lock:
+            self.data = data
+            self._index_notifications()
+            self.backend.replace_all()
+        self._notify("reset", None, None)
+
+    def backup_data(self, file_path):
+        """Write the current data, in the __user_data.txt format, to `file_path`"""
+        atomic_write(file_path, self.to_json())
+
+    def to_json(self):
+        # Every in-place change to self.data, the scheduler's included, is made under this lock
+        with self.lock:
+            return json.dumps(self.data, indent=4, ensure_ascii=False)
+
     def save_data(self):
-        try:
-            with open(self.DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error saving data: {e}")
+        self.backend.save_all()
+
+    def flush(self):
+        """Write pending write-behind changes now"""
+        self.backend.flush()
+
+    def compact(self):
+        """Rewrite the stored data now, folding incremental logs into it"""
+        self.backend.compact()
+
+    def close(self):
+        """Flush and release the storage backend; call on exit"""
+        self.backend.close()
+
+    # Change listeners
+    def add_listener(self, callback):
+        """Register callback(event, old, new).
+
+        `event` is "added", "updated", "removed", "reset" (everything reloaded)
+        or "triggered" (fired by the scheduler, which already rescheduled it).
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, old, new):
+        for callback in list(self._listeners):
+            try:
+                callback(event, old, new)
+            except Exception as e:
+                print(f"Error in notification listener: {e}")
 
     # Notifications helper
     def get_notifications(self):
         return self.data.get("notifications", [])
 
+    def get_notification(self, notif_id):
+        return self._by_id.get(notif_id)
+
+    def _position(self, notif_id):
+        notifications = self.get_notifications()
+        if self._positions is None:
+            self._positions = {n["id"]: i for i, n in enumerate(notifications)}
+        index = min(self._positions[notif_id], len(notifications) - 1)
+        # Moved left by removals since the index was recorded
+        while notifications[index]["id"] != notif_id:
+            index -= 1
+        self._positions[notif_id] = index
+        return index
+
+    def _pop_notification(self, notif_id):
+        """Take `notif_id` out of the list, keeping the order of the others (and of the saved file)"""
+        del self.data["notifications"][self._position(notif_id)]
+        del self._positions[notif_id]
+
+    def next_due(self, limit=10, now=None):
+        """The next `limit` due notifications as (due datetime, notif dict) pairs"""
+        return self.backend.next_due(now or datetime.now(), limit)
+
     def add_notification(self, notification):
-        self.data["notifications"].append(notification)
-        self.save_data()
+        """Add a notification; returns its id"""
+        with self.lock:
+            if not notification.get("id"):
+                notification["id"] = new_notification_id()
+            self.data["notifications"].append(notification)
+            self._by_id[notification["id"]] = notification
+            if self._positions is not None:
+                self._positions[notification["id"]] = len(self.data["notifications"]) - 1
+            self.backend.notification_added(notification)
+        self._notify("added", None, notification)
+        return notification["id"]
 
-    def update_notification(self, index, updated_notif):
-        if 0 <= index < len(self.data["notifications"]):
-            self.data["notifications"][index] = updated_notif
-            self.save_data()
+    def add_notifications(self, notifications):
+        """Add several notifications with a single write; returns their ids"""
+        with self.lock:
+            for notification in notifications:
+                if not notification.get("id"):
+                    notification["id"] = new_notification_id()
+                self.data["notifications"].append(notification)
+                self._by_id[notification["id"]] = notification
+                if self._positions is not None:
+                    self._positions[notification["id"]] = len(self.data["notifications"]) - 1
+            self.backend.notifications_added(notifications)
+        for notification in notifications:
+            self._notify("added", None, notification)
+        return [n["id"] for n in notifications]
 
-    def remove_notification(self, index):
-        if 0 <= index < len(self.data["notifications"]):
-            self.data["notifications"].pop(index)
-            self.save_data()
+    def update_notification(self, notif_id, updated_notif):
+        old_notif = self._by_id.get(notif_id)
+        if old_notif is None:
+            return
+        with self.lock:
+            updated_notif["id"] = notif_id
+            self.data["notifications"][self._position(notif_id)] = updated_notif
+            self._by_id[notif_id] = updated_notif
+            self.backend.notification_updated(updated_notif)
+        self._notify("updated", old_notif, updated_notif)
+
+    def patch_notification(self, notif_id, fields, op="patch"):
+        """Change a few fields of one notification, persisted incrementally"""
+        notif = self._by_id.get(notif_id)
+        if notif is None:
+            return
+        with self.lock:
+            notif.update(fields)
+            self.backend.notification_patched(op, notif, fields)
+        self._notify("updated", notif, notif)
+
+    def record_trigger(self, notif):
+        """Persist the trigger state the scheduler has just set on `notif`"""
+        fields = {"last_triggered": notif.get("last_triggered"), "active": notif.get("active", True)}
+        with self.lock:
+            self.backend.notification_patched("trigger", notif, fields)
+        self._notify("triggered", notif, notif)
+
+    def remove_notification(self, notif_id):
+        if notif_id not in self._by_id:
+            return
+        with self.lock:
+            old_notif = self._by_id.pop(notif_id)
+            self._pop_notification(notif_id)
+            self.backend.notification_removed(notif_id)
+        self._notify("removed", old_notif, None)
+
+    def remove_notifications(self, notif_ids):
+        """Remove several notifications with a single write; returns the removed ones"""
+        with self.lock:
+            removed = [self._by_id.pop(i) for i in dict.fromkeys(notif_ids) if i in self._by_id]
+            if not removed:
+                return []
+            if len(removed) == 1:
+                self._pop_notification(removed[0]["id"])
+            else:
+                # One pass over the list rather than a shift per removed notification
+                gone = {n["id"] for n in removed}
+                self.data["notifications"][:] = [n for n in self.get_notifications() if n["id"] not in gone]
+                self._positions = None
+            self.backend.notifications_removed([n["id"] for n in removed])
+        for notification in removed:
+            self._notify("removed", notification, None)
+        return removed
 
     # Settings helper
     def get_setting(self, key, default=None):
         return self.data.get("settings", {}).get(key, default)
 
     def set_setting(self, key, value):
-        self.data["settings"][key] = value
-        self.save_data()
+        with self.lock:
+            self.data["settings"][key] = value
+            self.backend.setting_changed(key, value)
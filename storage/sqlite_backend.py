@@ -0,0 +1,218 @@
+"""SQLite storage for large reminder sets.
+
+Each notification is one row keyed by its id (its JSON plus indexed
+`active` and `next_due` columns), so a trigger, an edit or a delete touches
+a single row and "what is due next" is an index range scan. The database lives next to the data file as
+__user_data.db; once it exists SettingsManager uses it instead of the JSON
+file.
+
+What this saves is write and scan time, not memory: SettingsManager still
+loads every row into self.data at startup and keeps it there, because the
+list view, the scheduler and the tools all read get_notifications(). Memory
+and startup time stay O(number of notifications), as with the JSON file.
+
+One-shot migration of the current JSON data file:
+    python -m storage.sqlite_backend migrate [path/to/__user_data.txt]
+"""
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from services.scheduler import ScheduleRecord
+from storage.backends import JsonBackend, StorageBackend, assign_ids
+
+_EPOCH = datetime(1970, 1, 1)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    active INTEGER NOT NULL,
+    next_due REAL
+);
+CREATE INDEX IF NOT EXISTS idx_notifications_position ON notifications(position);
+CREATE INDEX IF NOT EXISTS idx_notifications_active ON notifications(active);
+CREATE INDEX IF NOT EXISTS idx_notifications_next_due ON notifications(active, next_due);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def db_path_for(data_file):
+    return os.path.splitext(data_file)[0] + ".db"
+
+
+def _to_seconds(when):
+    return (when - _EPOCH).total_seconds() if when is not None else None
+
+
+def _from_seconds(seconds):
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+class SqliteBackend(StorageBackend):
+    def __init__(self, path):
+        self.path = path
+        self.store = None
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._upgrade_schema()
+        self.conn.executescript(SCHEMA)
+
+    def _upgrade_schema(self):
+        """Re-key databases created before notifications had ids"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(notifications)")]
+        if not columns or "id" in columns:
+            return
+        notifications = [json.loads(data) for (data,) in
+                         self.conn.execute("SELECT data FROM notifications ORDER BY position")]
+        assign_ids(notifications)
+        self.conn.execute("DROP TABLE notifications")
+        self.conn.executescript(SCHEMA)
+        self._write_notifications(notifications)
+
+    # Row helpers
+    @staticmethod
+    def _row(notif, now=None):
+        record = ScheduleRecord.compile(notif, now or datetime.now())
+        return (json.dumps(notif, ensure_ascii=False), 1 if notif.get("active", True) else 0,
+                _to_seconds(record.next_fire))
+
+    def is_empty(self):
+        return self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM notifications) "
+                                 "AND NOT EXISTS (SELECT 1 FROM settings)").fetchone()[0] == 1
+
+    def load(self):
+        """Every row, decoded: SettingsManager holds the whole table in memory"""
+        if self.is_empty():
+            return None
+        notifications = [json.loads(data) for (data,) in
+                         self.conn.execute("SELECT data FROM notifications ORDER BY position")]
+        settings = {key: json.loads(value) for key, value in
+                    self.conn.execute("SELECT key, value FROM settings")}
+        return {"notifications": notifications, "settings": settings}
+
+    def _insert_rows(self, notifications):
+        now = datetime.now()
+        self.conn.executemany(
+            "INSERT INTO notifications (id, position, data, active, next_due) VALUES (?, ?, ?, ?, ?)",
+            ((n["id"], i) + self._row(n, now) for i, n in enumerate(notifications)))
+
+    def _write_notifications(self, notifications):
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM notifications")
+            self._insert_rows(notifications)
+
+    def _write_all(self, data):
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.execute("DELETE FROM notifications")
+            self._insert_rows(data.get("notifications", []))
+            self.conn.execute("DELETE FROM settings")
+            self.conn.executemany(
+                "INSERT INTO settings (key, value) VALUES (?, ?)",
+                ((k, json.dumps(v, ensure_ascii=False)) for k, v in data.get("settings", {}).items()))
+
+    def save_all(self):
+        with self.store.lock:
+            self._write_all(self.store.data)
+
+    def notification_added(self, notif):
+        # Positions only order the rows; gaps left by deletes are fine
+        self.conn.execute("INSERT INTO notifications (id, position, data, active, next_due) "
+                          "VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM notifications), ?, ?, ?)",
+                          (notif["id"],) + self._row(notif))
+
+    def notifications_added(self, notifs):
+        with self.conn:
+            self.conn.execute("BEGIN")
+            start = self.conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM notifications").fetchone()[0]
+            now = datetime.now()
+            self.conn.executemany(
+                "INSERT INTO notifications (id, position, data, active, next_due) VALUES (?, ?, ?, ?, ?)",
+                ((n["id"], start + i) + self._row(n, now) for i, n in enumerate(notifs)))
+
+    def notification_updated(self, notif):
+        self.conn.execute("UPDATE notifications SET data = ?, active = ?, next_due = ? WHERE id = ?",
+                          self._row(notif) + (notif["id"],))
+
+    def notification_removed(self, notif_id):
+        self.conn.execute("DELETE FROM notifications WHERE id = ?", (notif_id,))
+
+    def notifications_removed(self, notif_ids):
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("DELETE FROM notifications WHERE id = ?", ((i,) for i in notif_ids))
+
+    def notification_patched(self, op, notif, fields):
+        self.notification_updated(notif)
+
+    def setting_changed(self, key, value):
+        self.conn.execute("INSERT INTO settings (key, value) VALUES (?, ?) "
+                          "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                          (key, json.dumps(value, ensure_ascii=False)))
+
+    def next_due(self, now, limit):
+        """Due notifications from the next_due index, without reading the whole table"""
+        # Overdue daily rows keep the date they were computed for; bring them up to date
+        stale = self.conn.execute("SELECT id, data FROM notifications "
+                                  "WHERE active = 1 AND next_due < ?", (_to_seconds(now),)).fetchall()
+        if stale:
+            with self.conn:
+                self.conn.execute("BEGIN")
+                for notif_id, data in stale:
+                    row = self._row(json.loads(data), now)
+                    self.conn.execute("UPDATE notifications SET next_due = ? WHERE id = ?",
+                                      (row[2], notif_id))
+
+        rows = self.conn.execute("SELECT next_due, data FROM notifications "
+                                 "WHERE active = 1 AND next_due IS NOT NULL "
+                                 "ORDER BY next_due LIMIT ?", (limit,))
+        return [(_from_seconds(due), json.loads(data)) for due, data in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def migrate(data_file):
+    """Copy a JSON data file (and its journal) into a new SQLite database next to it"""
+    db_path = db_path_for(data_file)
+    backend = SqliteBackend(db_path)
+    if not backend.is_empty():
+        print(f"{db_path} already contains data, nothing to migrate")
+        backend.close()
+        return db_path
+
+    data = JsonBackend(data_file).load()
+    if data is None:
+        print(f"No data file at {data_file}")
+    else:
+        assign_ids(data.get("notifications", []))
+        backend._write_all(data)
+        print(f"Migrated {len(data.get('notifications', []))} notifications from {data_file} to {db_path}")
+    backend.close()
+    return db_path
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] != "migrate":
+        print(__doc__)
+        return 1
+    if len(argv) > 1:
+        data_file = argv[1]
+    else:
+        from storage.settings_manager import SettingsManager
+        data_file = os.path.join(SettingsManager._get_app_data_dir(), "__user_data.txt")
+    migrate(data_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
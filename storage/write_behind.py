@@ -0,0 +1,109 @@
+import atexit
+import os
+import tempfile
+import threading
+import time
+
+
+def atomic_write(path, text):
+    """Write `text` to `path` through a temp file in the same directory and an atomic rename"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class WriteBehindWriter:
+    """Background writer that coalesces saves.
+
+    `mark_dirty` only flags the store; a worker thread waits until no change
+    happened for `debounce` seconds (but never longer than `max_delay` after
+    the first change) and then calls `write()` once for the whole batch.
+    `flush` writes synchronously and is called on exit.
+    """
+
+    def __init__(self, write, debounce=0.5, max_delay=5.0, name="WriteBehind"):
+        self._write = write
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock() # One writer at a time: worker or flush()
+        self._dirty = False
+        self._first_change = 0.0
+        self._last_change = 0.0
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def mark_dirty(self):
+        with self._cond:
+            now = time.monotonic()
+            if not self._dirty:
+                self._dirty = True
+                self._first_change = now
+            self._last_change = now
+            self._cond.notify()
+
+    def is_dirty(self):
+        with self._cond:
+            return self._dirty
+
+    def discard(self):
+        """Forget pending changes, e.g. before the file is replaced from outside"""
+        with self._cond:
+            self._dirty = False
+
+    def flush(self):
+        """Write pending changes now, on the calling thread"""
+        with self._write_lock:
+            with self._cond:
+                if not self._dirty:
+                    return
+                self._dirty = False
+            self._do_write()
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout=5)
+        self.flush()
+
+    def _do_write(self):
+        try:
+            self._write()
+        except Exception as e:
+            print(f"Error saving data: {e}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # Debounce: wait for a quiet period, bounded by max_delay
+                while self._dirty and not self._closed:
+                    now = time.monotonic()
+                    deadline = min(self._last_change + self.debounce, self._first_change + self.max_delay)
+                    if now >= deadline:
+                        break
+                    self._cond.wait(deadline - now)
+                if self._closed:
+                    return
+            self.flush()
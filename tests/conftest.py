@@ -0,0 +1,17 @@
+import os
+import sys
+import pytest
+
+# Run from any directory: the app's modules are imported from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The one Qt application of the test run: a QApplication (offscreen) when widgets are available"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        from PyQt6.QtCore import QCoreApplication as QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QEventLoop, QProcess, QTimer
+from services.daemon import PopupHelperProcess
+from storage.settings_manager import SettingsManager
+
+
+def run_events(ms):
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_close_stops_a_helper_still_showing_popups(app, tmp_path, monkeypatch, capfd):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    popups = PopupHelperProcess(SettingsManager(data_file=str(tmp_path / "__user_data.txt")))
+    popups.show({"id": "a", "title": "Title", "content": "Body", "type": "info"})
+    process = popups._process
+    assert process.waitForStarted(5000)
+    run_events(500) # the popup is on screen, so the helper won't exit on its own
+
+    popups.close()
+    assert process.state() == QProcess.ProcessState.NotRunning
+    popups.deleteLater()
+    run_events(50)
+    assert "Destroyed while process is still running" not in capfd.readouterr().err
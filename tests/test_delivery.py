@@ -0,0 +1,87 @@
+"""DBusDelivery against a private dbus-daemon and the stub notification server"""
+import shutil
+import subprocess
+import time
+import pytest
+
+pytest.importorskip("PyQt6.QtDBus")
+
+from PyQt6.QtDBus import QDBusConnection
+from services.delivery import DBusDelivery, StubNotificationServer, register_stub
+
+pytestmark = pytest.mark.skipif(shutil.which("dbus-daemon") is None, reason="dbus-daemon is not installed")
+
+
+@pytest.fixture
+def bus_address():
+    daemon = subprocess.Popen(["dbus-daemon", "--session", "--nofork", "--print-address=1"],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    address = daemon.stdout.readline().strip()
+    yield address
+    daemon.kill()
+    daemon.wait()
+
+
+def connect(address, name):
+    # Connections are cached by name: one per bus, since each test starts its own daemon
+    bus = QDBusConnection.connectToBus(address, f"{name}-{address}")
+    assert bus.isConnected()
+    return bus
+
+
+def wait_until(app, predicate, timeout_s=5):
+    deadline = time.monotonic() + timeout_s
+    while not predicate() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def server(app, bus_address):
+    stub = StubNotificationServer()
+    assert register_stub(connect(bus_address, "stub-server"), stub)
+    return stub
+
+
+def test_notify_carries_urgency_and_replaces_the_previous_one(app, bus_address, server):
+    delivery = DBusDelivery(bus=connect(bus_address, "client-notify"))
+    notif = {"id": "a", "title": "Disk", "content": "Almost full", "type": "danger", "icon": "⚠"}
+    fallback = []
+
+    assert delivery.deliver(notif, fallback=lambda: fallback.append(True))
+    assert wait_until(app, lambda: "a" in delivery._server_ids)
+    replaces_id, summary, body, hints, expire_timeout = server.received[0]
+    assert (replaces_id, summary, body) == (0, "⚠ Disk", "Almost full")
+    assert hints["urgency"] == b"\x02" # a D-Bus byte arrives as bytes
+    assert expire_timeout == 0 # critical: stays until dismissed
+
+    assert delivery.deliver(notif, missed=3)
+    assert wait_until(app, lambda: len(server.received) == 2)
+    assert server.received[1][0] == delivery._server_ids["a"]
+    assert not fallback
+
+
+def test_closed_notification_is_not_replaced(app, bus_address, server):
+    delivery = DBusDelivery(bus=connect(bus_address, "client-closed"))
+    notif = {"id": "b", "title": "Standup", "content": "", "type": "info"}
+    delivery.deliver(notif)
+    assert wait_until(app, lambda: "b" in delivery._server_ids)
+
+    server.CloseNotification(delivery._server_ids["b"])
+    assert wait_until(app, lambda: "b" not in delivery._server_ids)
+    delivery.deliver(notif)
+    assert wait_until(app, lambda: len(server.received) == 2)
+    assert server.received[1][0] == 0
+
+
+def test_missing_server_runs_the_fallback(app, bus_address):
+    delivery = DBusDelivery(bus=connect(bus_address, "client-no-server"))
+    fallback = []
+    assert delivery.deliver({"id": "c", "title": "T", "type": "info"}, fallback=lambda: fallback.append(True))
+    assert wait_until(app, lambda: fallback)
+
+
+def test_no_bus_is_not_available(app):
+    delivery = DBusDelivery(bus=QDBusConnection.connectToBus("unix:path=/nonexistent/bus", "client-no-bus"))
+    assert not delivery.deliver({"id": "d", "title": "T", "type": "info"}, fallback=lambda: None)
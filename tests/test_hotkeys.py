@@ -0,0 +1,83 @@
+import shutil
+import subprocess
+import pytest
+
+pytest.importorskip("PyQt6.QtCore")
+
+from services.hotkeys import X11Hotkey, create_hotkey, load_xlib, parse_shortcut
+
+
+@pytest.mark.parametrize("shortcut, expected", [
+    ("Ctrl+Shift+A", ({"ctrl", "shift"}, "A")),
+    ("ctrl+alt+f12", ({"ctrl", "alt"}, "f12")),
+    ("Meta+Space", ({"meta"}, "Space")),
+    ("Win+Del", ({"meta"}, "Del")),
+    ("Ctrl++", ({"ctrl"}, "+")),
+    ("Ctrl+Shift+A, Ctrl+B", ({"ctrl", "shift"}, "A")), # only the first chord
+    ("Alt+é", ({"alt"}, "É")),
+    ("+", (set(), "+")),
+])
+def test_parse_shortcut(shortcut, expected):
+    mods, key = parse_shortcut(shortcut)
+    assert (mods, key) == (frozenset(expected[0]), expected[1])
+
+
+@pytest.mark.parametrize("shortcut", ["", "Ctrl+", "Hyper+A", "Ctrl+Enterr", "Ctrl+F25"])
+def test_parse_shortcut_rejects(shortcut):
+    with pytest.raises(ValueError):
+        parse_shortcut(shortcut)
+
+
+def test_create_hotkey_rejects_a_bad_shortcut():
+    assert create_hotkey("Hyper+A", backends=[X11Hotkey]) is None
+
+
+@pytest.fixture
+def xlib():
+    lib = load_xlib()
+    if lib is None:
+        pytest.skip("libX11 is not installed")
+    return lib
+
+
+@pytest.mark.parametrize("key, keysym", [
+    ("A", 0x61), ("7", 0x37), ("É", 0xE9), ("Ж", 0x01000436),
+    ("F12", 0xFFC9), ("Space", 0x20), ("Del", 0xFFFF), ("PgUp", 0xFF55), ("Esc", 0xFF1B),
+])
+def test_x11_keysym(xlib, key, keysym):
+    assert X11Hotkey.keysym(xlib, key) == keysym
+
+
+@pytest.fixture
+def display(app, xlib, monkeypatch):
+    if shutil.which("Xvfb") is None:
+        pytest.skip("Xvfb is not installed")
+    server = subprocess.Popen(["Xvfb", "-displayfd", "1", "-nolisten", "tcp"],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    number = server.stdout.readline().strip()
+    if not number:
+        server.kill()
+        pytest.skip("Xvfb did not start")
+    monkeypatch.setenv("DISPLAY", f":{number}")
+    yield app
+    server.kill()
+    server.wait()
+
+
+def test_x11_register_grabs_and_unregister_releases(display):
+    first = X11Hotkey()
+    assert first.register("Ctrl+Shift+F12")
+    assert first.shortcut == "Ctrl+Shift+F12"
+
+    # The key is grabbed: another client is refused it
+    second = X11Hotkey()
+    assert not second.register("Ctrl+Shift+F12")
+    assert second.register("Ctrl+Shift+F11")
+    second.unregister()
+
+    first.unregister()
+    assert first.shortcut is None
+    first.unregister() # a second call is harmless
+    # Released: it can be grabbed again
+    assert second.register("Ctrl+Shift+F12")
+    second.unregister()
@@ -0,0 +1,54 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from services.clock import SystemClock
+from ui.popup_pool import PopupPool
+from ui.popup_queue import PopupQueue
+
+
+def test_popup_is_placed_once_by_the_layout(app):
+    pool = PopupPool(warm=1)
+    pool.prewarm()
+    app.processEvents()
+    popup = pool._idle[0]
+    moves = []
+    original_move = popup.move
+    popup.move = lambda *args: moves.append(args) or original_move(*args)
+
+    assert pool.acquire("Title", "Body") is popup
+    assert len(moves) == 1
+    area = popup.screen().availableGeometry()
+    assert popup.geometry().right() == area.right() - pool.layout.margin
+    assert popup.geometry().bottom() == area.bottom() - pool.layout.margin
+    pool.clear()
+
+
+def test_eviction_goes_through_release(app):
+    pool = PopupPool(warm=0, max_visible=2)
+    released = []
+    pool.on_release = released.append
+    first = pool.acquire("1", "")
+    first.show()
+    second = pool.acquire("2", "")
+    second.show()
+
+    third = pool.acquire("3", "")
+    assert released == [first]
+    assert pool.visible() == [second, third]
+    assert not first.isVisible()
+    pool.clear()
+
+
+def test_queue_forgets_a_popup_evicted_by_the_pool(app):
+    queue = PopupQueue(SystemClock())
+    queue.show({"id": "a", "title": "Disk", "content": "", "type": "danger"})
+    assert "a" in queue._showing
+    # Other popups (e.g. a digest) take the remaining slots and then one more
+    for i in range(queue.popup_pool.max_visible):
+        queue.popup_pool.acquire(str(i), "").show()
+
+    assert "a" not in queue._showing
+    assert queue._showing_types["danger"] == 0
+    assert queue.show({"id": "a", "title": "Disk", "content": "", "type": "danger"}) # not taken as a duplicate
+    queue.popup_pool.clear()
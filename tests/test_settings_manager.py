@@ -0,0 +1,47 @@
+import pytest
+from storage.settings_manager import SettingsManager
+from storage.sqlite_backend import SqliteBackend
+
+
+def reminder(i):
+    return {"title": f"r{i}", "content": "", "type": "info", "frequency": "daily", "time": "09:00", "active": True}
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def open_store(request, tmp_path):
+    data_file = str(tmp_path / "__user_data.txt")
+
+    def open_store():
+        backend = SqliteBackend(str(tmp_path / "__user_data.db")) if request.param == "sqlite" else None
+        return SettingsManager(data_file=data_file, backend=backend)
+    return open_store
+
+
+def titles(store):
+    return [n["title"] for n in store.get_notifications()]
+
+
+def test_remove_keeps_order_in_memory_and_on_disk(open_store):
+    store = open_store()
+    ids = store.add_notifications([reminder(i) for i in range(6)])
+    store.remove_notification(ids[1])
+    store.remove_notifications([ids[4], ids[2]])
+    assert titles(store) == ["r0", "r3", "r5"]
+    store.close()
+    assert titles(open_store()) == ["r0", "r3", "r5"]
+
+
+def test_update_after_removals_replaces_the_right_one(open_store):
+    store = open_store()
+    ids = store.add_notifications([reminder(i) for i in range(6)])
+    store.update_notification(ids[5], reminder(5)) # index recorded before the removals
+    for notif_id in (ids[0], ids[2], ids[3]):
+        store.remove_notification(notif_id)
+    store.update_notification(ids[5], dict(reminder(5), title="five"))
+    store.update_notification(ids[1], dict(reminder(1), title="one"))
+    store.add_notification(reminder(6))
+    store.remove_notification(ids[4])
+    store.update_notification(ids[5], dict(reminder(5), title="FIVE"))
+    assert titles(store) == ["one", "FIVE", "r6"]
+    store.close()
+    assert titles(open_store()) == ["one", "FIVE", "r6"]
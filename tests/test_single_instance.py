@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("PyQt6.QtNetwork")
+
+from services.single_instance import parse_intent
+
+
+@pytest.mark.parametrize("argv, intent", [
+    ([], "show"),
+    (["--show"], "show"),
+    (["--add"], "add"),
+    (["--quit"], "quit"),
+    (["--tray"], "ping"),
+    (["--autostart"], "ping"),
+    (["--autostart", "--add"], "ping"),
+])
+def test_parse_intent(argv, intent):
+    assert parse_intent(argv) == intent
@@ -0,0 +1,25 @@
+"""A fresh launch reaches the tray (benchmarks/startup.py probe)"""
+import pytest
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from benchmarks.startup import DEFERRED, DEFERRED_TRAY, launch, main as startup_main, parse_importtime
+
+
+@pytest.mark.parametrize("app_args", [[], ["--tray"], ["--autostart"]])
+def test_fresh_launch_reaches_tray(app_args):
+    ready_ms, _, _ = launch(app_args=app_args)
+    assert ready_ms > 0
+
+
+@pytest.mark.parametrize("app_args", [[], ["--tray"]])
+def test_startup_within_budget(app_args):
+    # Median launch-to-tray under DEFAULT_BUDGET_MS, nothing in DEFERRED loaded before the tray
+    assert startup_main(["--runs", "3", "--top", "0", *app_args]) == 0
+
+
+@pytest.mark.parametrize("app_args", [["--tray"], ["--autostart"]])
+def test_tray_only_launch_builds_no_window(app_args):
+    _, _, stderr = launch(["-X", "importtime"], app_args)
+    modules = parse_importtime(stderr)
+    assert not [name for name in DEFERRED + DEFERRED_TRAY if name in modules]
@@ -0,0 +1,274 @@
+from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox,
+                             QDialog, QTextEdit, QDateTimeEdit, QSpinBox, QTimeEdit,
+                             QMessageBox, QColorDialog, QWidget)
+from PyQt6.QtCore import Qt, QDateTime, QTime
+from i18n.translator import translator
+from datetime import datetime
+
+class AddNotifDialog(QDialog):
+    COLOR_BUTTON_STYLE = "border-radius: 15px; border: 1px solid #eee !important; background-color: #eee;"
+
+    def __init__(self, parent=None, initial_data=None):
+        super().__init__(parent)
+        self.resize(420, 550)
+        self.initial_data = initial_data
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        
+        # Icon & Title Layout
+        title_layout = QHBoxLayout()
+        title_layout.setContentsMargins(0, 0, 0, 0)
+        
+        # Icon Selection
+        self.icon_combo = QComboBox()
+        self.icon_combo.setFixedSize(80, 40)
+        self.icon_combo.setStyleSheet("font-size: 20px;")
+        
+        self.EMOJI_OPTIONS = ["DEFAULT", "❤️", "📌", "⭐", "⏰", "📅", "📝", "✅", "⚠️", "🔥", "💡", "💰", "🎉", "✈️", "🍔", "💊", "💪", "🏠", "🚫"]
+        self.icon_combo.addItem("", "DEFAULT") # Default item
+        for emo in self.EMOJI_OPTIONS[1:]:
+            self.icon_combo.addItem(emo, emo)
+            
+        title_layout.addWidget(self.icon_combo)
+        
+        # Title Label
+        title_wrapper = QVBoxLayout()
+        title_wrapper.setSpacing(2)
+        title_wrapper.addWidget(QLabel(translator.t("label_title")))
+        title_layout.addLayout(title_wrapper)
+        
+        layout.addLayout(title_layout)
+        
+        self.title_input = QTextEdit()
+        self.title_input.setMaximumHeight(80)
+        layout.addWidget(self.title_input)
+        
+        # Content
+        layout.addWidget(QLabel(translator.t("label_content")))
+        self.content_input = QTextEdit()
+        self.content_input.setMaximumHeight(100)
+        layout.addWidget(self.content_input)
+        
+        # Type & Color
+        type_layout = QHBoxLayout()
+        type_layout.setContentsMargins(0, 0, 0, 0)
+        
+        type_wrapper = QVBoxLayout()
+        type_wrapper.setSpacing(2)
+        type_wrapper.addWidget(QLabel(translator.t("label_type")))
+        
+        self.type_combo = QComboBox()
+        self.type_combo.addItem(translator.t("notif_type_info"), "info")
+        self.type_combo.addItem(translator.t("notif_type_warning"), "warning")
+        self.type_combo.addItem(translator.t("notif_type_important"), "important")
+        self.type_combo.addItem(translator.t("notif_type_danger"), "danger")
+        type_wrapper.addWidget(self.type_combo) # Add to wrapper
+        
+        type_layout.addLayout(type_wrapper)
+        
+        # Color Picker Button
+        self.custom_color = None
+        self.btn_color = QPushButton()
+        self.btn_color.setFixedSize(50, 40) # Match height roughly with combo
+        self.btn_color.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_color.clicked.connect(self.pick_color)
+        self.btn_color.setStyleSheet(self.COLOR_BUTTON_STYLE)
+        
+        # Color Label Wrapper
+        color_wrapper = QVBoxLayout()
+        color_wrapper.setSpacing(2)
+        color_wrapper.addWidget(QLabel(translator.t("label_color")))
+        color_wrapper.addWidget(self.btn_color)
+        
+        type_layout.addSpacing(10)
+        type_layout.addLayout(color_wrapper)
+        
+        layout.addLayout(type_layout)
+        
+        # Frequency
+        layout.addWidget(QLabel(translator.t("label_frequency")))
+        self.freq_combo = QComboBox()
+        self.freq_combo.addItem(translator.t("notif_freq_once"), "once")
+        self.freq_combo.addItem(translator.t("notif_freq_daily"), "daily")
+        self.freq_combo.addItem(translator.t("notif_freq_repeat"), "repeat")
+        self.freq_combo.currentIndexChanged.connect(self.on_freq_changed)
+        layout.addWidget(self.freq_combo)
+        
+        # Time Inputs
+        self.time_stack = QWidget()
+        self.time_stack_layout = QVBoxLayout(self.time_stack)
+        self.time_stack_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.datetime_picker = QDateTimeEdit(QDateTime.currentDateTime().addSecs(60))
+        self.datetime_picker.setCalendarPopup(True)
+        self.datetime_picker.setDisplayFormat(translator.t("date_display_format"))
+        self.time_stack_layout.addWidget(self.datetime_picker)
+        
+        self.time_picker = QTimeEdit()
+        self.time_picker.hide()
+        self.time_stack_layout.addWidget(self.time_picker)
+        
+        self.repeat_spin = QSpinBox()
+        self.repeat_spin.setRange(1, 1440)
+        self.repeat_spin.setSuffix(f" {translator.t('notif_freq_repeat')}")
+        self.repeat_spin.hide()
+        self.time_stack_layout.addWidget(self.repeat_spin)
+        
+        layout.addWidget(self.time_stack)
+        
+        # Catch-up policy for recurring reminders missed during sleep
+        self.catch_up_label = QLabel(translator.t("label_catch_up"))
+        layout.addWidget(self.catch_up_label)
+        self.catch_up_combo = QComboBox()
+        self.catch_up_combo.addItem(translator.t("catch_up_once"), "once")
+        self.catch_up_combo.addItem(translator.t("catch_up_all"), "all")
+        self.catch_up_combo.addItem(translator.t("catch_up_skip"), "skip")
+        layout.addWidget(self.catch_up_combo)
+        self.catch_up_label.hide()
+        self.catch_up_combo.hide()
+        
+        # Actions
+        btn_layout = QHBoxLayout()
+        btn_layout.setContentsMargins(0, 10, 0, 0)
+        save_btn = QPushButton(translator.t("btn_save"))
+        save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        save_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton(translator.t("btn_cancel"))
+        cancel_btn.setFixedSize(50, 50)
+        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        cancel_btn.clicked.connect(self.reject)
+        # Style cancel button with red background
+        cancel_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #FFFFFF; 
+                color: #B91C1C; 
+                border-radius: 14px; 
+                border: 2px solid white;
+                font-size: 12px;
+                margin: 1px;
+                padding: 1px;
+            }
+            QPushButton:hover { background-color: #FECACA; }
+        """)
+        
+        btn_layout.addStretch()
+        btn_layout.addWidget(cancel_btn)
+        btn_layout.addWidget(save_btn)
+        btn_layout.addSpacing(5)
+
+        layout.addLayout(btn_layout)
+
+        self.reset(initial_data)
+
+    def reset(self, initial_data=None):
+        """Empty form for a new reminder, or `initial_data` to edit; lets MainWindow reuse one dialog"""
+        self.initial_data = initial_data
+        self.setWindowTitle(translator.t("btn_add") if not initial_data else "Edit Notification")
+        self.title_input.clear()
+        self.content_input.clear()
+        self.icon_combo.setCurrentIndex(0)
+        self.type_combo.setCurrentIndex(0)
+        self.freq_combo.setCurrentIndex(0)
+        self.datetime_picker.setDateTime(QDateTime.currentDateTime().addSecs(60))
+        self.time_picker.setTime(QTime(0, 0))
+        self.repeat_spin.setValue(self.repeat_spin.minimum())
+        self.catch_up_combo.setCurrentIndex(0)
+        self.custom_color = None
+        self.btn_color.setStyleSheet(self.COLOR_BUTTON_STYLE)
+        self.on_freq_changed()
+        if initial_data:
+            self.load_data(initial_data)
+        # Takes effect when the dialog is shown
+        self.title_input.setFocus()
+
+    def accept(self):
+        title = self.title_input.toPlainText().strip()
+        if not title:
+            return
+            
+        if len(title) > 125:
+            QMessageBox.warning(self, translator.t("msg_error"), translator.t("error_title_length"))
+            return
+            
+        if title.count('\n') > 3:
+            QMessageBox.warning(self, translator.t("msg_error"), translator.t("error_title_lines"))
+            return
+            
+        super().accept()
+
+    def load_data(self, data):
+        self.title_input.setText(data.get("title", ""))
+        self.content_input.setText(data.get("content", ""))
+        
+        idx = self.type_combo.findData(data.get("type"))
+        if idx >= 0: self.type_combo.setCurrentIndex(idx)
+        
+        freq = data.get("freq")
+        idx = self.freq_combo.findData(freq)
+        if idx >= 0: self.freq_combo.setCurrentIndex(idx)
+        
+        if freq == "once":
+            self.datetime_picker.setDateTime(QDateTime.fromString(data.get("time"), Qt.DateFormat.ISODate))
+        elif freq == "daily":
+            # Fix for daily time format HH:mm
+            t = datetime.strptime(data.get("time"), "%H:%M")
+            self.time_picker.setTime(QDateTime.currentDateTime().replace(hour=t.hour, minute=t.minute).time())
+            
+        icon_str = data.get("icon", "")
+        idx = self.icon_combo.findData(icon_str)
+        if idx >= 0: self.icon_combo.setCurrentIndex(idx)
+        elif freq == "repeat":
+            self.repeat_spin.setValue(data.get("repeat_min", 1))
+            
+        idx = self.catch_up_combo.findData(data.get("catch_up", "once"))
+        if idx >= 0: self.catch_up_combo.setCurrentIndex(idx)
+            
+        # Load Color
+        self.custom_color = data.get("color")
+        if self.custom_color:
+            self.btn_color.setStyleSheet(f"background-color: {self.custom_color}; border-radius: 15px; border: 1px solid #eee;")
+        
+        self.on_freq_changed()
+
+    def pick_color(self):
+        color = QColorDialog.getColor()
+        if color.isValid():
+            self.custom_color = color.name()
+            self.btn_color.setStyleSheet(f"background-color: {self.custom_color}; border-radius: 15px; border: 1px solid #eee;")
+
+    def on_freq_changed(self):
+        freq = self.freq_combo.currentData()
+        self.datetime_picker.setVisible(freq == "once")
+        self.time_picker.setVisible(freq == "daily")
+        self.repeat_spin.setVisible(freq == "repeat")
+        self.catch_up_label.setVisible(freq != "once")
+        self.catch_up_combo.setVisible(freq != "once")
+
+    def get_data(self):
+        freq = self.freq_combo.currentData()
+        time_val = ""
+        if freq == "once":
+            time_val = self.datetime_picker.dateTime().toPyDateTime().isoformat()
+        elif freq == "daily":
+            time_val = self.time_picker.time().toString("HH:mm")
+            
+        now_iso = datetime.now().isoformat()
+        data = {
+            "title": self.title_input.toPlainText().strip(),
+            "content": self.content_input.toPlainText(),
+            "title": self.title_input.toPlainText().strip(),
+            "content": self.content_input.toPlainText(),
+            "type": self.type_combo.currentData(),
+            "icon": self.icon_combo.currentData(),
+            "color": self.custom_color,
+            "freq": freq,
+            "time": time_val,
+            "repeat_min": self.repeat_spin.value(),
+            "catch_up": self.catch_up_combo.currentData(),
+            "active": True, # Always activate on save/edit
+            "created_at": self.initial_data.get("created_at", now_iso) if self.initial_data else now_iso,
+            "updated_at": now_iso,
+            "last_triggered": None # Reset last_triggered to ensure it re-triggers if conditions met
+        }
+        return data
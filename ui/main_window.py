@@ -1,256 +1,46 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QListWidget, QListWidgetItem, QTabWidget,
-                             QLabel, QComboBox, QCheckBox, QDialog, QLineEdit, 
-                             QTextEdit, QDateTimeEdit, QSpinBox, QTimeEdit, 
+                             QPushButton, QTabWidget, QLabel, QComboBox, QCheckBox,
                              QSystemTrayIcon, QMenu, QApplication, QMessageBox,
-                             QKeySequenceEdit, QFileDialog, QColorDialog, QSizePolicy)
-from PyQt6.QtCore import Qt, QDateTime, QSize, QTimer, pyqtSignal
-import keyboard
-from PyQt6.QtGui import QIcon, QAction, QKeySequence, QShortcut, QColor
-import shutil
+                             QKeySequenceEdit)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon, QAction, QKeySequence
 from i18n.translator import translator
-from services.autostart_service import AutostartService
-import ui.styles as styles
 from datetime import datetime, timedelta
+import ctypes
 import os
 import sys
-import random
-
-class AddNotifDialog(QDialog):
-    def __init__(self, parent=None, initial_data=None):
-        super().__init__(parent)
-        self.setWindowTitle(translator.t("btn_add") if not initial_data else "Edit Notification")
-        self.resize(420, 550)
-        self.initial_data = initial_data
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(12)
-        
-        # Icon & Title Layout
-        title_layout = QHBoxLayout()
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Icon Selection
-        self.icon_combo = QComboBox()
-        self.icon_combo.setFixedSize(80, 40)
-        self.icon_combo.setStyleSheet("font-size: 20px;")
-        
-        self.EMOJI_OPTIONS = ["DEFAULT", "❤️", "📌", "⭐", "⏰", "📅", "📝", "✅", "⚠️", "🔥", "💡", "💰", "🎉", "✈️", "🍔", "💊", "💪", "🏠", "🚫"]
-        self.icon_combo.addItem("", "DEFAULT") # Default item
-        for emo in self.EMOJI_OPTIONS[1:]:
-            self.icon_combo.addItem(emo, emo)
-            
-        title_layout.addWidget(self.icon_combo)
-        
-        # Title Label
-        title_wrapper = QVBoxLayout()
-        title_wrapper.setSpacing(2)
-        title_wrapper.addWidget(QLabel(translator.t("label_title")))
-        title_layout.addLayout(title_wrapper)
-        
-        layout.addLayout(title_layout)
-        
-        self.title_input = QTextEdit()
-        self.title_input.setMaximumHeight(80)
-        layout.addWidget(self.title_input)
-        
-        # Content
-        layout.addWidget(QLabel(translator.t("label_content")))
-        self.content_input = QTextEdit()
-        self.content_input.setMaximumHeight(100)
-        layout.addWidget(self.content_input)
-        
-        # Type & Color
-        type_layout = QHBoxLayout()
-        type_layout.setContentsMargins(0, 0, 0, 0)
-        
-        type_wrapper = QVBoxLayout()
-        type_wrapper.setSpacing(2)
-        type_wrapper.addWidget(QLabel(translator.t("label_type")))
-        
-        self.type_combo = QComboBox()
-        self.type_combo.addItem(translator.t("notif_type_info"), "info")
-        self.type_combo.addItem(translator.t("notif_type_warning"), "warning")
-        self.type_combo.addItem(translator.t("notif_type_important"), "important")
-        self.type_combo.addItem(translator.t("notif_type_danger"), "danger")
-        type_wrapper.addWidget(self.type_combo) # Add to wrapper
-        
-        type_layout.addLayout(type_wrapper)
-        
-        # Color Picker Button
-        self.custom_color = None
-        self.btn_color = QPushButton()
-        self.btn_color.setFixedSize(50, 40) # Match height roughly with combo
-        self.btn_color.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.btn_color.clicked.connect(self.pick_color)
-        self.btn_color.setStyleSheet("border-radius: 15px; border: 1px solid #eee !important; background-color: #eee;")
-        
-        # Color Label Wrapper
-        color_wrapper = QVBoxLayout()
-        color_wrapper.setSpacing(2)
-        color_wrapper.addWidget(QLabel(translator.t("label_color")))
-        color_wrapper.addWidget(self.btn_color)
-        
-        type_layout.addSpacing(10)
-        type_layout.addLayout(color_wrapper)
-        
-        layout.addLayout(type_layout)
-        
-        # Frequency
-        layout.addWidget(QLabel(translator.t("label_frequency")))
-        self.freq_combo = QComboBox()
-        self.freq_combo.addItem(translator.t("notif_freq_once"), "once")
-        self.freq_combo.addItem(translator.t("notif_freq_daily"), "daily")
-        self.freq_combo.addItem(translator.t("notif_freq_repeat"), "repeat")
-        self.freq_combo.currentIndexChanged.connect(self.on_freq_changed)
-        layout.addWidget(self.freq_combo)
-        
-        # Time Inputs
-        self.time_stack = QWidget()
-        self.time_stack_layout = QVBoxLayout(self.time_stack)
-        self.time_stack_layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.datetime_picker = QDateTimeEdit(QDateTime.currentDateTime().addSecs(60))
-        self.datetime_picker.setCalendarPopup(True)
-        self.datetime_picker.setDisplayFormat(translator.t("date_display_format"))
-        self.time_stack_layout.addWidget(self.datetime_picker)
-        
-        self.time_picker = QTimeEdit()
-        self.time_picker.hide()
-        self.time_stack_layout.addWidget(self.time_picker)
-        
-        self.repeat_spin = QSpinBox()
-        self.repeat_spin.setRange(1, 1440)
-        self.repeat_spin.setSuffix(f" {translator.t('notif_freq_repeat')}")
-        self.repeat_spin.hide()
-        self.time_stack_layout.addWidget(self.repeat_spin)
-        
-        layout.addWidget(self.time_stack)
-        
-        # Actions
-        btn_layout = QHBoxLayout()
-        btn_layout.setContentsMargins(0, 10, 0, 0)
-        save_btn = QPushButton(translator.t("btn_save"))
-        save_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        save_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton(translator.t("btn_cancel"))
-        cancel_btn.setFixedSize(50, 50)
-        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.clicked.connect(self.reject)
-        # Style cancel button with red background
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFFFFF; 
-                color: #B91C1C; 
-                border-radius: 14px; 
-                border: 2px solid white;
-                font-size: 12px;
-                margin: 1px;
-                padding: 1px;
-            }
-            QPushButton:hover { background-color: #FECACA; }
-        """)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(save_btn)
-        btn_layout.addSpacing(5)
 
-        layout.addLayout(btn_layout)
+# The window contents (list, styles), the add/edit dialog, the keyboard hook,
+# file dialogs and autostart are imported where first used, so none of them
+# delays the tray icon
 
-        if initial_data:
-            self.load_data(initial_data)
+def trim_memory():
+    """Hand freed heap pages back to the OS (glibc keeps them otherwise)"""
+    if sys.platform.startswith("linux"):
+        try:
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
 
-    def accept(self):
-        title = self.title_input.toPlainText().strip()
-        if not title:
-            return
-            
-        if len(title) > 125:
-            QMessageBox.warning(self, translator.t("msg_error"), translator.t("error_title_length"))
-            return
-            
-        if title.count('\n') > 3:
-            QMessageBox.warning(self, translator.t("msg_error"), translator.t("error_title_lines"))
-            return
-            
-        super().accept()
+class MainWindow(QMainWindow):
+    # Hidden this long, the window's widgets are released; the tray and the add dialog stay
+    RELEASE_UI_AFTER_MS = 5 * 60 * 1000
 
-    def load_data(self, data):
-        self.title_input.setText(data.get("title", ""))
-        self.content_input.setText(data.get("content", ""))
-        
-        idx = self.type_combo.findData(data.get("type"))
-        if idx >= 0: self.type_combo.setCurrentIndex(idx)
-        
-        freq = data.get("freq")
-        idx = self.freq_combo.findData(freq)
-        if idx >= 0: self.freq_combo.setCurrentIndex(idx)
-        
-        if freq == "once":
-            self.datetime_picker.setDateTime(QDateTime.fromString(data.get("time"), Qt.DateFormat.ISODate))
-        elif freq == "daily":
-            # Fix for daily time format HH:mm
-            t = datetime.strptime(data.get("time"), "%H:%M")
-            self.time_picker.setTime(QDateTime.currentDateTime().replace(hour=t.hour, minute=t.minute).time())
-            
-        icon_str = data.get("icon", "")
-        idx = self.icon_combo.findData(icon_str)
-        if idx >= 0: self.icon_combo.setCurrentIndex(idx)
-        elif freq == "repeat":
-            self.repeat_spin.setValue(data.get("repeat_min", 1))
-            
-        # Load Color
-        self.custom_color = data.get("color")
-        if self.custom_color:
-            self.btn_color.setStyleSheet(f"background-color: {self.custom_color}; border-radius: 15px; border: 1px solid #eee;")
-        
-        self.on_freq_changed()
-
-    def pick_color(self):
-        color = QColorDialog.getColor()
-        if color.isValid():
-            self.custom_color = color.name()
-            self.btn_color.setStyleSheet(f"background-color: {self.custom_color}; border-radius: 15px; border: 1px solid #eee;")
-
-    def on_freq_changed(self):
-        freq = self.freq_combo.currentData()
-        self.datetime_picker.setVisible(freq == "once")
-        self.time_picker.setVisible(freq == "daily")
-        self.repeat_spin.setVisible(freq == "repeat")
-
-    def get_data(self):
-        freq = self.freq_combo.currentData()
-        time_val = ""
-        if freq == "once":
-            time_val = self.datetime_picker.dateTime().toPyDateTime().isoformat()
-        elif freq == "daily":
-            time_val = self.time_picker.time().toString("HH:mm")
-            
-        now_iso = datetime.now().isoformat()
-        data = {
-            "title": self.title_input.toPlainText().strip(),
-            "content": self.content_input.toPlainText(),
-            "title": self.title_input.toPlainText().strip(),
-            "content": self.content_input.toPlainText(),
-            "type": self.type_combo.currentData(),
-            "icon": self.icon_combo.currentData(),
-            "color": self.custom_color,
-            "freq": freq,
-            "time": time_val,
-            "repeat_min": self.repeat_spin.value(),
-            "active": True, # Always activate on save/edit
-            "created_at": self.initial_data.get("created_at", now_iso) if self.initial_data else now_iso,
-            "updated_at": now_iso,
-            "last_triggered": None # Reset last_triggered to ensure it re-triggers if conditions met
-        }
-        return data
+    def __init__(self, settings_manager, tray=True, hotkey=True):
+        """`settings_manager` may also be a RemoteStore (window process of the daemon mode, no tray).
 
-class MainWindow(QMainWindow):
-    def __init__(self, settings_manager):
+        With `hotkey` False the shortcut setting is only stored; the daemon registers it.
+        """
         super().__init__()
         self.settings_manager = settings_manager
         
+        # Built on first show (ensure_ui), released again after RELEASE_UI_AFTER_MS hidden
+        self.ui_built = False
+        self.store_events = None
+        self.release_timer = QTimer(self)
+        self.release_timer.setSingleShot(True)
+        self.release_timer.timeout.connect(self.release_ui)
+        
         # Connect global hotkey signal
         self.request_open_add_dialog.connect(self.add_notification)
         
@@ -259,10 +49,14 @@ class MainWindow(QMainWindow):
         if os.path.exists(self.logo_path):
             self.setWindowIcon(QIcon(self.logo_path))
         
-        self.init_tray()
-        self.init_ui()
-        self.setup_global_shortcuts()
-        self.apply_theme()
+        self.tray_icon = None
+        if tray:
+            self.init_tray()
+        # The global hotkey is registered later by main.py (setup_global_shortcuts), off the start-up path
+        self.owns_hotkey = hotkey
+        self.hotkey = None
+        # Add/edit dialog, built once (prewarm_add_dialog) and reset for every use
+        self.add_dialog = None
 
     def get_resource_path(self, relative_path):
         """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -304,29 +98,83 @@ class MainWindow(QMainWindow):
             else:
                 self.show_normal()
 
+    def ensure_ui(self):
+        """Build the window contents if they aren't (tray-only start, or released while hidden)"""
+        if self.ui_built:
+            return
+        from services.store_events import StoreEvents
+        # Store changes, batched per event-loop turn, patch the list rows. No Qt
+        # parent: once released, a flush still pending just finds no list
+        self.store_events = StoreEvents(self.settings_manager)
+        self.store_events.changed.connect(self.on_store_changed)
+        self.init_ui()
+        self.ui_built = True
+        self.apply_theme()
+
+    def release_ui(self):
+        """Drop the widget tree of the hidden window, keeping the tray and the services"""
+        if not self.ui_built or self.isVisible():
+            return
+        if QApplication.activeModalWidget() is not None:
+            # A dialog's event loop may be running on top of a list callback; try again later
+            self.release_timer.start(self.RELEASE_UI_AFTER_MS)
+            return
+        self.store_events.close()
+        self.store_events = None
+        central_widget = self.takeCentralWidget()
+        if central_widget is not None:
+            central_widget.deleteLater()
+        for name in ("layout", "tabs", "notif_tab", "notif_container_layout", "list_container",
+                     "list_container_layout", "notif_model", "notif_list", "notif_delegate", "watermark",
+                     "floating_add_btn", "settings_tab", "settings_layout", "lang_combo", "theme_combo",
+                     "autostart_chk", "shortcut_input", "btn_import", "btn_backup"):
+            self.__dict__.pop(name, None)
+        self.ui_built = False
+        # deleteLater runs on the next event-loop turn; trim after it
+        QTimer.singleShot(0, trim_memory)
+
     def show_normal(self):
+        self.ensure_ui()
         self.show()
         self.setWindowState(Qt.WindowState.WindowActive)
         self.activateWindow()
 
     def exit_app(self):
-        self.tray_icon.hide()
+        if self.hotkey is not None:
+            self.hotkey.unregister()
+        if self.tray_icon is not None:
+            self.tray_icon.hide()
         QApplication.quit()
 
     def closeEvent(self, event):
-        if self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
             self.hide()
             event.ignore()
         else:
             event.accept()
 
+    def showEvent(self, event):
+        self.ensure_ui()
+        super().showEvent(event)
+        self.release_timer.stop()
+        # Catch up on changes that happened while hidden in the tray
+        self.notif_model.set_active(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if self.ui_built:
+            self.notif_model.set_active(False)
+            self.release_timer.start(self.RELEASE_UI_AFTER_MS)
+
     def changeEvent(self, event):
         if event.type() == event.Type.WindowStateChange:
-            if self.isMinimized():
+            if self.isMinimized() and self.tray_icon is not None:
                 self.hide()
                 event.ignore()
 
     def init_ui(self):
+        from ui.notification_list import NotificationDelegate, NotificationListModel, NotificationListView
+        import random
         self.setWindowTitle(translator.t("app_title"))
         self.resize(550, 650)
         
@@ -348,9 +196,17 @@ class MainWindow(QMainWindow):
         self.list_container_layout = QVBoxLayout(self.list_container)
         self.list_container_layout.setContentsMargins(0, 10, 0, 0)
         
-        self.notif_list = QListWidget()
-        self.notif_list.setSpacing(8)
-        self.notif_list.itemClicked.connect(self.on_notif_clicked)
+        # Model/delegate list: rows are painted, only visible ones cost anything
+        self.notif_list = NotificationListView()
+        # Owned by the view, so it goes with the widget tree (language change, release_ui)
+        self.notif_model = NotificationListModel(self.settings_manager, self.notif_list)
+        self.notif_list.setModel(self.notif_model)
+        self.notif_delegate = NotificationDelegate(self.notif_details, self.notif_list)
+        self.notif_delegate.edit_requested.connect(self.edit_notification)
+        self.notif_delegate.toggle_requested.connect(self.toggle_notification)
+        self.notif_delegate.delete_requested.connect(self.delete_notification)
+        self.notif_list.setItemDelegate(self.notif_delegate)
+        self.notif_model.set_active(self.isVisible())
         self.list_container_layout.addWidget(self.notif_list)
         
         # Watermark Background Text
@@ -460,8 +316,13 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(10, self.update_floating_btn_pos)
 
     def apply_theme(self):
+        if not self.ui_built:
+            return # applied when the window is built
+        import ui.styles as styles
         theme = self.settings_manager.get_setting("theme", "default")
-        self.setStyleSheet(styles.get_main_style(theme))
+        styles.apply_style(self, styles.get_main_style(theme))
+        self.notif_delegate.set_theme(theme)
+        self.notif_list.viewport().update()
 
     def change_theme(self, theme):
         self.settings_manager.set_setting("theme", theme)
@@ -473,71 +334,55 @@ class MainWindow(QMainWindow):
         translator.set_language(lang)
         self.init_ui()
         self.apply_theme()
+        if self.add_dialog is not None:
+            self.discard_add_dialog()
+            QTimer.singleShot(0, self.prewarm_add_dialog)
 
     def toggle_autostart(self, checked):
+        from services.autostart_service import AutostartService
         AutostartService.set_autostart(checked)
         self.settings_manager.set_setting("autostart", checked)
 
     def load_notification_list(self):
-        self.notif_list.clear()
-        notifications = self.settings_manager.get_notifications()
-        
-        # Sort by updated_at or created_at descending
-        sorted_notifs = sorted(
-            enumerate(notifications), 
-            key=lambda x: x[1].get("updated_at", x[1].get("created_at", "")), 
-            reverse=True
-        )
-        
-        for ui_idx, (real_idx, notif) in enumerate(sorted_notifs):
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, real_idx) # Store original index
-            widget = self.create_notif_widget(real_idx, notif)
-            item.setSizeHint(widget.sizeHint())
-            self.notif_list.addItem(item)
-            self.notif_list.setItemWidget(item, widget)
+        self.notif_model.reload()
 
-    def on_notif_clicked(self, item):
-        real_idx = item.data(Qt.ItemDataRole.UserRole)
-        if real_idx is not None:
-            self.edit_notification(real_idx)
+    def on_store_changed(self, changes):
+        if self.ui_built:
+            self.notif_model.apply_changes(changes)
 
     def update_shortcut(self, key_sequence):
         shortcut_str = key_sequence.toString()
         self.settings_manager.set_setting("shortcut", shortcut_str)
-        self.setup_global_shortcuts()
+        if self.owns_hotkey:
+            self.setup_global_shortcuts()
 
     request_open_add_dialog = pyqtSignal()
 
     def setup_global_shortcuts(self):
-        # Clean old shortcut if exists
-        try:
-            keyboard.unhook_all_hotkeys()
-        except:
-            pass
+        from services.hotkeys import create_hotkey
+        # Release the old shortcut if one is registered
+        if self.hotkey is not None:
+            self.hotkey.unregister()
+            self.hotkey = None
             
         shortcut_str = self.settings_manager.get_setting("shortcut", "Ctrl+Shift+A")
         
         if not shortcut_str or shortcut_str.strip() == "":
             return
 
-        # Convert to keyboard library format
-        # QKeySequence uses "+" separator which acts well with keyboard lib
-        hotkey = shortcut_str.lower().replace("meta", "windows")
-        
-        try:
-            # use a lambda or direct emit to ensure it works
-            keyboard.add_hotkey(hotkey, self.request_open_add_dialog.emit)
-        except Exception as e:
-            print(f"Failed to set global hotkey '{hotkey}': {e}")
+        # Native backend (RegisterHotKey / XGrabKey) where available, the keyboard hook otherwise
+        self.hotkey = create_hotkey(shortcut_str, parent=self)
+        if self.hotkey is not None:
+            self.hotkey.activated.connect(self.request_open_add_dialog.emit)
 
     def backup_data(self):
+        from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self, translator.t("msg_backup_title"), "__user_data_backup.txt", "Text Files (*.txt)"
         )
         if file_path:
             try:
-                shutil.copy2(self.settings_manager.DATA_FILE, file_path)
+                self.settings_manager.backup_data(file_path)
                 QMessageBox.information(self, translator.t("msg_success_title"), translator.t("msg_backup_success"))
             except Exception as e:
                 QMessageBox.critical(self, translator.t("msg_error_title"), f"Backup failed: {str(e)}")
@@ -547,15 +392,13 @@ class MainWindow(QMainWindow):
                                      QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
+            from PyQt6.QtWidgets import QFileDialog
             file_path, _ = QFileDialog.getOpenFileName(
                 self, translator.t("msg_import_title"), "", "Text Files (*.txt)"
             )
             if file_path:
                 try:
-                    shutil.copy2(file_path, self.settings_manager.DATA_FILE)
-                    # Reload data
-                    self.settings_manager.data = self.settings_manager._load_data()
-                    self.load_notification_list()
+                    self.settings_manager.import_data(file_path)
                     QMessageBox.information(self, translator.t("msg_success_title"), translator.t("msg_import_success"))
                 except Exception as e:
                     QMessageBox.critical(self, translator.t("msg_error_title"), f"Import failed: {str(e)}")
@@ -565,7 +408,7 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(50, self.update_floating_btn_pos)
 
     def update_floating_btn_pos(self):
-        if not hasattr(self, 'floating_add_btn') or self.floating_add_btn is None:
+        if not self.ui_built:
             return
             
         tab_rect = self.notif_tab.rect()
@@ -602,106 +445,52 @@ class MainWindow(QMainWindow):
             return time_str
         return time_str
 
-    def create_notif_widget(self, index, notif):
-        widget = QWidget()
-        widget.setObjectName("NotificationCard")
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(15, 12, 15, 12)
-        layout.setSpacing(15)
-        
-        accent = {"danger": "#EF4444", "important": "#F59E0B", "warning": "#F59E0B", "info": "#3B82F6"}.get(notif['type'], "#3B82F6")
-        
-        indicator = QWidget()
-        indicator.setFixedSize(6, 40)
-        indicator.setStyleSheet(f"background-color: {accent}; border-radius: 3px;")
-        layout.addWidget(indicator)
-        
-        # Emoji Icon (if present)
-        if notif.get("icon") and notif.get("icon") != "DEFAULT":
-            emoji_lbl = QLabel(notif["icon"])
-            emoji_lbl.setStyleSheet("font-size: 24px; margin-right: 5px;")
-            layout.addWidget(emoji_lbl)
-        
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-        
-        title = QLabel(notif['title'])
-        title.setStyleSheet("font-weight: 700; font-size: 14px;")
-        title.setWordWrap(True)
-        
+    def notif_details(self, notif):
+        """Second line of a notification row: type • time • status"""
         time_display = self.format_time(notif['time'], notif['freq'])
         if notif['freq'] == 'repeat':
             time_display = f"Every {notif['repeat_min']} min"
             
         status_text = translator.t("status_running") if notif['active'] else translator.t("status_disabled")
-        details = QLabel(f"{translator.t('notif_type_' + notif['type'])} • {time_display} • {status_text}")
-        details.setStyleSheet("color: #64748B; font-size: 12px;")
-        details.setWordWrap(True)
-        
-        info_layout.addWidget(title)
-        info_layout.addWidget(details)
-        layout.addLayout(info_layout, 1) # Give priority to text layout
-        
-        # Actions
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(10)
-        
-        # Status Circle Toggle Button
-        toggle_btn = QPushButton()
-        toggle_btn.setFixedSize(28, 28)
-        toggle_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        status_color = '#10B981' if notif['active'] else '#94A3B8'
-        status_tip = translator.t("btn_off") if notif['active'] else translator.t("btn_on")
-        toggle_btn.setToolTip(status_tip)
-        
-        toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {status_color};
-                border-radius: 14px;
-                border: 2px solid white;
-            }}
-            QPushButton:hover {{
-                border-color: {status_color}dd;
-            }}
-        """)
-        toggle_btn.clicked.connect(lambda: self.toggle_notification(index))
-        actions_layout.addWidget(toggle_btn)
-
-        # Circular Delete Button
-        btn_del = QPushButton(translator.t("btn_delete_short"))
-        btn_del.setFixedSize(50, 50)
-        btn_del.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_del.setToolTip(translator.t("btn_delete"))
-        btn_del.setStyleSheet("""
-            QPushButton { 
-                background-color: #FFFFFF; 
-                color: #B91C1C; 
-                border-radius: 14px; 
-                border: 2px solid white;
-                font-size: 12px;
-                margin: 1px;
-                padding: 1px;
-            }
-            QPushButton:hover { background-color: #FECACA; }
-        """)
-        btn_del.clicked.connect(lambda: self.delete_notification(index))
-        actions_layout.addWidget(btn_del)
-        
-        layout.addLayout(actions_layout)
-        return widget
+        return f"{translator.t('notif_type_' + notif['type'])} • {time_display} • {status_text}"
+
+    def prewarm_add_dialog(self):
+        """Build the add/edit dialog ahead of the first shortcut press, so opening it only resets fields"""
+        if self.add_dialog is not None:
+            return
+        from ui.add_notif_dialog import AddNotifDialog
+        self.add_dialog = AddNotifDialog(self)
+        # Native window, style polish, layout and fonts now rather than on first show
+        self.add_dialog.winId()
+        self.add_dialog.grab()
+
+    def discard_add_dialog(self):
+        """Drop the pre-built dialog (e.g. its texts are in the old language)"""
+        if self.add_dialog is not None:
+            self.add_dialog.deleteLater()
+            self.add_dialog = None
+
+    def open_add_dialog(self, initial_data=None):
+        self.prewarm_add_dialog()
+        self.add_dialog.reset(initial_data)
+        return self.add_dialog
 
     def add_notification(self):
-        dialog = AddNotifDialog(self)
+        if self.add_dialog is not None and self.add_dialog.isVisible():
+            # Shortcut pressed again while it is open: bring it back, keeping what was typed
+            self.add_dialog.raise_()
+            self.add_dialog.activateWindow()
+            return
+        dialog = self.open_add_dialog()
         if dialog.exec():
             data = dialog.get_data()
             if data["title"]:
                 self.settings_manager.add_notification(data)
-                self.load_notification_list()
 
-    def edit_notification(self, index):
-        notifs = self.settings_manager.get_notifications()
-        if 0 <= index < len(notifs):
-            dialog = AddNotifDialog(self, initial_data=notifs[index])
+    def edit_notification(self, notif_id):
+        notif = self.settings_manager.get_notification(notif_id)
+        if notif is not None:
+            dialog = self.open_add_dialog(notif)
             if dialog.exec():
                 data = dialog.get_data()
                 
@@ -716,25 +505,26 @@ class MainWindow(QMainWindow):
                     except:
                         pass
 
-                self.settings_manager.update_notification(index, data)
-                self.load_notification_list()
+                self.settings_manager.update_notification(notif_id, data)
 
-    def toggle_notification(self, index):
-        notifs = self.settings_manager.get_notifications()
-        notif = notifs[index]
-        notif['active'] = not notif['active']
-        notif['updated_at'] = datetime.now().isoformat()
+    def toggle_notification(self, notif_id):
+        notif = self.settings_manager.get_notification(notif_id)
+        if notif is None:
+            return
+        fields = {
+            'active': not notif['active'],
+            'updated_at': datetime.now().isoformat()
+        }
         
         # If enabling a "once" task, auto-set time to now + 1 minute
-        if notif['active'] and notif.get('freq') == 'once':
+        if fields['active'] and notif.get('freq') == 'once':
             new_time = datetime.now() + timedelta(minutes=1)
-            notif['time'] = new_time.isoformat()
+            fields['time'] = new_time.isoformat()
             # Also reset triggered state so it runs again
-            notif['last_triggered'] = None
+            fields['last_triggered'] = None
             
-        self.settings_manager.update_notification(index, notif)
-        self.load_notification_list()
+        # Journaled, so toggling doesn't rewrite the whole data file
+        self.settings_manager.patch_notification(notif_id, fields, op="toggle")
 
-    def delete_notification(self, index):
-        self.settings_manager.remove_notification(index)
-        self.load_notification_list()
+    def delete_notification(self, notif_id):
+        self.settings_manager.remove_notification(notif_id)
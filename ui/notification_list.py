@@ -0,0 +1,338 @@
+from PyQt6.QtWidgets import QAbstractItemView, QListView, QStyledItemDelegate, QToolTip
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from i18n.translator import translator
+import ui.styles as styles
+
+ACCENT_COLORS = {"danger": "#EF4444", "important": "#F59E0B", "warning": "#F59E0B", "info": "#3B82F6"}
+
+
+def sort_key(notif):
+    return notif.get("updated_at", notif.get("created_at", ""))
+
+
+class NotificationListModel(QAbstractListModel):
+    """Notifications of a SettingsManager, newest first.
+
+    Rows hold only notification ids; the dicts are looked up in the store when
+    a visible row is painted. `apply_changes` patches the affected rows for a
+    batch of store events. While inactive (window hidden) batches are dropped
+    and the model reloads once it is activated again.
+    """
+    IdRole = Qt.ItemDataRole.UserRole
+    NotificationRole = Qt.ItemDataRole.UserRole + 1
+
+    # Above this many changes in one batch a reset is cheaper than row moves
+    RESET_THRESHOLD = 200
+
+    def __init__(self, settings_manager, parent=None):
+        super().__init__(parent)
+        self.settings_manager = settings_manager
+        self._ids = []
+        self._keys = [] # sort key of each row, descending
+        self._key_of = {} # notif_id -> sort key it is filed under
+        self._active = True
+        self._stale = False
+
+    def reload(self):
+        self.beginResetModel()
+        notifications = sorted(self.settings_manager.get_notifications(), key=sort_key, reverse=True)
+        self._ids = [n["id"] for n in notifications]
+        self._keys = [sort_key(n) for n in notifications]
+        self._key_of = dict(zip(self._ids, self._keys))
+        self._stale = False
+        self.endResetModel()
+
+    def set_active(self, active):
+        self._active = active
+        if active and self._stale:
+            self.reload()
+
+    # Row bookkeeping; rows are ordered by descending key, newest first on ties
+    def _insert_position(self, key):
+        lo, hi = 0, len(self._keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._keys[mid] > key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def row_of(self, notif_id):
+        key = self._key_of.get(notif_id)
+        if key is None:
+            return -1
+        row = self._insert_position(key)
+        while row < len(self._ids) and self._keys[row] == key:
+            if self._ids[row] == notif_id:
+                return row
+            row += 1
+        return -1
+
+    def _insert(self, notif):
+        key = sort_key(notif)
+        row = self._insert_position(key)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.insert(row, notif["id"])
+        self._keys.insert(row, key)
+        self._key_of[notif["id"]] = key
+        self.endInsertRows()
+
+    def _remove(self, notif_id):
+        row = self.row_of(notif_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        del self._keys[row]
+        del self._key_of[notif_id]
+        self.endRemoveRows()
+
+    def _update(self, notif):
+        notif_id = notif["id"]
+        row = self.row_of(notif_id)
+        if row < 0:
+            self._insert(notif)
+        elif self._keys[row] == sort_key(notif):
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+        else:
+            # Edited or toggled: moves to its new place in the order
+            self._remove(notif_id)
+            self._insert(notif)
+
+    def apply_changes(self, changes):
+        """Patch rows for a batch of (event, notif_id) pairs from StoreEvents"""
+        if not self._active:
+            self._stale = True
+            return
+        if len(changes) > self.RESET_THRESHOLD or any(event == "reset" for event, _ in changes):
+            self.reload()
+            return
+        for event, notif_id in changes:
+            notif = self.settings_manager.get_notification(notif_id)
+            if event == "removed" or notif is None:
+                self._remove(notif_id)
+            elif event == "added":
+                self._insert(notif)
+            else:
+                self._update(notif)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._ids):
+            return None
+        notif_id = self._ids[index.row()]
+        if role == self.IdRole:
+            return notif_id
+        notif = self.settings_manager.get_notification(notif_id)
+        if notif is None:
+            return None
+        if role == self.NotificationRole:
+            return notif
+        if role == Qt.ItemDataRole.DisplayRole:
+            return notif.get("title", "")
+        return None
+
+
+class NotificationDelegate(QStyledItemDelegate):
+    """Paints a notification card (accent bar, emoji, title, details, toggle dot,
+    delete button) and maps clicks to its parts by hit-testing, so the list
+    needs no per-row widgets.
+    """
+    edit_requested = pyqtSignal(str)
+    toggle_requested = pyqtSignal(str)
+    delete_requested = pyqtSignal(str)
+
+    ROW_HEIGHT = 74
+    SPACING = 8
+    PADDING_H = 15
+
+    def __init__(self, details_text, parent=None):
+        super().__init__(parent)
+        # Callable notif -> "type • time • status" line, owned by the window
+        self.details_text = details_text
+        self.colors = styles.get_theme_colors()
+        self._hover = None # (row, part) under the mouse
+
+    def set_theme(self, theme):
+        self.colors = styles.get_theme_colors(theme)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.SPACING)
+
+    # Geometry
+    def _card_rect(self, rect):
+        return rect.adjusted(0, 0, 0, -self.SPACING)
+
+    def _layout(self, rect, notif):
+        """Rects of the card parts, shared by paint() and hit-testing"""
+        card = self._card_rect(rect)
+        cy = card.center().y()
+        x = card.left() + self.PADDING_H
+        parts = {"card": card}
+
+        parts["accent"] = QRect(x, cy - 20, 6, 40)
+        x += 6 + 15
+
+        if notif.get("icon") and notif.get("icon") != "DEFAULT":
+            parts["icon"] = QRect(x, cy - 18, 36, 36)
+            x += 36 + 5
+
+        right = card.right() - self.PADDING_H
+        parts["delete"] = QRect(right - 50, cy - 25, 50, 50)
+        parts["toggle"] = QRect(parts["delete"].left() - 10 - 28, cy - 14, 28, 28)
+        parts["text"] = QRect(x, card.top() + 12, parts["toggle"].left() - 15 - x, card.height() - 24)
+        return parts
+
+    def hit_test(self, rect, notif, pos):
+        parts = self._layout(rect, notif)
+        for part in ("toggle", "delete"):
+            if parts[part].contains(pos):
+                return part
+        return "card" if parts["card"].contains(pos) else None
+
+    # Painting
+    def paint(self, painter, option, index):
+        notif = index.data(NotificationListModel.NotificationRole)
+        if notif is None:
+            return
+        colors = self.colors
+        parts = self._layout(option.rect, notif)
+        hover_part = self._hover[1] if self._hover and self._hover[0] == index.row() else None
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        painter.setPen(QPen(QColor(colors["border"]), 1))
+        painter.setBrush(QColor(colors["surface"]))
+        painter.drawRoundedRect(QRectF(parts["card"]).adjusted(0.5, 0.5, -0.5, -0.5), 14, 14)
+
+        # Accent bar
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(ACCENT_COLORS.get(notif.get("type"), "#3B82F6")))
+        painter.drawRoundedRect(QRectF(parts["accent"]), 3, 3)
+
+        # Emoji
+        if "icon" in parts:
+            font = QFont(option.font)
+            font.setPixelSize(24)
+            painter.setFont(font)
+            painter.setPen(QColor(colors["text_main"]))
+            painter.drawText(parts["icon"], Qt.AlignmentFlag.AlignCenter, notif["icon"])
+
+        # Title and details
+        text_rect = parts["text"]
+        title_font = QFont(option.font)
+        title_font.setPixelSize(14)
+        title_font.setWeight(QFont.Weight.Bold)
+        details_font = QFont(option.font)
+        details_font.setPixelSize(12)
+        title_metrics = QFontMetrics(title_font)
+        details_metrics = QFontMetrics(details_font)
+        text_height = title_metrics.height() + 2 + details_metrics.height()
+        top = text_rect.top() + max(0, (text_rect.height() - text_height) // 2)
+
+        painter.setFont(title_font)
+        painter.setPen(QColor(colors["text_main"]))
+        title = title_metrics.elidedText(notif.get("title", ""), Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(QRect(text_rect.left(), top, text_rect.width(), title_metrics.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+
+        painter.setFont(details_font)
+        painter.setPen(QColor("#64748B"))
+        details = details_metrics.elidedText(self.details_text(notif), Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(QRect(text_rect.left(), top + title_metrics.height() + 2, text_rect.width(), details_metrics.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, details)
+
+        # Status toggle dot
+        status_color = QColor("#10B981" if notif.get("active") else "#94A3B8")
+        if hover_part == "toggle":
+            status_color = status_color.darker(110)
+        painter.setPen(QPen(QColor("white"), 2))
+        painter.setBrush(status_color)
+        painter.drawEllipse(QRectF(parts["toggle"]).adjusted(1, 1, -1, -1))
+
+        # Delete button
+        painter.setPen(QPen(QColor("white"), 2))
+        painter.setBrush(QColor("#FECACA" if hover_part == "delete" else "#FFFFFF"))
+        painter.drawRoundedRect(QRectF(parts["delete"]).adjusted(1, 1, -1, -1), 14, 14)
+        button_font = QFont(option.font)
+        button_font.setPixelSize(12)
+        button_font.setWeight(QFont.Weight.DemiBold)
+        painter.setFont(button_font)
+        painter.setPen(QColor("#B91C1C"))
+        painter.drawText(parts["delete"], Qt.AlignmentFlag.AlignCenter, translator.t("btn_delete_short"))
+
+        painter.restore()
+
+    # Interaction
+    def _set_hover(self, view, hover):
+        if hover == self._hover:
+            return
+        self._hover = hover
+        clickable = hover is not None and hover[1] in ("toggle", "delete", "card")
+        view.viewport().setCursor(Qt.CursorShape.PointingHandCursor if clickable else Qt.CursorShape.ArrowCursor)
+        view.viewport().update()
+
+    def editorEvent(self, event, model, option, index):
+        notif = index.data(NotificationListModel.NotificationRole)
+        if notif is None:
+            return False
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseMove:
+            part = self.hit_test(option.rect, notif, event.position().toPoint())
+            view = self.parent()
+            if view is not None:
+                self._set_hover(view, (index.row(), part) if part else None)
+            return False
+        if event_type == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            part = self.hit_test(option.rect, notif, event.position().toPoint())
+            notif_id = index.data(NotificationListModel.IdRole)
+            if part == "toggle":
+                self.toggle_requested.emit(notif_id)
+            elif part == "delete":
+                self.delete_requested.emit(notif_id)
+            elif part == "card":
+                self.edit_requested.emit(notif_id)
+            return part is not None
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        notif = index.data(NotificationListModel.NotificationRole)
+        if notif is None or event.type() != QEvent.Type.ToolTip:
+            return super().helpEvent(event, view, option, index)
+        part = self.hit_test(option.rect, notif, event.pos())
+        if part == "toggle":
+            QToolTip.showText(event.globalPos(), translator.t("btn_off") if notif.get("active") else translator.t("btn_on"), view)
+            return True
+        if part == "delete":
+            QToolTip.showText(event.globalPos(), translator.t("btn_delete"), view)
+            return True
+        QToolTip.hideText()
+        return True
+
+    def clear_hover(self, view):
+        self._set_hover(view, None)
+
+
+class NotificationListView(QListView):
+    """QListView set up for the painted cards: uniform rows, no selection, hover tracking"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+    def leaveEvent(self, event):
+        delegate = self.itemDelegate()
+        if isinstance(delegate, NotificationDelegate):
+            delegate.clear_hover(self)
+        super().leaveEvent(event)
@@ -1,15 +1,28 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QGraphicsDropShadowEffect, QScrollArea)
-from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QColor, QIcon
+from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPainter
+from i18n.translator import translator
 import ui.styles as styles
+from ui.popup_render import (MODE_EFFECT, MODE_NINEPATCH, MODE_NONE, FrameTimer,
+                             draw_ninepatch, render_policy, shadow_ninepatch)
 import os
 import sys
 
+WIDGETSIZE_MAX = (1 << 24) - 1 # QWIDGETSIZE_MAX
+
+DEFAULT_ICONS = {"danger": "🚨", "important": "🔥", "warning": "⚠️", "info": "ℹ️"}
+
 class NotificationPopup(QWidget):
-    def __init__(self, title, content, notif_type="info", icon=None, custom_color=None):
+    """Reminder popup window.
+
+    The widget tree is built once; `bind` fills it with a reminder, so a
+    closed popup can be shown again for the next one (see PopupPool).
+    """
+    closed = pyqtSignal(object)
+
+    def __init__(self, title=None, content="", notif_type="info", icon=None, custom_color=None, missed=1):
         super().__init__()
-        self.setWindowTitle(title)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
@@ -21,7 +34,6 @@ class NotificationPopup(QWidget):
         self.layout = QVBoxLayout(self)
         self.container = QWidget()
         self.container.setObjectName("PopupContainer")
-        self.container.setStyleSheet(styles.get_notification_popup_style(notif_type, custom_color))
         
         container_layout = QVBoxLayout(self.container)
         container_layout.setContentsMargins(20, 20, 20, 15)
@@ -36,29 +48,16 @@ class NotificationPopup(QWidget):
         else:
              icon_path = os.path.join(os.path.dirname(__file__), "images", "logo.png")
         
-        # Priority: Custom Icon > Logo File > Default Type Icon
-        use_custom_icon = icon and icon != "DEFAULT"
+        self.icon_label = QLabel()
         
-        if use_custom_icon:
-            icon_label = QLabel(icon)
-            icon_label.setStyleSheet("font-size: 32px;")
-        # elif os.path.exists(icon_path):
-        #     icon_label = QLabel()
-        #     pixmap = QIcon(icon_path).pixmap(32, 32)
-        #     icon_label.setPixmap(pixmap)
-        else:
-            icons = {"danger": "🚨", "important": "🔥", "warning": "⚠️", "info": "ℹ️"}
-            icon_label = QLabel(icons.get(notif_type, "ℹ️"))
-            icon_label.setStyleSheet("font-size: 24px;")
-        
-        title_label = QLabel(title)
-        title_label.setObjectName("TitleLabel")
-        title_label.setWordWrap(True)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        title_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        
-        header_layout.addWidget(icon_label)
-        header_layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("TitleLabel")
+        self.title_label.setWordWrap(True)
+        self.title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.title_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        
+        header_layout.addWidget(self.icon_label)
+        header_layout.addWidget(self.title_label)
         header_layout.addStretch()
         container_layout.addLayout(header_layout)
         
@@ -68,13 +67,13 @@ class NotificationPopup(QWidget):
         self.scroll.setStyleSheet("background: transparent; border: none;")
         self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         
-        content_label = QLabel(content)
-        content_label.setObjectName("ContentLabel")
-        content_label.setWordWrap(True)
-        content_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.content_label = QLabel()
+        self.content_label.setObjectName("ContentLabel")
+        self.content_label.setWordWrap(True)
+        self.content_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         
-        self.scroll.setWidget(content_label)
+        self.scroll.setWidget(self.content_label)
         container_layout.addWidget(self.scroll)
         
         # Bottom Button
@@ -87,38 +86,99 @@ class NotificationPopup(QWidget):
         btn_layout.addWidget(close_btn)
         container_layout.addLayout(btn_layout)
         
-        # Shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(30)
-        shadow.setXOffset(0)
-        shadow.setYOffset(10)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.container.setGraphicsEffect(shadow)
+        # Shadow: set per render mode in bind()
+        self.render_mode = None
         
         self.layout.addWidget(self.container)
-        
-        # Dynamic sizing
-        self.adjustSize()
-        width = min(self.width(), self.MAX_WIDTH)
-        height = min(self.height(), self.MAX_HEIGHT)
-        self.setFixedSize(width, height)
-        
-        self._set_position()
 
         # Animation
-        self.setWindowOpacity(0)
         self.animation = QPropertyAnimation(self, b"windowOpacity")
         self.animation.setDuration(400)
         self.animation.setStartValue(0)
         self.animation.setEndValue(1)
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.frame_timer = FrameTimer()
+        self.animation.valueChanged.connect(lambda _: self.frame_timer.tick())
+        self.animation.finished.connect(self._on_animation_finished)
+        
+        if title is not None:
+            self.bind(title, content, notif_type, icon, custom_color, missed)
 
-    def _set_position(self):
-        screen = self.screen().availableGeometry()
-        x = screen.width() - self.width() - 30
-        y = screen.height() - self.height() - 30
-        self.move(x, y)
+    def bind(self, title, content, notif_type="info", icon=None, custom_color=None, missed=1):
+        """Show a new reminder in this popup"""
+        self.setWindowTitle(title)
+        # Recycled popups often show the same type again: no re-polish then
+        styles.apply_style(self.container, styles.get_notification_popup_style(notif_type, custom_color))
+        
+        # Priority: Custom Icon > Default Type Icon
+        if icon and icon != "DEFAULT":
+            self.icon_label.setText(icon)
+            self.icon_label.setStyleSheet("font-size: 32px;")
+        else:
+            self.icon_label.setText(DEFAULT_ICONS.get(notif_type, "ℹ️"))
+            self.icon_label.setStyleSheet("font-size: 24px;")
+        
+        self.title_label.setText(title)
+        
+        # Occurrences coalesced while the machine was asleep
+        if missed > 1:
+            content = f"{translator.t('popup_missed_count').format(count=missed)}\n\n{content}"
+        self.content_label.setText(content)
+        self.scroll.verticalScrollBar().setValue(0)
+        
+        # Dynamic sizing (lift the previous reminder's fixed size first)
+        self.setMinimumSize(0, 0)
+        self.setMaximumSize(WIDGETSIZE_MAX, WIDGETSIZE_MAX)
+        self.adjustSize()
+        width = min(self.width(), self.MAX_WIDTH)
+        height = min(self.height(), self.MAX_HEIGHT)
+        self.setFixedSize(width, height)
+        
+        # Placed by the pool's PopupLayout, with the other visible popups
+        self._apply_render_mode()
+        self.setWindowOpacity(0 if self.render_mode != MODE_NONE else 1)
+
+    def _apply_render_mode(self):
+        mode = render_policy.mode
+        if mode == self.render_mode:
+            return
+        if mode == MODE_EFFECT:
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(30)
+            shadow.setXOffset(0)
+            shadow.setYOffset(10)
+            shadow.setColor(QColor(0, 0, 0, 50))
+            self.container.setGraphicsEffect(shadow)
+        elif self.render_mode == MODE_EFFECT:
+            self.container.setGraphicsEffect(None)
+        self.render_mode = mode
+        self.update()
+
+    def paintEvent(self, event):
+        if self.render_mode != MODE_NINEPATCH:
+            return
+        # Cached shadow drawn inside the layout margins, offset downwards like the effect
+        margins = self.layout.contentsMargins()
+        blur = max(1, min(margins.left(), margins.right(), margins.bottom()) - 1)
+        offset = blur // 3
+        radius = 20 # PopupContainer border-radius
+        target = self.container.geometry().adjusted(-blur, -blur + offset, blur, blur + offset)
+        painter = QPainter(self)
+        draw_ninepatch(painter, target, shadow_ninepatch(radius, blur), radius + blur)
+        painter.end()
 
     def show_animated(self):
         self.show()
+        self.animation.stop()
+        if self.render_mode == MODE_NONE:
+            return
+        self.frame_timer.start()
         self.animation.start()
+
+    def _on_animation_finished(self):
+        render_policy.record(self.render_mode, self.frame_timer.frames)
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        self.animation.stop()
+        self.closed.emit(self)
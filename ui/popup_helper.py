@@ -0,0 +1,79 @@
+"""Popup process started by the reminder daemon while it has popups to show.
+
+Reads reminders as JSON lines on stdin,
+    {"notif": {...}, "missed": 1, "due": "2026-01-19T20:21:40"}
+shows them through a PopupQueue, and writes "idle" on stdout whenever
+nothing is left on screen or waiting. Exits once stdin is closed and it is
+idle.
+
+    python -m ui.popup_helper [--language vi_VN]
+"""
+import json
+import sys
+import threading
+from datetime import datetime
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QApplication
+from i18n.translator import translator
+from services.clock import SystemClock
+from ui.popup_queue import PopupQueue
+
+
+class StdinReader(QObject):
+    """Reads stdin on a worker thread; the signals arrive on the GUI thread"""
+    line_received = pyqtSignal(str)
+    closed = pyqtSignal()
+
+    def start(self):
+        threading.Thread(target=self._run, name="StdinReader", daemon=True).start()
+
+    def _run(self):
+        for line in sys.stdin:
+            if line.strip():
+                self.line_received.emit(line)
+        self.closed.emit()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--language" in argv and argv.index("--language") + 1 < len(argv):
+        translator.set_language(argv[argv.index("--language") + 1])
+
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("Assistant")
+    app.setQuitOnLastWindowClosed(False)
+
+    popups = PopupQueue(SystemClock())
+    reader = StdinReader()
+    state = {"eof": False}
+
+    def on_line(line):
+        try:
+            message = json.loads(line)
+            due = datetime.fromisoformat(message["due"]) if message.get("due") else None
+            popups.show(message["notif"], message.get("missed", 1), due)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Bad popup request: {e}", file=sys.stderr)
+        if popups.is_idle(): # nothing new to show (duplicate or bad request)
+            on_idle()
+
+    def on_idle():
+        if state["eof"]:
+            app.quit()
+        else:
+            print("idle", flush=True)
+
+    def on_closed():
+        state["eof"] = True
+        if popups.is_idle():
+            app.quit()
+
+    reader.line_received.connect(on_line)
+    reader.closed.connect(on_closed)
+    popups.idle.connect(on_idle)
+    reader.start()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
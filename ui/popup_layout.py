@@ -0,0 +1,33 @@
+from PyQt6.QtGui import QGuiApplication
+
+
+class PopupLayout:
+    """Places visible popups so they don't cover each other.
+
+    Popups are stacked upwards from the bottom-right corner of their screen,
+    oldest at the bottom; when a column is full the next one starts to its
+    left.
+    """
+
+    def __init__(self, margin=30, spacing=12):
+        self.margin = margin
+        self.spacing = spacing
+
+    def reflow(self, popups):
+        columns = {} # screen -> [x right edge, y bottom edge, column width]
+        for popup in popups:
+            screen = popup.screen() or QGuiApplication.primaryScreen()
+            area = screen.availableGeometry()
+            column = columns.get(screen)
+            if column is None:
+                column = columns[screen] = [area.right() - self.margin, area.bottom() - self.margin, 0]
+            right, bottom, width = column
+
+            if bottom - popup.height() < area.top() + self.margin and width:
+                # Column full: start a new one to the left
+                right -= width + self.spacing
+                bottom = area.bottom() - self.margin
+                width = 0
+
+            popup.move(right - popup.width() + 1, bottom - popup.height() + 1)
+            columns[screen] = [right, bottom - popup.height() - self.spacing, max(width, popup.width())]
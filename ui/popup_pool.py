@@ -0,0 +1,90 @@
+from PyQt6.QtCore import QTimer
+from ui.popup_layout import PopupLayout
+
+
+class PopupPool:
+    """Recycles NotificationPopup windows.
+
+    `warm` popups are built ahead of time and kept hidden, so showing a
+    reminder only re-binds labels and a stylesheet. At most `max_visible`
+    popups are on screen; beyond that the oldest one is closed for the new
+    reminder. Closed popups go back to the pool, and surplus ones beyond
+    `warm` are deleted, so memory stays flat over long uptimes. Visible
+    popups are stacked by a PopupLayout.
+    """
+
+    def __init__(self, warm=2, max_visible=4, layout=None):
+        self.warm = warm
+        self.max_visible = max_visible
+        self.layout = layout or PopupLayout()
+        self._idle = []
+        self._visible = [] # oldest first
+        # Called with each popup the user closed (or that was closed to make room)
+        self.on_release = None
+
+    def prewarm(self, delay_ms=0):
+        """Build the warm popups once the event loop is idle, after `delay_ms`"""
+        QTimer.singleShot(delay_ms, self._fill)
+
+    def _fill(self):
+        while len(self._idle) < self.warm:
+            self._idle.append(self._create())
+
+    def _create(self):
+        from ui.notification_view import NotificationPopup # widgets and styles load with the first popup
+        popup = NotificationPopup()
+        popup.closed.connect(self.release)
+        return popup
+
+    def live_count(self):
+        return len(self._idle) + len(self._visible)
+
+    def visible(self):
+        return list(self._visible)
+
+    def acquire(self, title, content, notif_type="info", icon=None, custom_color=None, missed=1):
+        """A popup bound to the reminder and placed, ready for show_animated()"""
+        while len(self._visible) >= self.max_visible:
+            # Cap reached: the oldest reminder on screen is closed to make room, and goes through
+            # release() like one the user closed, so on_release sees it (the loop covers a new
+            # popup shown from on_release)
+            oldest = self._visible[0]
+            oldest.close()
+            if oldest in self._visible: # closed without the signal, e.g. never shown
+                self.release(oldest)
+        if self._idle:
+            popup = self._idle.pop()
+        else:
+            popup = self._create()
+        popup.bind(title, content, notif_type, icon, custom_color, missed)
+        self._visible.append(popup)
+        self.reflow()
+        return popup
+
+    def rebind(self, popup, title, content, notif_type="info", icon=None, custom_color=None, missed=1):
+        """Change what a visible popup shows, e.g. a growing digest"""
+        popup.bind(title, content, notif_type, icon, custom_color, missed)
+        popup.setWindowOpacity(1)
+        self.reflow()
+
+    def reflow(self):
+        self.layout.reflow(self._visible)
+
+    def release(self, popup):
+        if popup in self._visible:
+            self._visible.remove(popup)
+            self.reflow()
+        if popup in self._idle:
+            return
+        if len(self._idle) < self.warm:
+            self._idle.append(popup)
+        else:
+            popup.deleteLater()
+        if self.on_release is not None:
+            self.on_release(popup)
+
+    def clear(self):
+        for popup in self._idle + self._visible:
+            popup.deleteLater()
+        self._idle = []
+        self._visible = []
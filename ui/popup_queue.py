@@ -0,0 +1,175 @@
+import heapq
+import itertools
+from collections import Counter, deque
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from i18n.translator import translator
+from ui.popup_pool import PopupPool
+
+
+class PopupQueue(QObject):
+    """Shows reminder popups: most severe first, with per-type limits and a digest for bursts"""
+    # Nothing on screen and nothing waiting
+    idle = pyqtSignal()
+
+    # More than BURST_LIMIT reminders within BURST_WINDOW seconds go into one digest popup
+    BURST_LIMIT = 3
+    BURST_WINDOW = 2.0
+    # Entries listed in the digest popup; older ones are only counted
+    DIGEST_LINES = 50
+    # Display order of pending popups (lower first) and popups of each type on screen at once
+    SEVERITY = {"danger": 0, "important": 1, "warning": 2, "info": 3}
+    TYPE_LIMITS = {"danger": 4, "important": 2, "warning": 2, "info": 2}
+
+    def __init__(self, clock, prewarm_ms=0):
+        super().__init__()
+        self.clock = clock
+        # Pre-built popup windows, re-bound for each reminder; built `prewarm_ms` after start
+        self.popup_pool = PopupPool()
+        self.popup_pool.prewarm(prewarm_ms)
+        self.popup_pool.on_release = self._on_popup_closed
+        self._recent_popups = deque() # monotonic times of recent popups
+        self._digest = None
+        self._digest_entries = []
+        self._digest_ids = set()
+        self._digest_type = None
+        self._digest_refresh_pending = False
+
+        # Pending popups: heap of [severity, due, seq, notif, missed]
+        self._queue = []
+        self._queued_ids = set()
+        self._queue_seq = itertools.count()
+        self._showing = {} # notif id -> (popup, queue entry)
+        self._showing_types = Counter()
+
+    def is_idle(self):
+        return not self._showing and not self._queue and self._digest is None and not self._digest_entries
+
+    def show(self, notif, missed=1, due=None):
+        """Queue a popup for `notif`; the most severe, then earliest due, is shown first.
+
+        Returns False if it is already showing or waiting.
+        """
+        notif_id = notif.get("id")
+        if notif_id in self._showing or notif_id in self._queued_ids or notif_id in self._digest_ids:
+            return False
+
+        # Burst: fold into the digest popup instead of opening more windows.
+        # Danger reminders always get their own popup.
+        if notif.get("type") != "danger":
+            now = self.clock.monotonic()
+            recent = self._recent_popups
+            while recent and now - recent[0] > self.BURST_WINDOW:
+                recent.popleft()
+            if self._digest is not None or len(recent) >= self.BURST_LIMIT:
+                self._add_to_digest(notif, missed)
+                return True
+            recent.append(now)
+
+        entry = [self._severity(notif), due or self.clock.now(), next(self._queue_seq), notif, missed]
+        heapq.heappush(self._queue, entry)
+        self._queued_ids.add(notif_id)
+        self._show_pending()
+        return True
+
+    def _severity(self, notif):
+        return self.SEVERITY.get(notif.get("type"), self.SEVERITY["info"])
+
+    def _show_pending(self):
+        """Show queued popups while the screen and per-type limits allow"""
+        blocked = [] # entries whose type is at its limit; other types may still go
+        while self._queue:
+            entry = self._queue[0]
+            notif = entry[3]
+            notif_type = notif.get("type", "info")
+            if self._showing_types[notif_type] >= self.TYPE_LIMITS.get(notif_type, 1):
+                blocked.append(heapq.heappop(self._queue))
+                continue
+            # One slot on screen stays free for the digest popup
+            if len(self._showing) >= self.popup_pool.max_visible - 1 and not self._preempt_for(entry):
+                break
+            heapq.heappop(self._queue)
+            self._queued_ids.discard(notif.get("id"))
+            self._show(entry)
+        for entry in blocked:
+            heapq.heappush(self._queue, entry)
+
+    def _preempt_for(self, entry):
+        """Make room for a danger popup by sending the least severe one back to the queue"""
+        if entry[0] != self.SEVERITY["danger"]:
+            return False
+        victim_id, victim = None, None
+        for notif_id, (popup, shown) in self._showing.items():
+            if shown[0] > entry[0] and (victim is None or shown[:3] > victim[1][:3]):
+                victim_id, victim = notif_id, (popup, shown)
+        if victim is None:
+            return False
+        popup, shown = victim
+        self._forget(victim_id)
+        heapq.heappush(self._queue, shown)
+        self._queued_ids.add(victim_id)
+        popup.close()
+        return True
+
+    def _show(self, entry):
+        _, _, _, notif, missed = entry
+        popup = self.popup_pool.acquire(notif["title"], notif["content"], notif["type"], notif.get("icon"), notif.get("color"), missed)
+        self._showing[notif.get("id")] = (popup, entry)
+        self._showing_types[notif.get("type", "info")] += 1
+        popup.show_animated()
+
+    def _forget(self, notif_id):
+        popup, entry = self._showing.pop(notif_id)
+        self._showing_types[entry[3].get("type", "info")] -= 1
+        return popup
+
+    def _on_popup_closed(self, popup):
+        if popup is self._digest:
+            self._digest = None
+            self._digest_entries = []
+            self._digest_ids = set()
+            self._digest_type = None
+        else:
+            for notif_id, (shown_popup, _) in self._showing.items():
+                if shown_popup is popup:
+                    self._forget(notif_id)
+                    break
+            else:
+                return
+        self._show_pending()
+        if self.is_idle():
+            self.idle.emit()
+
+    def _add_to_digest(self, notif, missed):
+        self._digest_entries.append((notif, missed))
+        self._digest_ids.add(notif.get("id"))
+        # Styled after the most severe reminder in the digest
+        if self._digest_type is None or self._severity(notif) < self.SEVERITY.get(self._digest_type, 3):
+            self._digest_type = notif.get("type", "info")
+        # Re-render once per event-loop turn, however many entries a batch adds
+        if not self._digest_refresh_pending:
+            self._digest_refresh_pending = True
+            QTimer.singleShot(0, self._refresh_digest)
+
+    def _refresh_digest(self):
+        self._digest_refresh_pending = False
+        entries = self._digest_entries
+        if not entries:
+            return
+        lines = []
+        if len(entries) > self.DIGEST_LINES:
+            lines.append(f"… +{len(entries) - self.DIGEST_LINES}")
+        for entry, entry_missed in entries[-self.DIGEST_LINES:]:
+            line = f"• {entry['title']}"
+            summary = entry.get("content", "").strip().split("\n", 1)[0]
+            if summary:
+                line += f": {summary[:80]}"
+            if entry_missed > 1:
+                line += f" (×{entry_missed})"
+            lines.append(line)
+        title = translator.t("popup_digest_title").format(count=len(entries))
+
+        if self._digest is None:
+            self._digest = self.popup_pool.acquire(title, "\n".join(lines), self._digest_type)
+            self._digest.show_animated()
+        else:
+            self.popup_pool.rebind(self._digest, title, "\n".join(lines), self._digest_type)
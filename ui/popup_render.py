@@ -0,0 +1,122 @@
+import time
+from functools import lru_cache
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap
+
+# Popup rendering modes, most to least expensive
+MODE_EFFECT = "effect" # QGraphicsDropShadowEffect, re-rendered every animation frame
+MODE_NINEPATCH = "ninepatch" # cached pre-rasterised shadow, painted behind the container
+MODE_NONE = "none" # no shadow, no fade-in
+MODES = [MODE_EFFECT, MODE_NINEPATCH, MODE_NONE]
+
+
+@lru_cache(maxsize=16)
+def shadow_ninepatch(radius, blur, alpha=50):
+    """Shadow of a rounded rect as a (2*edge + 1)-px square pixmap, edge = radius + blur.
+
+    The corners are drawn as is and the one-pixel middle row/column is
+    stretched, so one small pixmap serves every popup size.
+    """
+    edge = radius + blur
+    size = 2 * edge + 1
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    # Approximate the blur with stacked translucent rounded rects; the
+    # per-layer opacity is chosen so the fully covered centre ends at `alpha`
+    layer_alpha = 1 - (1 - alpha / 255) ** (1 / blur)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, max(1, round(layer_alpha * 255))))
+    for inset in range(blur):
+        layer_radius = radius + blur - inset
+        painter.drawRoundedRect(inset, inset, size - 2 * inset, size - 2 * inset, layer_radius, layer_radius)
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+def draw_ninepatch(painter, target, pixmap, edge):
+    """Draw `pixmap` (from shadow_ninepatch) stretched over the QRect `target`"""
+    size = pixmap.width()
+    mid = size - 2 * edge
+    width = target.width() - 2 * edge
+    height = target.height() - 2 * edge
+    if width < 0 or height < 0:
+        return
+    xs = [(target.left(), 0, edge), (target.left() + edge, edge, width), (target.left() + edge + width, edge + mid, edge)]
+    ys = [(target.top(), 0, edge), (target.top() + edge, edge, height), (target.top() + edge + height, edge + mid, edge)]
+    src_widths = [edge, mid, edge]
+    for row, (y, sy, h) in enumerate(ys):
+        for col, (x, sx, w) in enumerate(xs):
+            if w and h:
+                painter.drawPixmap(QRect(x, y, w, h), pixmap, QRect(sx, sy, src_widths[col], src_widths[row]))
+
+
+class RenderPolicy:
+    """Picks the popup rendering mode.
+
+    With the "auto" setting popups start with the drop-shadow effect; when the
+    show animation misses the frame budget on `strikes` consecutive popups
+    the next cheaper mode is used. Frame hooks receive (mode, frame_ms) for
+    every finished show animation.
+    """
+
+    def __init__(self, budget_ms=1000 / 30, strikes=2):
+        self.budget_ms = budget_ms
+        self.strikes = strikes
+        self.auto = True
+        self.mode = MODE_EFFECT
+        self._misses = 0
+        self._frame_hooks = []
+
+    def configure(self, setting):
+        """"auto" or one of MODES"""
+        self.auto = setting not in MODES
+        self.mode = MODE_EFFECT if self.auto else setting
+        self._misses = 0
+
+    def add_frame_hook(self, callback):
+        self._frame_hooks.append(callback)
+
+    def remove_frame_hook(self, callback):
+        if callback in self._frame_hooks:
+            self._frame_hooks.remove(callback)
+
+    def record(self, mode, frame_ms):
+        """Frame intervals (ms) of one show animation rendered in `mode`"""
+        for callback in list(self._frame_hooks):
+            try:
+                callback(mode, frame_ms)
+            except Exception as e:
+                print(f"Error in frame hook: {e}")
+
+        if not self.auto or not frame_ms or mode != self.mode:
+            return
+        slow = sorted(frame_ms)[int(len(frame_ms) * 0.9)] > self.budget_ms
+        self._misses = self._misses + 1 if slow else 0
+        if self._misses >= self.strikes and self.mode != MODES[-1]:
+            self.mode = MODES[MODES.index(self.mode) + 1]
+            self._misses = 0
+            print(f"Popup animation over {self.budget_ms:.0f} ms/frame, switching to '{self.mode}' rendering")
+
+
+class FrameTimer:
+    """Collects the intervals between the frames of one animation"""
+
+    def __init__(self):
+        self.frames = []
+        self._last = None
+
+    def start(self):
+        self.frames = []
+        self._last = time.perf_counter()
+
+    def tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self.frames.append((now - self._last) * 1000)
+        self._last = now
+
+
+render_policy = RenderPolicy()
@@ -1,226 +1,197 @@
+from functools import lru_cache
+from string import Template
 
-def get_main_style(theme="default"):
-    if theme == "pink":
-        primary = "#FB7185"    # Rose 400
-        primary_hover = "#F43F5E" # Rose 500
-        bg = "#FFF1F2"        # Rose 50
-        surface = "#FFFFFF"
-        text_main = "#881337"  # Rose 900
-        text_sub = "#E11D48"   # Rose 600
-        border = "#FECDD3"     # Rose 200
-        input_bg = "#FFFFFF"
-    else:
-        primary = "#6366F1"    # Indigo 500
-        primary_hover = "#4F46E5" # Indigo 600
-        bg = "#F8FAFC"        # Slate 50
-        surface = "#FFFFFF"
-        text_main = "#1E293B"  # Slate 800
-        text_sub = "#64748B"   # Slate 500
-        border = "#E2E8F0"     # Slate 200
-        input_bg = "#FFFFFF"
-
-    return f"""
-    QMainWindow, QDialog {{
-        background-color: {bg};
-    }}
+# Stylesheets are $-templates compiled once; results are cached per theme / popup colour
+MAIN_STYLE_TEMPLATE = Template("""
+    QMainWindow, QDialog {
+        background-color: ${bg};
+    }
     
-    QLabel {{
-        color: {text_main};
+    QLabel {
+        color: ${text_main};
         font-family: 'Segoe UI', 'Inter', system-ui, -apple-system, sans-serif;
-    }}
+    }
     
-    QPushButton {{
-        background-color: {primary};
+    QPushButton {
+        background-color: ${primary};
         color: white;
         border-radius: 10px;
         padding: 10px 20px;
         font-size: 13px;
         font-weight: 600;
         border: none;
-    }}
+    }
     
-    QPushButton:hover {{
-        background-color: {primary_hover};
-    }}
+    QPushButton:hover {
+        background-color: ${primary_hover};
+    }
 
     /* Tab Widget Styling */
-    QTabWidget::pane {{
+    QTabWidget::pane {
         border: none;
         background: transparent;
         margin-top: 10px;
-    }}
+    }
     
-    QTabBar::tab {{
+    QTabBar::tab {
         background: transparent;
-        color: {text_sub};
+        color: ${text_sub};
         padding: 12px 24px;
         font-weight: 600;
         font-size: 14px;
         border-bottom: 2px solid transparent;
-    }}
+    }
     
-    QTabBar::tab:selected {{
-        color: {primary};
-        border-bottom: 2px solid {primary};
-    }}
+    QTabBar::tab:selected {
+        color: ${primary};
+        border-bottom: 2px solid ${primary};
+    }
 
     /* Card styling */
-    QWidget#NotificationCard {{
-        background-color: {surface};
-        border-radius: 14px;
-        border: 1px solid {border};
-    }}
-    
-    QListWidget {{
+    QListView {
         background: transparent;
         border: none;
         outline: none;
         padding: 5px;
-    }}
-
-    QListWidget::item {{
-        background: transparent;
-        border: none;
-        margin-bottom: 8px;
-    }}
+    }
 
-    QLineEdit, QDateTimeEdit, QComboBox, QSpinBox, QTextEdit, QTimeEdit {{
+    QLineEdit, QDateTimeEdit, QComboBox, QSpinBox, QTextEdit, QTimeEdit {
         padding: 10px 12px;
         border-radius: 10px;
-        border: 1px solid {border};
-        background-color: {input_bg};
-        color: {text_main};
+        border: 1px solid ${border};
+        background-color: ${input_bg};
+        color: ${text_main};
         font-size: 13px;
         min-height: 20px;
-    }}
+    }
     
-    QLineEdit:focus, QDateTimeEdit:focus, QComboBox:focus, QSpinBox:focus {{
-        border: 2px solid {primary};
-    }}
+    QLineEdit:focus, QDateTimeEdit:focus, QComboBox:focus, QSpinBox:focus {
+        border: 2px solid ${primary};
+    }
 
     /* Modern ComboBox Styling */
-    QComboBox::drop-down {{
+    QComboBox::drop-down {
         border: none;
         width: 30px;
         subcontrol-position: right center;
-    }}
-    QComboBox::down-arrow {{
+    }
+    QComboBox::down-arrow {
         image: url('ui/images/down-arrow.png');  /* DuyHere: Đổi thành url('path/to/icon.png') nếu muốn dùng icon */
         width: 24px;     /* DuyHere: Kích thước mũi tên */
         height: 24px;
         border: 0px solid #fff;  /* DuyHere: Màu mũi tên */
         padding-right: 5px;
-    }}
-    QComboBox:hover::down-arrow {{
-        border-top-color: {primary};
-    }}
+    }
+    QComboBox:hover::down-arrow {
+        border-top-color: ${primary};
+    }
     
-    QComboBox QAbstractItemView {{
-        border: 1px solid {border};
+    QComboBox QAbstractItemView {
+        border: 1px solid ${border};
         border-radius: 8px;
-        background-color: {surface};
-        selection-background-color: {bg};
-        selection-color: {primary};
+        background-color: ${surface};
+        selection-background-color: ${bg};
+        selection-color: ${primary};
         outline: none;
         padding: 5px;
-    }}
+    }
 
     /* Modern SpinBox Styling */
-    QSpinBox::up-button, QDateTimeEdit::up-button, QTimeEdit::up-button {{
+    QSpinBox::up-button, QDateTimeEdit::up-button, QTimeEdit::up-button {
         subcontrol-origin: border;
         subcontrol-position: top right;
         width: 28px;
-        background: {bg};
-        border-left: 1px solid {border};
+        background: ${bg};
+        border-left: 1px solid ${border};
         border-top-right-radius: 10px;
-    }}
-    QSpinBox::down-button, QDateTimeEdit::down-button, QTimeEdit::down-button {{
+    }
+    QSpinBox::down-button, QDateTimeEdit::down-button, QTimeEdit::down-button {
         subcontrol-origin: border;
         subcontrol-position: bottom right;
         width: 28px;
-        background: {bg};
-        border-left: 1px solid {border};
+        background: ${bg};
+        border-left: 1px solid ${border};
         border-bottom-right-radius: 10px;
-    }}
+    }
     
-    QSpinBox::up-button:hover, QDateTimeEdit::up-button:hover, QTimeEdit::up-button:hover {{
-        background: {border};
-    }}
-    QSpinBox::down-button:hover, QDateTimeEdit::down-button:hover, QTimeEdit::down-button:hover {{
-        background: {border};
-    }}
+    QSpinBox::up-button:hover, QDateTimeEdit::up-button:hover, QTimeEdit::up-button:hover {
+        background: ${border};
+    }
+    QSpinBox::down-button:hover, QDateTimeEdit::down-button:hover, QTimeEdit::down-button:hover {
+        background: ${border};
+    }
     
-    QSpinBox::up-arrow, QDateTimeEdit::up-arrow, QTimeEdit::up-arrow {{
+    QSpinBox::up-arrow, QDateTimeEdit::up-arrow, QTimeEdit::up-arrow {
         image: url('ui/images/up.png');  /* DuyHere: Đổi thành url('path/to/icon.png') nếu muốn dùng icon */
         width: 24px;     /* DuyHere: Kích thước icon giảm */
         height: 24px;
         border-bottom: 0px solid #fff;  /* DuyHere: Màu mũi tên tăng */
-    }}
-    QSpinBox::up-arrow:hover, QDateTimeEdit::up-arrow:hover, QTimeEdit::up-arrow:hover {{
-        border-bottom-color: {primary};
-    }}
+    }
+    QSpinBox::up-arrow:hover, QDateTimeEdit::up-arrow:hover, QTimeEdit::up-arrow:hover {
+        border-bottom-color: ${primary};
+    }
     
-    QSpinBox::down-arrow, QDateTimeEdit::down-arrow, QTimeEdit::down-arrow {{
+    QSpinBox::down-arrow, QDateTimeEdit::down-arrow, QTimeEdit::down-arrow {
         image: url('ui/images/down.png');  /* DuyHere: Đổi thành url('path/to/icon.png') nếu muốn dùng icon */
         width: 24px;     /* DuyHere: Kích thước icon giảm */
         height: 24px;
         border-top: 0px solid #fff;  /* DuyHere: Màu mũi tên giảm */
-    }}
-    QSpinBox::down-arrow:hover, QDateTimeEdit::down-arrow:hover, QTimeEdit::down-arrow:hover {{
-        border-top-color: {primary};
-    }}
+    }
+    QSpinBox::down-arrow:hover, QDateTimeEdit::down-arrow:hover, QTimeEdit::down-arrow:hover {
+        border-top-color: ${primary};
+    }
 
 
-    QDateTimeEdit {{
+    QDateTimeEdit {
         padding-right: 28px;
-    }}
+    }
 
-    QDateTimeEdit::drop-down {{
+    QDateTimeEdit::drop-down {
         subcontrol-origin: padding;
         subcontrol-position: top right;
         width: 24px;
         border: none;
         padding-right: 5px;
         background: transparent;
-    }}
+    }
 
-    QDateTimeEdit::down-arrow {{
+    QDateTimeEdit::down-arrow {
         image: url('ui/images/down-arrow.png');  /* DuyHere: Đổi thành url('path/to/icon.png') nếu muốn dùng icon */
         width: 24px;     /* DuyHere: Kích thước icon giảm */
         height: 24px;
         border-top: 0px solid #fff;  /* DuyHere: Màu mũi tên giảm */
-    }}
-    QCalendarWidget QToolButton {{
+    }
+    QCalendarWidget QToolButton {
         background: transparent;
-    }}
+    }
 
-    QCalendarWidget QAbstractItemView:enabled:selected {{
+    QCalendarWidget QAbstractItemView:enabled:selected {
         background-color: #3B82F6;
         color: black;
         border-radius: 6px;
-    }}
-    QCalendarWidget QWidget#qt_calendar_navigationbar {{
+    }
+    QCalendarWidget QWidget#qt_calendar_navigationbar {
     min-height: 36px;
     background: #2563EB;
-    }}
+    }
 
-    QCalendarWidget QSpinBox {{
+    QCalendarWidget QSpinBox {
     min-width: 70px;
     padding: 4px 6px;
     background: white;
-    }}
+    }
 
     QCalendarWidget QSpinBox::up-button,
-    QCalendarWidget QSpinBox::down-button {{
+    QCalendarWidget QSpinBox::down-button {
         subcontrol-origin: border;
         width: 14px;
-    }}
+    }
 
 
 
     /* Floating Action Button */
-    QPushButton#FloatingAddBtn {{
-        background-color: {primary};
+    QPushButton#FloatingAddBtn {
+        background-color: ${primary};
         color: white;
         font-size: 32px;
         font-weight: normal;
@@ -229,41 +200,119 @@ def get_main_style(theme="default"):
         margin: 0px;
         text-align: center;
         line-height: 56px; /* Match height for vertical centering if possible */
-    }}
-    QPushButton#FloatingAddBtn:hover {{
-        background-color: {primary_hover};
-    }}
+    }
+    QPushButton#FloatingAddBtn:hover {
+        background-color: ${primary_hover};
+    }
 
-    QCheckBox {{
+    QCheckBox {
         spacing: 8px;
-        color: {text_main};
+        color: ${text_main};
         font-weight: 500;
-    }}
+    }
 
     /* Global Modern ScrollBar */
-    QScrollBar:vertical {{
+    QScrollBar:vertical {
         border: none;
         background: transparent;
         width: 8px;
         margin: 0px;
-    }}
-    QScrollBar::handle:vertical {{
-        background: {border};
+    }
+    QScrollBar::handle:vertical {
+        background: ${border};
         min-height: 30px;
         border-radius: 4px;
-    }}
-    QScrollBar::handle:vertical:hover {{
-        background: {text_sub};
-    }}
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    }
+    QScrollBar::handle:vertical:hover {
+        background: ${text_sub};
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
         height: 0px;
-    }}
-    QScrollBar:horizontal {{
+    }
+    QScrollBar:horizontal {
         height: 0px;
-    }}
-    """
+    }
+    """)
 
-def get_notification_popup_style(notif_type="info", custom_color=None):
+POPUP_STYLE_TEMPLATE = Template("""
+    QWidget#PopupContainer {
+        background-color: ${bg};
+        border: 1px solid ${border};
+        border-radius: 20px;
+    }
+    
+    QLabel#TitleLabel {
+        font-size: 16px;
+        font-weight: 700;
+        color: ${text};
+    }
+    
+    QLabel#ContentLabel {
+        font-size: 13px;
+        color: ${text};
+        line-height: 1.4;
+    }
+    
+    QPushButton#CloseBtn {
+        background-color: ${accent};
+        color: ${btn_text};
+        border-radius: 10px;
+        font-weight: 600;
+        padding: 5px 15px;
+    }
+
+    /* Popup Specific ScrollBar */
+    QScrollBar:vertical {
+        border: none;
+        background: transparent;
+        width: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: ${accent}40;
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: ${accent}80;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    """)
+
+
+def get_theme_colors(theme="default"):
+    """Palette shared by the stylesheet and the custom-painted notification list"""
+    if theme == "pink":
+        return {
+            "primary": "#FB7185",    # Rose 400
+            "primary_hover": "#F43F5E", # Rose 500
+            "bg": "#FFF1F2",        # Rose 50
+            "surface": "#FFFFFF",
+            "text_main": "#881337",  # Rose 900
+            "text_sub": "#E11D48",   # Rose 600
+            "border": "#FECDD3",     # Rose 200
+            "input_bg": "#FFFFFF",
+        }
+    return {
+        "primary": "#6366F1",    # Indigo 500
+        "primary_hover": "#4F46E5", # Indigo 600
+        "bg": "#F8FAFC",        # Slate 50
+        "surface": "#FFFFFF",
+        "text_main": "#1E293B",  # Slate 800
+        "text_sub": "#64748B",   # Slate 500
+        "border": "#E2E8F0",     # Slate 200
+        "input_bg": "#FFFFFF",
+    }
+
+@lru_cache(maxsize=8)
+def get_main_style(theme="default"):
+    return MAIN_STYLE_TEMPLATE.substitute(get_theme_colors(theme))
+
+@lru_cache(maxsize=64)
+def get_popup_colors(notif_type="info", custom_color=None):
+    """Colour scheme of a popup; the colour maths runs once per distinct colour"""
     if custom_color:
         # Custom color logic
         # format: #RRGGBB
@@ -318,50 +367,13 @@ def get_notification_popup_style(notif_type="info", custom_color=None):
             "info": {"bg": "rgba(239, 246, 255, 0.85)", "border": "#DBEAFE", "accent": "#3B82F6", "text": "rgba(30, 58, 138, 0.9)", "btn_text": "white"}
         }
         s = schemes.get(notif_type, schemes["info"])
-    
-    return f"""
-    QWidget#PopupContainer {{
-        background-color: {s["bg"]};
-        border: 1px solid {s["border"]};
-        border-radius: 20px;
-    }}
-    
-    QLabel#TitleLabel {{
-        font-size: 16px;
-        font-weight: 700;
-        color: {s["text"]};
-    }}
-    
-    QLabel#ContentLabel {{
-        font-size: 13px;
-        color: {s["text"]};
-        line-height: 1.4;
-    }}
-    
-    QPushButton#CloseBtn {{
-        background-color: {s["accent"]};
-        color: {s["btn_text"]};
-        border-radius: 10px;
-        font-weight: 600;
-        padding: 5px 15px;
-    }}
+    return s
 
-    /* Popup Specific ScrollBar */
-    QScrollBar:vertical {{
-        border: none;
-        background: transparent;
-        width: 6px;
-        margin: 0px;
-    }}
-    QScrollBar::handle:vertical {{
-        background: {s["accent"]}40;
-        min-height: 20px;
-        border-radius: 3px;
-    }}
-    QScrollBar::handle:vertical:hover {{
-        background: {s["accent"]}80;
-    }}
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-        height: 0px;
-    }}
-    """
+@lru_cache(maxsize=64)
+def get_notification_popup_style(notif_type="info", custom_color=None):
+    return POPUP_STYLE_TEMPLATE.substitute(get_popup_colors(notif_type, custom_color))
+
+def apply_style(widget, sheet):
+    """Set a stylesheet, skipping Qt's re-polish when it is already applied"""
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)